@@ -0,0 +1,367 @@
+'''
+    archive.py
+
+    10/18/2026  Single-archive output
+
+    With an archive sink the frames of a session are not saved as one
+    file each but appended to one ZIP or TAR file in the save folder,
+    PREFIX-YYYYmmdd-HHMMSS.zip (.tar, -N added when the name is taken,
+    an archive is never overwritten). On a network share or a volume
+    an antivirus scans, creating and closing a small file costs more
+    than encoding it; one archive is a single stream of large
+    sequential writes.
+
+        zip : stored, the frames are compressed already; each local
+              header holds the CRC and the sizes up front (no data
+              descriptor), the central directory (zip64 when needed)
+              is written by close()
+        tar : pax members one after the other, the end blocks are
+              written by close()
+
+    Writes go through a buffer_mb buffer that is flushed every flush_s
+    seconds, so a crash loses at most the last seconds. What is on disk
+    stays readable: any tar tool reads a tar without its end blocks, and
+    list/extract below walk the zip's local headers when the central
+    directory is missing. repair writes the missing end in place.
+
+        python archive.py list cap-20261018-140500.zip
+        python archive.py extract cap-20261018-140500.zip --to pages
+        python archive.py repair cap-20261018-140500.zip
+'''
+import os
+import sys
+import time
+import zlib
+import struct
+import tarfile
+import zipfile
+import argparse
+import threading
+
+import grab
+
+output_list = ['files', 'zip', 'tar']
+
+zip64_limit = 0xffffffff     # offsets and counts past this need zip64 records
+max_member  = 0xffffffff     # the local header holds 32 bit sizes
+local_sig, central_sig, end_sig = 0x04034b50, 0x02014b50, 0x06054b50
+zip64_end_sig, zip64_locator_sig = 0x06064b50, 0x07064b50
+utf8_flag = 0x800
+
+def dos_time(t):
+    y, mo, d, h, mi, s = time.localtime(t)[:6]
+    if y < 1980:
+        return 0, (1 << 5) | 1
+    return (h << 11) | (mi << 5) | (s//2), ((y-1980) << 9) | (mo << 5) | d
+
+def from_dos_time(dtime, ddate):
+    return time.mktime(((ddate >> 9)+1980, (ddate >> 5) & 15, ddate & 31,
+                        dtime >> 11, (dtime >> 5) & 63, (dtime & 31)*2, 0, 0, -1))
+
+class Member:
+    '''One file in an archive: where its bytes are and what they should be.'''
+    def __init__(self, name, header, offset, size, t, crc=None, method=0):
+        self.name = name
+        self.header = header    # offset of its header
+        self.offset = offset    # offset of its data
+        self.size = size        # stored bytes
+        self.t = t
+        self.crc = crc
+        self.method = method    # zip: 0 stored, 8 deflated
+
+class ArchiveSink:
+    '''
+        write(name, data) appends one file, from any thread. resume is
+        (members, end) of a scan: the archive is cut at end and close()
+        writes the end for those members (repair).
+    '''
+    ext = ''
+
+    def __init__(self, path, buffer_mb=4, flush_s=2.0, resume=None):
+        self.path = path
+        self.flush_s = flush_s
+        self.count = 0
+        self.nbytes = 0
+        self.flushes = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+        buffering = int(buffer_mb*1024*1024)
+        if resume is None:
+            # never over an archive the index may point into
+            self.f = open(path, 'xb', buffering=buffering)
+        else:
+            members, end = resume
+            self.f = open(path, 'r+b', buffering=buffering)
+            self.f.seek(end)
+            self.f.truncate()
+            for m in members:
+                self._resume(m)
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def write(self, name, data, t=None):
+        '''Appends data as name; returns len(data).'''
+        with self.lock:
+            if self.f is None:
+                raise IOError("Archive is closed: %s"%self.path)
+            self._append(name, data, time.time() if t is None else t)
+            self.count += 1
+            self.nbytes += len(data)
+            self.dirty = True
+        return len(data)
+
+    def _flush_loop(self):
+        # a frame waits in the buffer flush_s at most, also when no
+        # other frame comes after it
+        while not self._stop.wait(self.flush_s):
+            with self.lock:
+                if self.f is not None and self.dirty:
+                    self.f.flush()
+                    self.flushes += 1
+                    self.dirty = False
+
+    def close(self):
+        self._stop.set()
+        self._flusher.join()
+        with self.lock:
+            if self.f is None:
+                return
+            self._finish()
+            self.f.close()
+            self.f = None
+
+    def __str__(self):
+        return "%s: %d files, %s, %d flushes"%(os.path.basename(self.path), self.count,
+                                               grab.format_bytes(self.nbytes), self.flushes)
+
+class ZipSink(ArchiveSink):
+    ext = 'zip'
+
+    def __init__(self, path, buffer_mb=4, flush_s=2.0, resume=None):
+        self.members = []       # (name bytes, crc, size, header offset, dos time, dos date)
+        super(ZipSink, self).__init__(path, buffer_mb, flush_s, resume)
+
+    def _resume(self, m):
+        if m.method != 0:
+            raise ValueError("%s: only stored entries can be kept"%m.name)
+        self.members.append((m.name.encode('utf-8'), m.crc, m.size, m.header)+dos_time(m.t))
+
+    def _append(self, name, data, t):
+        if len(data) >= max_member:
+            raise ValueError("%s: 4 GB or more in one file"%name)
+        raw = name.encode('utf-8')
+        crc = zlib.crc32(data)
+        dtime, ddate = dos_time(t)
+        header = self.f.tell()
+        self.f.write(struct.pack('<I5H3I2H', local_sig, 20, utf8_flag, 0, dtime, ddate,
+                                 crc, len(data), len(data), len(raw), 0) + raw)
+        self.f.write(data)
+        self.members.append((raw, crc, len(data), header, dtime, ddate))
+
+    def _finish(self):
+        start = self.f.tell()
+        for raw, crc, size, header, dtime, ddate in self.members:
+            extra = b''
+            if header >= zip64_limit:
+                extra = struct.pack('<HHQ', 1, 8, header)
+                header = 0xffffffff     # in the zip64 extra field
+            version = 45 if extra else 20
+            self.f.write(struct.pack('<I6H3I5H2I', central_sig, version, version, utf8_flag, 0,
+                                     dtime, ddate, crc, size, size, len(raw), len(extra),
+                                     0, 0, 0, 0, header) + raw + extra)
+        end = self.f.tell()
+        count, size = len(self.members), end-start
+        if count >= 0xffff or start >= zip64_limit or size >= zip64_limit:
+            self.f.write(struct.pack('<IQ2H2I4Q', zip64_end_sig, 44, 45, 45, 0, 0,
+                                     count, count, size, start))
+            self.f.write(struct.pack('<IIQI', zip64_locator_sig, 0, end, 1))
+            count, size, start = min(count, 0xffff), min(size, 0xffffffff), 0xffffffff
+        self.f.write(struct.pack('<I4H2IH', end_sig, 0, 0, count, count, size, start, 0))
+
+class TarSink(ArchiveSink):
+    ext = 'tar'
+
+    def _resume(self, m):
+        pass
+
+    def _append(self, name, data, t):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(t)     # a float would need a pax header per frame
+        info.mode = 0o644
+        self.f.write(info.tobuf(tarfile.PAX_FORMAT, 'utf-8', 'surrogateescape'))
+        self.f.write(data)
+        pad = -len(data) % tarfile.BLOCKSIZE
+        if pad:
+            self.f.write(tarfile.NUL*pad)
+
+    def _finish(self):
+        # two zero blocks, then up to a full record like tarfile does
+        self.f.write(tarfile.NUL*(2*tarfile.BLOCKSIZE))
+        pad = -self.f.tell() % tarfile.RECORDSIZE
+        if pad:
+            self.f.write(tarfile.NUL*pad)
+
+sink_types = {'zip': ZipSink, 'tar': TarSink}
+
+def create(kind, prefix, folder=None, **options):
+    '''
+        The sink of one session, PREFIX-YYYYmmdd-HHMMSS.ext in folder, or
+        PREFIX-YYYYmmdd-HHMMSS-N.ext when a session of the same second has it.
+    '''
+    stamp = "%s-%s"%(prefix, time.strftime('%Y%m%d-%H%M%S'))
+    n = 0
+    while True:
+        name = "%s.%s"%(stamp, kind) if n == 0 else "%s-%d.%s"%(stamp, n, kind)
+        try:
+            return sink_types[kind](os.path.join(folder or os.getcwd(), name), **options)
+        except FileExistsError:
+            n += 1
+
+# --- reading -----------------------------------------------------------------
+
+def scan_zip(f, size):
+    '''Members found by walking the local headers, and the end of the last one.'''
+    f.seek(0)
+    members, end = [], 0
+    while True:
+        head = f.read(30)
+        if len(head) < 30:
+            break
+        (sig, version, flags, method, dtime, ddate, crc, csize, usize,
+         nlen, xlen) = struct.unpack('<I5H3I2H', head)
+        # sizes after the data (a data descriptor) cannot be walked
+        if sig != local_sig or flags & 8:
+            break
+        name = f.read(nlen).decode('utf-8' if flags & utf8_flag else 'cp437')
+        offset = end+30+nlen+xlen
+        if offset+csize > size:
+            break
+        members.append(Member(name, end, offset, csize, from_dos_time(dtime, ddate), crc, method))
+        end = offset+csize
+        f.seek(end)
+    return members, end
+
+def read_zip(f, size):
+    try:
+        z = zipfile.ZipFile(f)
+    except zipfile.BadZipFile:
+        members, end = scan_zip(f, size)
+        return members, end, False
+    members = []
+    for info in z.infolist():
+        f.seek(info.header_offset)
+        nlen, xlen = struct.unpack('<2H', f.read(30)[26:30])
+        members.append(Member(info.filename, info.header_offset,
+                              info.header_offset+30+nlen+xlen, info.compress_size,
+                              time.mktime(info.date_time+(0, 0, -1)), info.CRC,
+                              info.compress_type))
+    return members, size, True
+
+def read_tar(f, size):
+    members, end, complete = [], 0, False
+    f.seek(0)
+    try:
+        with tarfile.open(fileobj=f, mode='r:') as tar:
+            for m in tar:
+                if m.offset_data+m.size > size:
+                    break
+                if m.isfile():
+                    members.append(Member(m.name, m.offset, m.offset_data, m.size, m.mtime))
+                end = m.offset_data + -(-m.size//tarfile.BLOCKSIZE)*tarfile.BLOCKSIZE
+            else:
+                complete = size-end >= 2*tarfile.BLOCKSIZE
+    except tarfile.ReadError:
+        pass
+    return members, end, complete
+
+def read(path):
+    '''(members, end of the last complete one, complete) of an archive.'''
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        if f.read(4) == struct.pack('<I', local_sig) or path.lower().endswith('.zip'):
+            return read_zip(f, size)
+        return read_tar(f, size)
+
+def extract_member(f, m):
+    f.seek(m.offset)
+    data = f.read(m.size)
+    if m.method == 8:
+        data = zlib.decompress(data, -15)
+    elif m.method != 0:
+        raise ValueError("%s: compression %d is not supported"%(m.name, m.method))
+    if m.crc is not None and zlib.crc32(data) != m.crc:
+        raise ValueError("%s: CRC mismatch"%m.name)
+    return data
+
+def extract(path, folder=None, on_error=None):
+    '''Writes every member into folder; returns the number written.'''
+    folder = folder or os.getcwd()
+    members, end, complete = read(path)
+    count = 0
+    with open(path, 'rb') as f:
+        for m in members:
+            # never outside folder, whatever the archive says
+            target = os.path.join(folder, os.path.basename(m.name))
+            try:
+                data = extract_member(f, m)
+            except (ValueError, zlib.error) as e:
+                if on_error:
+                    on_error(str(e))
+                continue
+            grab.write_file(target, data)
+            os.utime(target, (m.t, m.t))
+            count += 1
+    return count
+
+def repair(path):
+    '''
+        Cuts an archive after its last complete file and writes the end.
+        Returns (files kept, bytes cut), None if it was complete.
+    '''
+    members, end, complete = read(path)
+    if complete:
+        return None
+    cut = os.path.getsize(path)-end
+    kind = 'zip' if path.lower().endswith('.zip') else 'tar'
+    sink_types[kind](path, resume=(members, end)).close()
+    return len(members), cut
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="List, extract or repair a capture archive")
+    ap.add_argument('command', choices=['list', 'extract', 'repair'])
+    ap.add_argument('archive', help=".zip or .tar written with --output")
+    ap.add_argument('--to', metavar='FOLDER', help="extract here (current folder)")
+    args = ap.parse_args(argv)
+
+    try:
+        members, end, complete = read(args.archive)
+        if args.command == 'list':
+            for m in members:
+                print("%10d  %s  %s"%(m.size, time.strftime('%Y-%m-%d %H:%M:%S',
+                                                           time.localtime(m.t)), m.name))
+            print("Archive ... %d files, %s%s"%(len(members), grab.format_bytes(sum(m.size for m in members)),
+                                                "" if complete else ", no end: cut short, found by a scan"))
+        elif args.command == 'extract':
+            if args.to and not os.path.isdir(args.to):
+                os.makedirs(args.to)
+            errors = []
+            count = extract(args.archive, args.to, errors.append)
+            for e in errors:
+                print("Error ... %s"%e, file=sys.stderr)
+            print("Extract ... %d of %d files"%(count, len(members)))
+            return 1 if errors else 0
+        else:
+            fixed = repair(args.archive)
+            if fixed is None:
+                print("Repair ... %s is complete"%args.archive)
+            else:
+                print("Repair ... %s: %d files kept, %d bytes cut"%((args.archive,)+fixed))
+    except (IOError, ValueError) as e:
+        print("Error ... %s"%e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
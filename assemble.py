@@ -0,0 +1,251 @@
+'''
+    assemble.py
+
+    10/18/2026  Post-capture assembly into a PDF and contact sheets
+
+    Turns the frames of a capture folder into one PDF (a page per
+    frame) and/or contact sheets (cols x rows thumbnails per JPEG):
+
+        python assemble.py --prefix cap --pdf book.pdf
+        python assemble.py D:/captures --prefix cap --pdf book.pdf --crop 40,80,1240,1680 --max-size 1600
+        python assemble.py --prefix cap --sheets --cols 5 --rows 6
+
+    Frames are decoded, cropped, downscaled and JPEG recompressed by a
+    process pool, and only a window of a few pages per worker is ever
+    in flight. The PDF is written page by page as the results come
+    back in order (each page is an image XObject holding the JPEG as
+    is, DCTDecode); a contact sheet is the only full image the main
+    process holds. Memory is bounded by the window, not the page count.
+
+    The frames are found by one directory scan, or with --indexed
+    only the ones the folder's index (manifest.py) has, without a scan.
+    Frames saved into a session archive are not read from it; extract
+    them first (python archive.py extract).
+'''
+import os
+import re
+import sys
+import time
+import argparse
+from collections import deque
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import lazy
+import encoders
+import manifest
+
+PIL = lazy.module('PIL', 'PIL.Image')
+
+frame_exts = tuple(sorted(set(e.ext for e in encoders.encoder_class)))
+
+def frame_files(folder, prefix, indexed=False):
+    '''Frame file names of prefix in number order.'''
+    if indexed:
+        m = manifest.Manifest(folder)
+        numbers = sorted(n for (p, n), e in m.entries.items() if p == prefix and 'archive' not in e
+                         and e['file'].rsplit('.', 1)[-1] in frame_exts)
+        return [m.entries[(prefix, n)]['file'] for n in numbers]
+    pattern = re.compile(r'^%s-(\d+)\.(%s)$'%(re.escape(prefix), '|'.join(frame_exts)))
+    found = []
+    with os.scandir(folder) as it:
+        for e in it:
+            mt = pattern.match(e.name)
+            if mt:
+                found.append((int(mt.group(1)), e.name))
+    return [name for n, name in sorted(found)]
+
+def prepare(im, crop=None, max_size=None):
+    if crop:
+        im = im.crop(crop)
+    if max_size and max(im.size) > max_size:
+        im.thumbnail((max_size, max_size), PIL.Image.LANCZOS)
+    if im.mode not in ('RGB', 'L'):
+        im = im.convert('RGB')
+    return im
+
+def page_job(path, crop, max_size, quality):
+    # runs in a worker process: (mode, size, jpeg bytes)
+    with PIL.Image.open(path) as im:
+        im = prepare(im, crop, max_size)
+        return im.mode, im.size, encoders.JpegEncoder(quality).encode(im)
+
+def thumb_job(path, crop, size):
+    # runs in a worker process: (size, raw RGB bytes) of one tile
+    with PIL.Image.open(path) as im:
+        im = prepare(im, crop, size)
+        if im.mode != 'RGB':
+            im = im.convert('RGB')
+        return im.size, im.tobytes()
+
+def bounded_map(pool, fn, items, window, *args):
+    '''pool.map in order with at most window results in flight.'''
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+class PdfWriter:
+    '''One JPEG image per page, written as it comes; xref at close().'''
+    def __init__(self, path, dpi=150):
+        self.f = open(path, 'wb')
+        self.dpi = dpi
+        self.offsets = {}
+        self.pages = []
+        self.next_id = 3        # 1: catalog, 2: page tree (written last)
+        self.f.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self._object(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+
+    def _object(self, n, body, stream=None):
+        self.offsets[n] = self.f.tell()
+        self.f.write(b'%d 0 obj\n'%n + body)
+        if stream is not None:
+            self.f.write(b'\nstream\n' + stream + b'\nendstream')
+        self.f.write(b'\nendobj\n')
+
+    def add_page(self, mode, size, jpeg):
+        w, h = size
+        pw, ph = w*72.0/self.dpi, h*72.0/self.dpi
+        page, content, image = self.next_id, self.next_id+1, self.next_id+2
+        self.next_id += 3
+        space = b'/DeviceGray' if mode == 'L' else b'/DeviceRGB'
+        self._object(image, b'<< /Type /XObject /Subtype /Image /Width %d /Height %d '
+                            b'/ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode '
+                            b'/Length %d >>'%(w, h, space, len(jpeg)), jpeg)
+        draw = b'q %.2f 0 0 %.2f 0 0 cm /Im0 Do Q'%(pw, ph)
+        self._object(content, b'<< /Length %d >>'%len(draw), draw)
+        self._object(page, b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] '
+                           b'/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R >>'%(
+                           pw, ph, image, content))
+        self.pages.append(page)
+
+    def close(self):
+        kids = b' '.join(b'%d 0 R'%p for p in self.pages)
+        self._object(2, b'<< /Type /Pages /Kids [%s] /Count %d >>'%(kids, len(self.pages)))
+        xref = self.f.tell()
+        n = self.next_id
+        self.f.write(b'xref\n0 %d\n0000000000 65535 f \n'%n)
+        for i in range(1, n):
+            self.f.write(b'%010d 00000 n \n'%self.offsets[i])
+        self.f.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'%(n, xref))
+        self.f.close()
+
+class SheetWriter:
+    '''cols x rows tiles per sheet, each sheet saved when it is full.'''
+    def __init__(self, prefix, cols=4, rows=5, tile=320, quality=85, pad=8):
+        self.prefix = prefix
+        self.cols = cols
+        self.rows = rows
+        self.tile = tile
+        self.quality = quality
+        self.pad = pad
+        self.sheet = None
+        self.count = 0
+        self.files = []
+
+    def add(self, size, raw):
+        k = self.count % (self.cols*self.rows)
+        if k == 0:
+            self.sheet = PIL.Image.new('RGB', (self.cols*(self.tile+self.pad)+self.pad,
+                                              self.rows*(self.tile+self.pad)+self.pad), 'white')
+        col, row = k % self.cols, k // self.cols
+        x = self.pad + col*(self.tile+self.pad) + (self.tile-size[0])//2
+        y = self.pad + row*(self.tile+self.pad) + (self.tile-size[1])//2
+        self.sheet.paste(PIL.Image.frombytes('RGB', size, raw), (x, y))
+        self.count += 1
+        if self.count % (self.cols*self.rows) == 0:
+            self._save()
+
+    def _save(self):
+        name = "%s-sheet-%03d.jpg"%(self.prefix, len(self.files))
+        with open(name, 'wb') as f:
+            f.write(encoders.JpegEncoder(self.quality).encode(self.sheet))
+        self.files.append(name)
+        self.sheet = None
+
+    def close(self):
+        if self.sheet is not None:
+            self._save()
+
+def assemble(folder=None, prefix='cap', pdf=None, sheets=False, crop=None, max_size=None,
+             quality=80, dpi=150, cols=4, rows=5, tile=320, workers=None,
+             indexed=False, window=None, on_progress=None):
+    '''
+        Writes pdf (a file name) and/or the contact sheets of the
+        frames of prefix in folder. Returns (frames, output files).
+        on_progress(done, total) is called after every frame.
+    '''
+    folder = folder or os.getcwd()
+    files = [os.path.join(folder, f) for f in frame_files(folder, prefix, indexed)]
+    if not files:
+        raise LookupError("No %s frames in %s"%(prefix, folder))
+    workers = workers or os.cpu_count() or 1
+    window = window or 2*workers
+    outputs = []
+    # spawned: the GUI runs this on a thread of a Qt process, no fork
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        if pdf:
+            w = PdfWriter(pdf, dpi)
+            try:
+                for i, page in enumerate(bounded_map(pool, page_job, files, window,
+                                                     crop, max_size, quality)):
+                    w.add_page(*page)
+                    if on_progress:
+                        on_progress(i+1, len(files))
+            finally:
+                w.close()
+            outputs.append(pdf)
+        if sheets:
+            s = SheetWriter(os.path.join(folder, prefix), cols, rows, tile)
+            for i, (size, raw) in enumerate(bounded_map(pool, thumb_job, files, window,
+                                                        crop, tile)):
+                s.add(size, raw)
+                if on_progress:
+                    on_progress(i+1, len(files))
+            s.close()
+            outputs += s.files
+    return len(files), outputs
+
+def parse_box(s):
+    box = tuple(int(v) for v in s.split(','))
+    if len(box) != 4:
+        raise argparse.ArgumentTypeError("expected left,top,right,bottom")
+    return box
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Assemble captured frames into a PDF or contact sheets")
+    ap.add_argument('folder', nargs='?', help="capture folder (current folder)")
+    ap.add_argument('--prefix', default='cap')
+    ap.add_argument('--pdf', metavar='FILE', help="write one page per frame")
+    ap.add_argument('--sheets', action='store_true', help="write PREFIX-sheet-NNN.jpg")
+    ap.add_argument('--crop', type=parse_box, metavar='L,T,R,B', help="crop every frame first")
+    ap.add_argument('--max-size', type=int, help="downscale to this many pixels on the long side")
+    ap.add_argument('--quality', type=int, default=80, help="PDF page JPEG quality")
+    ap.add_argument('--dpi', type=float, default=150, help="PDF page size from pixels")
+    ap.add_argument('--cols', type=int, default=4)
+    ap.add_argument('--rows', type=int, default=5)
+    ap.add_argument('--tile', type=int, default=320, help="thumbnail size in pixels")
+    ap.add_argument('--workers', type=int, help="processes (all cores)")
+    ap.add_argument('--indexed', action='store_true',
+                    help="only the frames in the folder's index, no directory scan")
+    args = ap.parse_args(argv)
+    if not args.pdf and not args.sheets:
+        ap.error("nothing to do: --pdf and/or --sheets")
+
+    t0 = time.monotonic()
+    try:
+        frames, outputs = assemble(args.folder, args.prefix, args.pdf, args.sheets,
+                                   args.crop, args.max_size, args.quality, args.dpi,
+                                   args.cols, args.rows, args.tile, args.workers,
+                                   args.indexed)
+    except (LookupError, IOError) as e:
+        print("Error ... %s"%e, file=sys.stderr)
+        return 1
+    print("Assemble ... %d frames in %.1f s: %s"%(frames, time.monotonic()-t0, ", ".join(outputs)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
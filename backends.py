@@ -0,0 +1,384 @@
+'''
+    backends.py
+
+    10/18/2026  Pluggable capture backends
+
+    Every grab goes through a Backend: grab(left, top, right, bottom)
+    returns an RGB PIL image of that screen rectangle, grab_frame() a
+    frame.Frame over the backend's own pixel buffer (no copy where the
+    backend has one).
+
+        pyautogui : pyautogui.screenshot(region=...), always there
+        mss       : the mss package (GDI/Quartz/XGetImage underneath)
+        xshm      : X11 MIT-SHM grab through ctypes, Linux only; the
+                    server copies pixels into a shared segment that is
+                    reused as long as the region size stays the same
+        synthetic : in-process frames, no display needed (benchmarks)
+
+    probe() times the screen backends on the target rectangle and
+    select() picks the fastest one unless the user named one.
+'''
+import sys
+import time
+import threading
+import ctypes
+import ctypes.util
+
+import lazy
+import frame
+
+np  = lazy.module('numpy')
+PIL = lazy.module('PIL', 'PIL.Image')
+
+class Backend:
+    name = ''
+    screen = True   # False: frames do not come from the display
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def grab(self, left, top, right, bottom):
+        raise NotImplementedError
+
+    def grab_frame(self, left, top, right, bottom):
+        # only a PIL image to start from: one copy into the frame
+        return frame.Frame.from_image(self.grab(left, top, right, bottom),
+                                      (left, top, right, bottom))
+
+    def close(self):
+        pass
+
+class PyAutoGuiBackend(Backend):
+    name = 'pyautogui'
+
+    @classmethod
+    def available(cls):
+        try:
+            import pyautogui
+        except Exception:
+            return False
+        return True
+
+    def grab(self, left, top, right, bottom):
+        import pyautogui
+        return pyautogui.screenshot(region=(left, top, right-left, bottom-top))
+
+class MssBackend(Backend):
+    name = 'mss'
+
+    @classmethod
+    def available(cls):
+        try:
+            import mss
+        except ImportError:
+            return False
+        return True
+
+    def __init__(self):
+        # mss handles are bound to the thread that opened them; all of
+        # them are kept so close() gets the other threads' too
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles = []
+        self._generation = 0
+
+    def shot(self, left, top, right, bottom):
+        sct = getattr(self._local, 'sct', None)
+        if sct is None or self._local.generation != self._generation:
+            import mss
+            sct = mss.mss()
+            with self._lock:
+                self._handles.append(sct)
+                self._local.sct, self._local.generation = sct, self._generation
+        return sct.grab({'left': left, 'top': top,
+                         'width': right-left, 'height': bottom-top})
+
+    def grab(self, left, top, right, bottom):
+        shot = self.shot(left, top, right, bottom)
+        return PIL.Image.frombuffer('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+
+    def grab_frame(self, left, top, right, bottom):
+        # a view of the screenshot's own bytearray
+        shot = self.shot(left, top, right, bottom)
+        w, h = shot.size
+        px = np.frombuffer(shot.raw, np.uint8).reshape(h, w, 4)
+        return frame.Frame(px, 'BGRX', (left, top, right, bottom))
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+            # a thread that grabs again opens a new one
+            self._generation += 1
+        for sct in handles:
+            try:
+                sct.close()
+            except Exception:
+                pass    # its thread is gone
+        self._local.sct = None
+
+# --- X11 MIT-SHM -----------------------------------------------------------
+
+class XImage(ctypes.Structure):
+    _fields_ = [('width'           , ctypes.c_int),
+                ('height'          , ctypes.c_int),
+                ('xoffset'         , ctypes.c_int),
+                ('format'          , ctypes.c_int),
+                ('data'            , ctypes.c_void_p),
+                ('byte_order'      , ctypes.c_int),
+                ('bitmap_unit'     , ctypes.c_int),
+                ('bitmap_bit_order', ctypes.c_int),
+                ('bitmap_pad'      , ctypes.c_int),
+                ('depth'           , ctypes.c_int),
+                ('bytes_per_line'  , ctypes.c_int),
+                ('bits_per_pixel'  , ctypes.c_int),
+                ('red_mask'        , ctypes.c_ulong),
+                ('green_mask'      , ctypes.c_ulong),
+                ('blue_mask'       , ctypes.c_ulong)]
+
+class XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [('shmseg'  , ctypes.c_ulong),
+                ('shmid'   , ctypes.c_int),
+                ('shmaddr' , ctypes.c_void_p),
+                ('readOnly', ctypes.c_int)]
+
+ZPixmap    = 2
+AllPlanes  = 0xffffffff
+IPC_PRIVATE= 0
+IPC_CREAT  = 0o1000
+IPC_RMID   = 0
+
+def _load_xlib():
+    x11 = ctypes.util.find_library('X11')
+    xext = ctypes.util.find_library('Xext')
+    if not x11 or not xext:
+        return None
+    x11 = ctypes.CDLL(x11)
+    xext = ctypes.CDLL(xext)
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+    x11.XOpenDisplay.restype = ctypes.c_void_p
+    x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+    x11.XRootWindow.restype = ctypes.c_ulong
+    x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDefaultVisual.restype = ctypes.c_void_p
+    x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+    xext.XShmCreateImage.restype = ctypes.POINTER(XImage)
+    xext.XShmCreateImage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint,
+                                     ctypes.c_int, ctypes.c_void_p,
+                                     ctypes.POINTER(XShmSegmentInfo),
+                                     ctypes.c_uint, ctypes.c_uint]
+    xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+    xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+    xext.XShmGetImage.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XImage),
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+    libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+    libc.shmat.restype = ctypes.c_void_p
+    libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+    libc.shmdt.argtypes = [ctypes.c_void_p]
+    libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+    libc.free.argtypes = [ctypes.c_void_p]
+    return x11, xext, libc
+
+class XShmBackend(Backend):
+    name = 'xshm'
+
+    @classmethod
+    def available(cls):
+        if not sys.platform.startswith('linux'):
+            return False
+        try:
+            b = cls()
+        except Exception:
+            return False
+        b.close()
+        return True
+
+    def __init__(self):
+        libs = _load_xlib()
+        if libs is None:
+            raise OSError("libX11/libXext not found")
+        self.x11, self.xext, self.libc = libs
+        self.display = self.x11.XOpenDisplay(None)
+        if not self.display:
+            raise OSError("Can not open X display")
+        if not self.xext.XShmQueryExtension(self.display):
+            self.x11.XCloseDisplay(self.display)
+            raise OSError("X server has no MIT-SHM")
+        screen = self.x11.XDefaultScreen(self.display)
+        self.root = self.x11.XRootWindow(self.display, screen)
+        self.visual = self.x11.XDefaultVisual(self.display, screen)
+        self.depth = self.x11.XDefaultDepth(self.display, screen)
+        self.image = None
+        self.info = XShmSegmentInfo()
+        self.size = None
+        self._lock = threading.Lock()
+
+    def _alloc(self, width, height):
+        self._free()
+        image = self.xext.XShmCreateImage(self.display, self.visual, self.depth,
+                                          ZPixmap, None, ctypes.byref(self.info),
+                                          width, height)
+        if not image:
+            raise OSError("XShmCreateImage failed")
+        nbytes = image.contents.bytes_per_line*height
+        self.info.shmid = self.libc.shmget(IPC_PRIVATE, nbytes, IPC_CREAT|0o600)
+        if self.info.shmid < 0:
+            raise OSError(ctypes.get_errno(), "shmget failed")
+        self.info.shmaddr = self.libc.shmat(self.info.shmid, None, 0)
+        image.contents.data = self.info.shmaddr
+        self.info.readOnly = 0
+        self.xext.XShmAttach(self.display, ctypes.byref(self.info))
+        self.x11.XSync(self.display, 0)
+        # the segment goes away by itself once both sides detach
+        self.libc.shmctl(self.info.shmid, IPC_RMID, None)
+        self.image = image
+        self.size = (width, height)
+
+    def _free(self):
+        if self.image is None:
+            return
+        self.xext.XShmDetach(self.display, ctypes.byref(self.info))
+        self.x11.XSync(self.display, 0)
+        self.libc.shmdt(self.info.shmaddr)
+        # XDestroyImage would free() the shm address; the struct is all that is left
+        self.libc.free(ctypes.cast(self.image, ctypes.c_void_p))
+        self.image = None
+        self.size = None
+
+    def read(self, left, top, right, bottom):
+        # the segment is reused by the next grab: the bytes are copied out
+        width, height = right-left, bottom-top
+        with self._lock:
+            if self.size != (width, height):
+                self._alloc(width, height)
+            if not self.xext.XShmGetImage(self.display, self.root, self.image,
+                                          left, top, AllPlanes):
+                raise OSError("XShmGetImage failed")
+            ximage = self.image.contents
+            data = ctypes.string_at(ximage.data, ximage.bytes_per_line*height)
+        return data, ximage.bytes_per_line
+
+    def grab(self, left, top, right, bottom):
+        data, stride = self.read(left, top, right, bottom)
+        return PIL.Image.frombuffer('RGB', (right-left, bottom-top), data, 'raw', 'BGRX',
+                                    stride, 1)
+
+    def grab_frame(self, left, top, right, bottom):
+        data, stride = self.read(left, top, right, bottom)
+        width, height = right-left, bottom-top
+        px = np.frombuffer(data, np.uint8).reshape(height, stride//4, 4)[:, :width]
+        return frame.Frame(px, 'BGRX', (left, top, right, bottom))
+
+    def close(self):
+        with self._lock:
+            if self.display:
+                self._free()
+                self.x11.XCloseDisplay(self.display)
+                self.display = None
+
+# --- synthetic ---------------------------------------------------------------
+
+class SyntheticBackend(Backend):
+    '''
+        Document-like pages made in memory: white paper with rows of
+        dark "words". The page turns every frames_per_page grabs (or on
+        next_page()), so settle/dedupe see real changes. One sheet is
+        rendered per size; pages are shifted copies of it, so a grab
+        costs about one memcpy like a real backend.
+    '''
+    name = 'synthetic'
+    screen = False
+
+    def __init__(self, frames_per_page=1, seed=0):
+        self.frames_per_page = frames_per_page
+        self.seed = seed
+        self.page = 0
+        self.count = 0
+        self._cache = {}
+
+    def next_page(self):
+        self.page += 1
+
+    def render(self, width, height):
+        rng = np.random.default_rng(self.seed)
+        px = np.full((height, width, 3), 250, dtype=np.uint8)
+        line, glyph = 18, 9
+        for y in range(24, height-line, line):
+            x = 32
+            while x < width-48:
+                n = int(rng.integers(2, 10))*glyph
+                ink = rng.random((12, n)) < 0.45
+                block = px[y:y+12, x:x+n]
+                block[ink[:block.shape[0], :block.shape[1]]] = (30, 30, 40)
+                x += n+glyph
+        return px
+
+    def pixels(self, left, top, right, bottom):
+        width, height = right-left, bottom-top
+        if self.frames_per_page and self.count and self.count%self.frames_per_page == 0:
+            self.page += 1
+        self.count += 1
+        key = (width, height)
+        if key not in self._cache:
+            self._cache = {key: self.render(width, height)}
+        shift = (self.page*126%height, self.page*54%width)
+        return np.roll(self._cache[key], shift, axis=(0, 1))
+
+    def grab(self, left, top, right, bottom):
+        return PIL.Image.fromarray(self.pixels(left, top, right, bottom))
+
+    def grab_frame(self, left, top, right, bottom):
+        return frame.Frame(self.pixels(left, top, right, bottom), 'RGB',
+                           (left, top, right, bottom))
+
+backend_list = [PyAutoGuiBackend, MssBackend, XShmBackend, SyntheticBackend]
+
+def available_backends():
+    return [b for b in backend_list if b.available()]
+
+def create(name):
+    for b in backend_list:
+        if b.name == name:
+            return b()
+    raise ValueError("Unknown capture backend: %s"%name)
+
+def probe(rect, rounds=5, names=None):
+    '''
+        Median grab ms of each available screen backend on rect.
+        Backends that fail are left out.
+    '''
+    result = {}
+    for cls in available_backends():
+        if not cls.screen or (names and cls.name not in names):
+            continue
+        try:
+            b = cls()
+            b.grab(*rect)  # warm up: first call opens handles
+            times = []
+            for i in range(rounds):
+                t0 = time.perf_counter()
+                b.grab(*rect)
+                times.append((time.perf_counter()-t0)*1000)
+            b.close()
+        except Exception:
+            continue
+        result[cls.name] = sorted(times)[len(times)//2]
+    return result
+
+def select(rect, name='auto', rounds=5):
+    '''
+        Returns (backend, probe result). With name other than 'auto'
+        the probe is skipped and that backend is used.
+    '''
+    if name != 'auto':
+        return create(name), {}
+    timing = probe(rect, rounds)
+    if not timing:
+        return PyAutoGuiBackend(), timing
+    return create(min(timing, key=timing.get)), timing
@@ -0,0 +1,237 @@
+'''
+    bench.py
+
+    10/18/2026  Headless benchmark of the capture pipeline
+
+    Runs the same grab -> encode -> write path the capture callbacks
+    use (grab.grab_window + pipeline.WriterPool) against the synthetic
+    backend and a fake window, so it needs no display. Each
+    size/encoder/workers case runs in its own process so its peak RSS
+    is its own.
+
+        python bench.py
+        python bench.py --sizes 1920x1080 --workers 1,4 --frames 50
+        python bench.py --out new.json --compare old.json
+        python bench.py --sizes 3840x2160 --pools threads,processes,shards
+
+    --compare exits with 1 if any case lost more than --tolerance of
+    its captures/sec or grew its p95 latency by more than that.
+'''
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import platform
+import argparse
+import subprocess
+
+import grab
+import frame
+import backends
+import pipeline
+import procpool
+import encoders
+
+size_list = ['1280x720', '1920x1080', '3840x2160']
+pool_list = ['threads', 'processes', 'shards']
+
+class FakeWindow:
+    '''Stands in for wintrack.WindowTracker: fixed rect, nothing to activate.'''
+    def __init__(self, width, height, left=0, top=0):
+        self.rect = (left, top, left+width, top+height)
+        self.generation = 1
+
+    def geometry(self):
+        return self.rect
+
+    def activate(self):
+        pass
+
+def parse_size(s):
+    w, h = s.lower().split('x')
+    return int(w), int(h)
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values)-1, int(round(p/100.0*(len(values)-1))))]
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return rss/1024.0/1024.0 if sys.platform == 'darwin' else rss/1024.0
+    try:
+        import ctypes
+        from ctypes import wintypes
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+        pmc = PROCESS_MEMORY_COUNTERS()
+        pmc.cb = ctypes.sizeof(pmc)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(pmc), pmc.cb)
+        return pmc.PeakWorkingSetSize/1024.0/1024.0
+    except Exception:
+        return None
+
+def run_case(size, encoder, workers, frames, queue_mb=256, pool='threads'):
+    width, height = parse_size(size)
+    grab.use_backend(backends.SyntheticBackend())
+    win = FakeWindow(width, height)
+    folder = tempfile.mkdtemp(prefix='capbench-')
+
+    started = {}
+    latency = []
+    errors = []
+    def saved(report):
+        latency.append((time.perf_counter()-started.pop(report.file))*1000)
+
+    enc = encoders.create(encoder)
+    kind = pool
+    if kind == 'threads':
+        pool = pipeline.WriterPool(workers, queue_mb, 'block',
+                                   on_saved=saved, on_error=errors.append, encoder=enc)
+    else:
+        # rss below is this process only, not the workers
+        pool = procpool.ProcessWriterPool(workers, queue_mb, 'block', on_saved=saved,
+                                          on_error=errors.append, encoder=enc,
+                                          shard=kind == 'shards')
+    frame.stats.reset()
+    t0 = time.perf_counter()
+    for n in range(frames):
+        file = "bench-%05d.%s"%(n, enc.ext)
+        started[file] = time.perf_counter()
+        im, grab_ms, legacy, rect = grab.grab_window(win)
+        pool.submit(im, os.path.join(folder, file), grab_ms, legacy)
+    pool.close()
+    seconds = time.perf_counter()-t0
+    shutil.rmtree(folder, ignore_errors=True)
+    allocations, copied = frame.stats.per_frame()
+
+    return dict(size        = size,
+                encoder     = encoder,
+                workers     = workers,
+                pool        = kind,
+                frames      = pool.written,
+                errors      = len(errors),
+                seconds     = round(seconds, 4),
+                fps         = round(pool.written/seconds, 3) if seconds else 0.0,
+                p50_ms      = round(percentile(latency, 50), 3),
+                p95_ms      = round(percentile(latency, 95), 3),
+                p99_ms      = round(percentile(latency, 99), 3),
+                bytes       = pool.bytes_written,
+                encode_ms   = round(pool.mean_encode_ms, 3),
+                copies      = round(allocations, 2),
+                copied_mb   = round(copied/1024.0/1024.0, 3),
+                peak_rss_mb = peak_rss_mb())
+
+def run_isolated(case):
+    cmd = [sys.executable, os.path.abspath(__file__), '--case', json.dumps(case)]
+    out = subprocess.run(cmd, stdout=subprocess.PIPE, check=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    return json.loads(out.stdout.decode().strip().splitlines()[-1])
+
+def case_key(r):
+    return (r['size'], r['encoder'], r['workers'], r.get('pool', 'threads'))
+
+def compare(old, new, tolerance=0.10):
+    '''Print new against old; returns the number of regressions.'''
+    before = dict((case_key(r), r) for r in old['results'])
+    regressions = 0
+    for r in new['results']:
+        b = before.get(case_key(r))
+        if b is None:
+            continue
+        fps = r['fps']/b['fps']-1 if b['fps'] else 0.0
+        p95 = r['p95_ms']/b['p95_ms']-1 if b['p95_ms'] else 0.0
+        bad = fps < -tolerance or p95 > tolerance
+        regressions += bad
+        print("%-10s %-13s %2d %-9s  fps %+6.1f%%  p95 %+6.1f%%  %s"%(
+              r['size'], r['encoder'], r['workers'], r.get('pool', 'threads'), fps*100, p95*100,
+              "REGRESSION" if bad else "ok"))
+    return regressions
+
+def print_header():
+    print("%-10s %-13s %7s %-9s %8s %8s %8s %8s %10s %8s %9s"%(
+          'size', 'enc', 'workers', 'pool', 'fps', 'p50 ms', 'p95 ms', 'p99 ms', 'MB', 'rss MB',
+          'copy MB/f'))
+
+def print_row(r):
+    print("%-10s %-13s %7d %-9s %8.2f %8.1f %8.1f %8.1f %10.1f %8s %9s"%(
+          r['size'], r['encoder'], r['workers'], r.get('pool', 'threads'), r['fps'], r['p50_ms'],
+          r['p95_ms'], r['p99_ms'], r['bytes']/1024.0/1024.0,
+          "%.0f"%r['peak_rss_mb'] if r['peak_rss_mb'] else '-',
+          "%.1f"%r['copied_mb'] if 'copied_mb' in r else '-'))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless capture pipeline benchmark")
+    ap.add_argument('--sizes', default=','.join(size_list))
+    ap.add_argument('--encoders', default='png,qoi,jpeg')
+    ap.add_argument('--workers', default='1,2,4')
+    ap.add_argument('--pools', default='threads', help="of %s"%','.join(pool_list))
+    ap.add_argument('--frames', type=int, default=30)
+    ap.add_argument('--queue-mb', type=float, default=256)
+    ap.add_argument('--out', default='bench.json')
+    ap.add_argument('--compare', help="earlier --out file to check against")
+    ap.add_argument('--tolerance', type=float, default=0.10)
+    ap.add_argument('--inline', action='store_true', help="run all cases in this process")
+    ap.add_argument('--case', help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(**json.loads(args.case))))
+        return 0
+
+    for e in args.encoders.split(','):
+        if e not in encoders.encoder_list:
+            ap.error("unknown encoder: %s"%e)
+    for p in args.pools.split(','):
+        if p not in pool_list:
+            ap.error("unknown pool: %s"%p)
+
+    results = []
+    print_header()
+    for size in args.sizes.split(','):
+        for encoder in args.encoders.split(','):
+            for workers in args.workers.split(','):
+                for pool in args.pools.split(','):
+                    case = dict(size=size, encoder=encoder, workers=int(workers),
+                                frames=args.frames, queue_mb=args.queue_mb, pool=pool)
+                    results.append(run_case(**case) if args.inline else run_isolated(case))
+                    print_row(results[-1])
+
+    report = dict(meta=dict(time     = time.strftime('%Y-%m-%dT%H:%M:%S'),
+                            python   = platform.python_version(),
+                            platform = platform.platform(),
+                            cpus     = os.cpu_count(),
+                            frames   = args.frames),
+                  results=results)
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    print("Results ... %s"%args.out)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        if compare(old, report, args.tolerance):
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,31 @@
     12/20/2023  Initial version
     05/11/2024  Auto capture added
     06/28/2024  Mouse capture added with ChatGPT
+    10/18/2026  In-memory region grab (grab.py), no temp PNG
+    10/18/2026  Background encode/write pool (pipeline.py)
+    10/18/2026  Skip duplicate frames, auto stop at the last page (dedupe.py)
+    10/18/2026  Adaptive settle wait instead of sleep(0.4) (settle.py)
+    10/18/2026  Cached window geometry, background title list (wintrack.py)
+    10/18/2026  Pluggable capture backends, fastest picked by probe (backends.py)
+    10/18/2026  Selectable output encoders (encoders.py)
+    10/18/2026  Drift-free auto mode scheduler (scheduler.py)
+    10/18/2026  Recording mode into one container (recorder.py)
+    10/18/2026  Replay ring buffer, hot key dumps the last seconds (replay.py)
+    10/18/2026  More windows per session from one grab (grab.grab_windows)
+    10/18/2026  Capture callbacks moved to engine.py (no Qt), cli.py
+    10/18/2026  Faster start: lazy imports (lazy.py), precompiled icons,
+                --profile-startup
+    10/18/2026  Messages batched on a refresh tick, capped log, stats panel
+    10/18/2026  Per-stage timing, CSV/JSON/Chrome trace export (instrument.py)
+    10/18/2026  Frame index per save folder, Resume, no overwrites (manifest.py)
+    10/18/2026  PDF / contact sheet assembly on a process pool (assemble.py)
+    10/18/2026  Auto-trim of window chrome, cached crop box (trim.py)
+    10/18/2026  Pick Region: rubber-band capture region, presets (region.py)
+    10/18/2026  Encode on worker processes via shared memory (procpool.py)
+    10/18/2026  On Change: save when the window changed and settled (motion.py)
+    10/18/2026  Zero-copy frames from grab to write, copies per frame (frame.py)
+    10/18/2026  Output: one zip/tar archive per session (archive.py)
+    10/18/2026  Hot key queue off the input hook, debounce, counters (hotkey.py)
     
     Uisang Hwang
     
@@ -13,267 +38,154 @@
 import sys
 import os
 import time, threading
-from pynput.mouse import Listener, Button
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QSize, QTimer              
-from PyQt5.QtGui import QIcon, QPixmap
+from collections import deque
+_t0 = time.perf_counter()
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QSize, QTimer, QEvent, QRect
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QPixmapCache
 from PyQt5.QtWidgets import ( 
         QApplication, QWidget    , QStyleFactory , 
         QPushButton , QLineEdit  , QPlainTextEdit, 
-        QComboBox   , QGridLayout, QVBoxLayout   , 
+        QComboBox   , QGridLayout, 
         QHBoxLayout , QFormLayout, QFileDialog   , 
-        QMessageBox , QLabel     , QCheckBox 
+        QMessageBox , QLabel     , QCheckBox     ,
+        QRubberBand
         )
-import keyboard
-import pygetwindow
-import pyautogui
-import PIL
-from pathlib import Path
 import msg
+import lazy
+import grab
+import pipeline
+import dedupe
+import settle
+import trim
+import motion
+import archive
+import hotkey
+import region
+import wintrack
+import backends
+import encoders
+import scheduler
+import recorder
+import replay
+import manifest
+import assemble
+import instrument
 
-from icons import icon_folder_open, icon_refresh, icon_capture
+from icons import icon_data
 
-hot_key_list = ['f2' , 'f3' , 'f3', 'f4', 
-                'left', 'up', 'right', 'down']
-file_template = "%s-%03d.png"              
+from engine import (hot_key_list, KeyboardCaptureCallback, MouseCaptureCallback,
+                    RecordCallback, ReplayCallback, ChangeCaptureCallback)
 
-def save_screenshot(title, prefix, image_number):
-    win = pygetwindow.getWindowsWithTitle(title)[0]
-    win.activate()
+refresh_ms = 100     # GUI refresh tick while a capture runs
+log_lines  = 5000    # message log keeps the last lines only
 
-    left, top = win.topleft
-    right, bottom = win.bottomright
+def icon(name):
+    # pixels from icons/icon_data.py, made once per process
+    pixmap = QPixmapCache.find(name)
+    if pixmap is None:
+        width, height, data = getattr(icon_data, name)
+        pixmap = QPixmap.fromImage(QImage(data, width, height,
+                                          QImage.Format_ARGB32_Premultiplied))
+        QPixmapCache.insert(name, pixmap)
+    return QIcon(pixmap)
 
-    cwd = Path.cwd()
-    pre = prefix
-    
-    temp_path = Path.joinpath(cwd, "%d-tmp.png"%image_number)
-    pyautogui.screenshot(str(temp_path))
-    
-    im = PIL.Image.open(str(temp_path))
-    file = file_template%(pre,image_number)
-    path = Path.joinpath(cwd, file)
-    
-    im = im.crop((left, top, right, bottom))
-    im.save(str(path))
-    Path.unlink(temp_path)
-    return file
-
-class Callback(QObject):
-    print_message  = pyqtSignal(str)
-    number_changed = pyqtSignal(int) 
-    
-    def __init__(self, title, hot_key, img_num, prefix, interval=0):
-        super(Callback, self).__init__()
-        self.title = title
-        self.hot_key = hot_key
-        self.image_number = img_num
-        self.prefix  = prefix
-        self.interval = interval
-        self.timer = None
-
-class KeyboardCaptureCallback(Callback):
-    def __init__(self, title, hot_key, img_num, prefix, interval=0):
-        super(KeyboardCaptureCallback, self).__init__(title, hot_key, img_num, prefix, interval)
-
-        if self.interval > 0:
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.save)
-            self.ipage = 0
-             
-    def save(self):
-        try:
-            file = save_screenshot(self.title, self.prefix, self.image_number)
-        except Exception as e:
-            self.print_message.emit(str(e))
-            
-        self.image_number += 1
-        self.number_changed.emit(self.image_number)       
-        self.print_message.emit("Save ... %s"%file) 
-        if isinstance(self.timer, QTimer):
-            keyboard.send(self.hot_key)
-        time.sleep(0.4)
-            
-    def keyboardEventReceived(self, event):
-        if event.event_type == 'down':
-            if event.name == self.hot_key:
-                self.save()
-                
-    def start(self):
-        # on_press returns a hook that can be used to "disconnect" the callback
-        # function later, if required
-        if isinstance(self.timer, QTimer):
-            self.timer.start(self.interval)
-        else:
-            self.hook = keyboard.on_press(self.keyboardEventReceived)
-        
-    def stop(self):
-        if isinstance(self.timer, QTimer):
-            self.timer.stop()
-            self.timer = None
-        else:
-            keyboard.unhook(self.hook)
-        
-class MouseCaptureCallback(Callback):
-    def __init__(self, mouse_pos, title, hot_key, img_num, prefix, interval=0):
-        super(MouseCaptureCallback, self).__init__(title, hot_key, img_num, prefix, interval)
-        self._stopped = False
-        self.mouse_pos = mouse_pos
-        self.listener = None
-        self.esc_thread = None
-        
-        if self.interval > 0:
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.mouse_click_capture)
-        else:
-            self.listener = Listener(on_click=self.save)
- 
-    def save(self, x, y, button, pressed):
-        if self._stopped:
-            return False
-            
-        if pressed:
-            try:
-                file = save_screenshot(self.title, self.prefix, self.image_number)
-            except Exception as e:
-                self.print_message.emit(str(e))
-                
-            self.image_number += 1
-            self.number_changed.emit(self.image_number)       
-            self.print_message.emit("Save ... %s"%file) 
-        return True
-        
-    def start(self):
-        self._stopped = False
-        # on_press returns a hook that can be used to "disconnect" the callback
-        # function later, if required
-        if isinstance(self.timer, QTimer):
-            self.timer.start(self.interval)
-            # Start ESC key monitor thread
-            self.esc_thread = threading.Thread(target=self.esc_watcher, daemon=True)
-            self.esc_thread.start() 
-        else:
-            self.listener.start()
-            
-    def stop(self):
-        self._stopped = True
-        if isinstance(self.timer, QTimer):
-            self.timer.stop()
-            self.timer = None
-            self.esc_thread = None
-        else:
-            self.listener.stop()
-            self.listener = None
-            
-    def mouse_click_capture(self):
-        if self._stopped:
-            return
-            
-        try:
-            file = save_screenshot(self.title, self.prefix, self.image_number)
-        except Exception as e:
-            self.print_message.emit(str(e))
-            
-        self.image_number += 1
-        self.number_changed.emit(self.image_number)       
-        self.print_message.emit("Save ... %s"%file) 
-        
-        time.sleep(0.4)  # slight pause before screenshot        
-        x, y = self.mouse_pos
-        pyautogui.moveTo(x,y)
-        pyautogui.click(x, y)
+class RegionPicker(QWidget):
+    '''
+        Translucent overlay on the whole desktop; a drag draws the
+        rubber band, the release emits it in screen pixels. ESC cancels.
+    '''
+    picked = pyqtSignal(int, int, int, int)
 
-    def esc_watcher(self):
-        try:
-            while not self._stopped:
-                if keyboard.is_pressed('esc'):
-                    self.print_message.emit("Stopped by ESC key.")
-                    #self.stop()
-                    QTimer.singleShot(0, self.stop)  # runs self.stop() on the Qt main thread
-                    break
-                time.sleep(0.1)
-        except Exception as e:
-            self.print_message.emit(f"ESC watcher error: {e}")
+    def __init__(self):
+        super().__init__(None, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setWindowOpacity(0.3)
+        self.setCursor(Qt.CrossCursor)
+        self.setGeometry(QApplication.primaryScreen().virtualGeometry())
+        self.band = QRubberBand(QRubberBand.Rectangle, self)
+        self.origin = None
 
-class CaptureCallback(QObject):
-    print_message  = pyqtSignal(str)
-    number_changed = pyqtSignal(int)
-    
-    def __init__(self, title, hot_key, img_num, prefix, interval=0):
-        super(CaptureCallback, self).__init__()
-        self.title = title
-        self.hot_key = hot_key
-        self.image_number = img_num
-        self.prefix  = prefix
-        self.interval = interval
-        self.timer = None
-        
-        if self.interval > 0:
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.save)
-           
-    def save(self):
-        try:
-            win = pygetwindow.getWindowsWithTitle(self.title)[0]
-            win.activate()
-        
-            left, top = win.topleft
-            right, bottom = win.bottomright
-        
-            cwd = Path.cwd()
-            pre = self.prefix
-            
-            temp_path = Path.joinpath(cwd, "%d-tmp.png"%self.image_number)
-            pyautogui.screenshot(str(temp_path))
-            
-            im = PIL.Image.open(str(temp_path))
-            file = file_template%(pre,self.image_number)
-            path = Path.joinpath(cwd, file)
-            
-            im = im.crop((left, top, right, bottom))
-            im.save(str(path))
+    def mousePressEvent(self, event):
+        self.origin = event.pos()
+        self.band.setGeometry(QRect(self.origin, QSize()))
+        self.band.show()
 
-            if isinstance(self.timer, QTimer):
-                keyboard.send(self.hot_key)
-            
-        except Exception as e:
-            self.print_message.emit(str(e))
+    def mouseMoveEvent(self, event):
+        if self.origin is not None:
+            self.band.setGeometry(QRect(self.origin, event.pos()).normalized())
+
+    def mouseReleaseEvent(self, event):
+        r = QRect(self.origin, event.pos()).normalized()
+        self.close()
+        if r.width() < 2 or r.height() < 2:
             return
-            
-        self.print_message.emit("Save ... %s"%file)
-        self.image_number += 1
-        Path.unlink(temp_path)
-        self.number_changed.emit(self.image_number)
-        
-    def keyboardEventReceived(self, event):
-        if event.event_type == 'down':
-            if event.name == self.hot_key:
-                self.save()
-                
-    def start(self):
-        # on_press returns a hook that can be used to "disconnect" the callback
-        # function later, if required
-        if isinstance(self.timer, QTimer):
-            self.timer.start(self.interval)
-        else:
-            self.hook = keyboard.on_press(self.keyboardEventReceived)
-        
-    def stop(self):
-        if isinstance(self.timer, QTimer):
-            self.timer.stop()
-            self.timer = None
-        else:
-            keyboard.unhook(self.hook)
-        
+        # grabs are in device pixels, Qt positions in logical ones
+        ratio = self.devicePixelRatioF()
+        tl = self.mapToGlobal(r.topLeft())
+        left, top = int(tl.x()*ratio), int(tl.y()*ratio)
+        self.picked.emit(left, top, left+int(r.width()*ratio), top+int(r.height()*ratio))
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close()
+
+class StartupProfile(QObject):
+    '''
+        --profile-startup: time from the first line of capture.py to the
+        first paint of the window, by phase, printed when it paints.
+    '''
+    def __init__(self, t0):
+        super().__init__()
+        self.last = self.t0 = t0
+        self.marks = []
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.marks.append((name, (now-self.last)*1000))
+        self.last = now
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.marks[-1][0] != 'first paint':
+            self.mark('first paint')
+            self.report()
+            QTimer.singleShot(0, QApplication.instance().quit)
+        return False
+
+    def report(self):
+        for name, ms in self.marks:
+            print("Startup ... %-12s %7.1f ms"%(name, ms))
+        print("Startup ... %-12s %7.1f ms"%('total', (self.last-self.t0)*1000))
+        loaded = lazy.imported()
+        print("Startup ... lazy modules loaded: %s"%(", ".join(loaded) if loaded else "none"))
+
 class ScreenCapture(QWidget):
     update_message = pyqtSignal(str)
     bring_to_front = pyqtSignal()
+    titles_changed = pyqtSignal(list, list)
+    # the engine calls back on its own threads, these queue to the GUI;
+    # messages and numbers are picked up by the refresh tick instead
+    capture_stop    = pyqtSignal()
+    capture_rate    = pyqtSignal(str)
+    backends_found  = pyqtSignal(list)
+    assembled       = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
+        self.app_titles = []
         self.initUI()
         self.callback = None
         self.update_message.connect(self.message.appendPlainText)
         self.bring_to_front.connect(self.bring_window_to_front)
+        self.titles_changed.connect(self.update_applications)
+        self.title_watcher = wintrack.TitleWatcher(self.titles_changed.emit)
+        self.title_watcher.start()
+        self.capture_stop.connect(self.stop_capture)
+        self.capture_rate.connect(self.rate.setText)
+        self.assembled.connect(self.assemble_done)
+        # probing backends imports their packages: not on the GUI thread
+        self.backends_found.connect(self.backend.addItems)
+        threading.Thread(target=lambda: self.backends_found.emit(
+                         [b.name for b in backends.available_backends()]),
+                         daemon=True).start()
         
     def initUI(self):
         self.form_layout = QFormLayout()
@@ -284,7 +196,7 @@ class ScreenCapture(QWidget):
         paper.addWidget(self.save_folder, 0,1)
         
         self.save_folder_btn = QPushButton()
-        self.save_folder_btn.setIcon(QIcon(QPixmap(icon_folder_open.table)))
+        self.save_folder_btn.setIcon(icon('folder_open'))
         self.save_folder_btn.setIconSize(QSize(16,16))
         self.save_folder_btn.setToolTip("Change download folder")
         self.save_folder_btn.clicked.connect(self.get_new_save_folder)
@@ -297,15 +209,25 @@ class ScreenCapture(QWidget):
         paper.addWidget(QLabel("Start#"), 2,0)
         self.start_number = QLineEdit("0")
         paper.addWidget(self.start_number, 2,1)
+        self.resume_btn = QPushButton("Resume")
+        self.resume_btn.setToolTip("Next number after the frames of Prefix in the Save Folder index")
+        self.resume_btn.clicked.connect(self.resume_number)
+        paper.addWidget(self.resume_btn, 2,2)
         
         paper.addWidget(QLabel("Application"), 3, 0)
+        app_box = QHBoxLayout()
+        self.app_filter = QLineEdit()
+        self.app_filter.setPlaceholderText("filter")
+        self.app_filter.setFixedWidth(60)
+        self.app_filter.textChanged.connect(self.sync_application_list)
+        app_box.addWidget(self.app_filter)
         self.application = QComboBox()
         self.application.setFixedWidth(150)
-        self.refresh_applications()
-        paper.addWidget(self.application, 3,1)
+        app_box.addWidget(self.application)
+        paper.addLayout(app_box, 3,1)
         
         self.refresh_app_list_btn = QPushButton()
-        self.refresh_app_list_btn.setIcon(QIcon(QPixmap(icon_refresh.table)))
+        self.refresh_app_list_btn.setIcon(icon('refresh'))
         self.refresh_app_list_btn.setIconSize(QSize(16,16))
         self.refresh_app_list_btn.setToolTip("Reread Appplications")
         self.refresh_app_list_btn.clicked.connect(self.refresh_applications)
@@ -324,6 +246,12 @@ class ScreenCapture(QWidget):
         self.interval = QLineEdit("0.0")
         self.interval.setEnabled(False)
         paper.addWidget(self.interval, 6, 1)
+        self.tick_policy = QComboBox()
+        self.tick_policy.addItems(scheduler.policy_list)
+        self.tick_policy.setToolTip("When a capture overruns its interval:\n"
+                                    "skip the missed ticks or catch up on them")
+        self.tick_policy.setEnabled(False)
+        paper.addWidget(self.tick_policy, 6, 2)
         
         paper.addWidget(QLabel("Num Pages"), 7, 0)
         self.npage_to_save = QLineEdit('0')
@@ -340,6 +268,219 @@ class ScreenCapture(QWidget):
         paper.addWidget(self.capture_mouse_btn, 8, 2)
         self.capture_mouse_btn.setEnabled(False)
 
+        # --- Encode/Write Pool Options ---
+        paper.addWidget(QLabel("Workers"), 9, 0)
+        self.workers = QLineEdit("2")
+        paper.addWidget(self.workers, 9, 1)
+        self.worker_kind = QComboBox()
+        self.worker_kind.addItems(['threads', 'processes', 'shards'])
+        self.worker_kind.setToolTip("processes: one encoder per core, frames in shared memory\n"
+                                    "shards: processes, and strips of one png frame in parallel")
+        paper.addWidget(self.worker_kind, 9, 2)
+
+        paper.addWidget(QLabel("Queue(MB)"), 10, 0)
+        self.queue_mb = QLineEdit("256")
+        paper.addWidget(self.queue_mb, 10, 1)
+        self.queue_policy = QComboBox()
+        self.queue_policy.addItems(pipeline.policy_list)
+        self.queue_policy.setToolTip("When the queue is full: wait for a worker or drop the frame")
+        paper.addWidget(self.queue_policy, 10, 2)
+
+        # --- Duplicate Frame Options ---
+        paper.addWidget(QLabel("Skip Dups"), 11, 0)
+        self.skip_dups = QCheckBox()
+        paper.addWidget(self.skip_dups, 11, 1)
+        self.skip_dups.stateChanged.connect(self.skip_dups_state_changed)
+        self.dup_method = QComboBox()
+        self.dup_method.addItems(dedupe.method_list)
+        self.dup_method.setToolTip("diff: downsampled pixel difference, dhash: perceptual hash")
+        paper.addWidget(self.dup_method, 11, 2)
+
+        paper.addWidget(QLabel("Dup Threshold"), 12, 0)
+        self.dup_threshold = QLineEdit("0.002")
+        self.dup_threshold.setToolTip("0..1, tune per source: two text pages can be ~0.008 apart")
+        paper.addWidget(self.dup_threshold, 12, 1)
+
+        paper.addWidget(QLabel("Stop After Dups"), 13, 0)
+        self.max_dups = QLineEdit("3")
+        self.max_dups.setToolTip("Auto save stops after this many duplicates in a row (0: never)")
+        paper.addWidget(self.max_dups, 13, 1)
+        self.skip_dups_state_changed()
+
+        # --- Settle Detection Options ---
+        paper.addWidget(QLabel("Settle"), 14, 0)
+        self.settle = QCheckBox()
+        self.settle.setToolTip("Capture as soon as the page has changed and stopped changing\n"
+                               "instead of a fixed pause (auto save: next page right away)")
+        paper.addWidget(self.settle, 14, 1)
+        self.settle.stateChanged.connect(self.settle_state_changed)
+
+        paper.addWidget(QLabel("Stable Polls"), 15, 0)
+        self.settle_polls = QLineEdit("2")
+        paper.addWidget(self.settle_polls, 15, 1)
+
+        paper.addWidget(QLabel("Settle Timeout(ms)"), 16, 0)
+        self.settle_timeout = QLineEdit("2000")
+        paper.addWidget(self.settle_timeout, 16, 1)
+        self.settle_state_changed()
+
+        paper.addWidget(QLabel("Backend"), 17, 0)
+        self.backend = QComboBox()
+        self.backend.addItem('auto')
+        self.backend.setToolTip("auto: time each backend on the window at start, use the fastest")
+        paper.addWidget(self.backend, 17, 1)
+
+        paper.addWidget(QLabel("Encoder"), 18, 0)
+        self.encoder = QComboBox()
+        self.encoder.addItems(encoders.encoder_list)
+        self.encoder.setToolTip("png/webp-lossless/qoi: lossless, jpeg/webp: lossy")
+        paper.addWidget(self.encoder, 18, 1)
+        self.measure_btn = QPushButton("Measure")
+        self.measure_btn.setToolTip("Encode one frame of the application with every encoder")
+        self.measure_btn.clicked.connect(self.measure_encoders)
+        paper.addWidget(self.measure_btn, 18, 2)
+
+        paper.addWidget(QLabel("Level/Quality"), 19, 0)
+        self.encoder_setting = QLineEdit()
+        self.encoder_setting.setPlaceholderText("default")
+        self.encoder_setting.setToolTip("png: level 0-9, webp-lossless: method 0-6,\n"
+                                        "jpeg: quality 1-95, webp: quality 0-100")
+        paper.addWidget(self.encoder_setting, 19, 1)
+
+        paper.addWidget(QLabel("Record"), 20, 0)
+        self.record = QCheckBox()
+        self.record.setToolTip("Grab every Interval(ms) into one file until Stop\n"
+                               "(png/jpeg encoder level/quality applies to apng/avi)")
+        paper.addWidget(self.record, 20, 1)
+        self.record.stateChanged.connect(self.autosave_state_changed)
+        self.container = QComboBox()
+        self.container.addItems(recorder.container_list)
+        self.container.setToolTip("apng: animated png, avi: motion jpeg,\n"
+                                  "pipe: h.264 mp4 through ffmpeg")
+        paper.addWidget(self.container, 20, 2)
+
+        paper.addWidget(QLabel("Replay"), 21, 0)
+        self.replay = QCheckBox()
+        self.replay.setToolTip("Grab every Interval(ms) into a fixed ring buffer,\n"
+                               "the hot key saves the last Replay(s) seconds")
+        paper.addWidget(self.replay, 21, 1)
+        self.replay.stateChanged.connect(self.autosave_state_changed)
+        self.replay_mode = QComboBox()
+        self.replay_mode.addItems(replay.mode_list)
+        self.replay_mode.setToolTip("clip: the seconds in the ring into one Record container\n"
+                                    "best: the sharpest frame as one screenshot")
+        paper.addWidget(self.replay_mode, 21, 2)
+
+        paper.addWidget(QLabel("Replay(s)"), 22, 0)
+        self.replay_seconds = QLineEdit("10")
+        paper.addWidget(self.replay_seconds, 22, 1)
+        self.replay_backing = QComboBox()
+        self.replay_backing.addItems(replay.backing_list)
+        self.replay_backing.setToolTip("mmap: ring in a memory mapped temp file")
+        paper.addWidget(self.replay_backing, 22, 2)
+
+        paper.addWidget(QLabel("More Windows"), 23, 0)
+        self.more_windows = QComboBox()
+        self.more_windows.setToolTip("Windows cut from the same grab as Application,\n"
+                                     "each saved with its own prefix and counter")
+        paper.addWidget(self.more_windows, 23, 1)
+        more_box = QHBoxLayout()
+        self.add_window_btn = QPushButton("+")
+        self.add_window_btn.setToolTip("Add the selected Application with the current Prefix")
+        self.add_window_btn.clicked.connect(self.add_window)
+        more_box.addWidget(self.add_window_btn)
+        self.remove_window_btn = QPushButton("-")
+        self.remove_window_btn.clicked.connect(self.remove_window)
+        more_box.addWidget(self.remove_window_btn)
+        paper.addLayout(more_box, 23, 2)
+
+        paper.addWidget(QLabel("Instrument"), 24, 0)
+        self.instrument = QCheckBox()
+        self.instrument.setToolTip("Time every stage of a frame (grab, encode, write, ...),\n"
+                                   "can be switched on or off while capturing")
+        self.instrument.stateChanged.connect(self.instrument_state_changed)
+        paper.addWidget(self.instrument, 24, 1)
+        self.export_trace_btn = QPushButton("Export")
+        self.export_trace_btn.setToolTip("Write trace-<time>.csv/.json/.trace.json into the Save Folder\n"
+                                         "(open .trace.json in chrome://tracing or ui.perfetto.dev)")
+        self.export_trace_btn.clicked.connect(self.export_trace)
+        paper.addWidget(self.export_trace_btn, 24, 2)
+
+        paper.addWidget(QLabel("Assemble"), 25, 0)
+        self.assemble_kind = QComboBox()
+        self.assemble_kind.addItems(['pdf', 'sheets'])
+        self.assemble_kind.setToolTip("pdf: Prefix.pdf, a page per frame\n"
+                                      "sheets: Prefix-sheet-NNN.jpg, 4x5 thumbnails each")
+        paper.addWidget(self.assemble_kind, 25, 1)
+        self.assemble_btn = QPushButton("Make")
+        self.assemble_btn.setToolTip("Assemble the Prefix frames of the Save Folder on all cores")
+        self.assemble_btn.clicked.connect(self.assemble_frames)
+        paper.addWidget(self.assemble_btn, 25, 2)
+
+        paper.addWidget(QLabel("Auto Trim"), 26, 0)
+        self.auto_trim = QCheckBox()
+        self.auto_trim.setToolTip("Save only the page: title bar, toolbars, scrollbars and\n"
+                                  "flat borders are found on the first frames and cut off")
+        paper.addWidget(self.auto_trim, 26, 1)
+        self.trim_frames = QLineEdit("3")
+        self.trim_frames.setToolTip("Frames the trim box is learnt from (again after a resize)")
+        paper.addWidget(self.trim_frames, 26, 2)
+
+        paper.addWidget(QLabel("Region"), 27, 0)
+        region_box = QHBoxLayout()
+        self.region = QComboBox()
+        self.region.setToolTip("Grab only this part of the screen; rel: from the\n"
+                               "Application window's corner, it follows the window")
+        self.region.addItem("Whole window", None)
+        for r in region.load_presets():
+            self.region.addItem(r.name, r)
+        region_box.addWidget(self.region)
+        self.region_relative = QCheckBox("rel")
+        self.region_relative.setChecked(True)
+        self.region_relative.setToolTip("Pick the region relative to the Application window")
+        region_box.addWidget(self.region_relative)
+        paper.addLayout(region_box, 27, 1)
+        self.pick_region_btn = QPushButton("Pick")
+        self.pick_region_btn.setToolTip("Drag a rectangle on the screen (ESC cancels)")
+        self.pick_region_btn.clicked.connect(self.pick_region)
+        paper.addWidget(self.pick_region_btn, 27, 2)
+
+        paper.addWidget(QLabel("On Change"), 28, 0)
+        self.on_change = QCheckBox()
+        self.on_change.setToolTip("Sample the window every Interval ms, save a frame\n"
+                                  "only when it changed and the change settled")
+        self.on_change.stateChanged.connect(self.autosave_state_changed)
+        paper.addWidget(self.on_change, 28, 1)
+        self.change_area = QLineEdit("0.005")
+        self.change_area.setToolTip("Fraction of the window (16x12 tiles) that has to change")
+        paper.addWidget(self.change_area, 28, 2)
+
+        paper.addWidget(QLabel("Output"), 29, 0)
+        self.output = QComboBox()
+        self.output.addItems(archive.output_list)
+        self.output.setToolTip("files: a file per frame\n"
+                               "zip, tar: one Prefix-YYYYmmdd-HHMMSS archive per session,\n"
+                               "read it with python archive.py list/extract")
+        paper.addWidget(self.output, 29, 1)
+
+        paper.addWidget(QLabel("Key Queue"), 30, 0)
+        self.key_policy = QComboBox()
+        self.key_policy.addItems(hotkey.policy_list)
+        self.key_policy.setToolTip("Hot key presses (clicks) while a capture runs:\n"
+                                   "coalesce: one more capture for all of them\n"
+                                   "queue: a capture each\n"
+                                   "drop: ignored")
+        paper.addWidget(self.key_policy, 30, 1)
+        self.debounce = QLineEdit("50")
+        self.debounce.setToolTip("ms, a press this soon after the last one is ignored")
+        paper.addWidget(self.debounce, 30, 2)
+
+        paper.addWidget(QLabel("Compare"), 31, 0)
+        self.compare = QCheckBox()
+        self.compare.setToolTip("Measure the old temp-PNG save too (once per window size)\n"
+                                "and show what each frame saves")
+        paper.addWidget(self.compare, 31, 1)
+
         bv = QHBoxLayout()
         
         self.start_capture_btn = QPushButton('Start')
@@ -351,18 +492,30 @@ class ScreenCapture(QWidget):
         bv.addWidget(self.start_capture_btn)
         bv.addWidget(self.stop_capture_btn)
 
+        self.rate = QLabel("")
+        self.stats = QLabel("")
+
         self.message = QPlainTextEdit()
+        self.message.setMaximumBlockCount(log_lines)
+        # engine threads append here, refresh_ui() drains it every tick
+        self.pending_messages = deque()
+        self.pending_number = None
+        self.fps_window = deque()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_ui)
         self.clear_btn = QPushButton("Clear")
         self.clear_btn.clicked.connect(self.clear_message)
         
         self.form_layout.addRow(paper)
         self.form_layout.addRow(bv)
+        self.form_layout.addRow(self.rate)
+        self.form_layout.addRow(self.stats)
         self.form_layout.addWidget(self.message)
         self.form_layout.addWidget(self.clear_btn)
         
         self.setLayout(self.form_layout)
         self.setWindowTitle("Capture")
-        self.setWindowIcon(QIcon(QPixmap(icon_capture.table)))
+        self.setWindowIcon(icon('capture'))
         self.show()
         
     def bring_window_to_front(self):
@@ -387,22 +540,134 @@ class ScreenCapture(QWidget):
                 listener.stop()
                 self.bring_to_front.emit()
     
+        from pynput.mouse import Listener
         listener = Listener(on_click=on_click)
         listener.start()
 
+    def skip_dups_state_changed(self):
+        enabled = self.skip_dups.isChecked()
+        self.dup_method.setEnabled(enabled)
+        self.dup_threshold.setEnabled(enabled)
+        self.max_dups.setEnabled(enabled)
+
+    def settle_state_changed(self):
+        enabled = self.settle.isChecked()
+        self.settle_polls.setEnabled(enabled)
+        self.settle_timeout.setEnabled(enabled)
+
     def autosave_state_changed(self):
-        if self.auto_save.isChecked():
+        continuous = self.record.isChecked() or self.replay.isChecked()
+        if self.auto_save.isChecked() or self.on_change.isChecked() or continuous:
             self.interval.setEnabled(True)
-            self.npage_to_save.setEnabled(True)
+            self.tick_policy.setEnabled(True)
+            self.npage_to_save.setEnabled(not continuous)
         else:
             self.interval.setEnabled(False)
+            self.tick_policy.setEnabled(False)
             self.npage_to_save.setEnabled(False)
         
+    def pick_region(self):
+        self.region_picker = RegionPicker()
+        self.region_picker.picked.connect(self.region_picked)
+        self.region_picker.show()
+
+    def region_picked(self, left, top, right, bottom):
+        try:
+            if self.region_relative.isChecked():
+                x, y, r, b = wintrack.WindowTracker(self.application.currentText()).geometry()
+                left, top, right, bottom = left-x, top-y, right-x, bottom-y
+            roi = region.Region((left, top, right, bottom), self.region_relative.isChecked())
+            region.add_preset(roi)
+        except Exception as e:
+            self.message.appendPlainText(str(e))
+            return
+        i = self.region.findText(roi.name)
+        if i < 0:
+            self.region.addItem(roi.name, roi)
+            i = self.region.count()-1
+        self.region.setCurrentIndex(i)
+        self.message.appendPlainText("Region ... %s"%roi)
+
+    def resume_number(self):
+        try:
+            number = manifest.index().next_number(self.prefix.text())
+        except IOError as e:
+            self.message.appendPlainText(str(e))
+            return
+        self.start_number.setText("%d"%number)
+
+    def assemble_frames(self):
+        prefix = self.prefix.text()
+        kind = self.assemble_kind.currentText()
+        pdf = prefix+'.pdf' if kind == 'pdf' else None
+        self.assemble_btn.setEnabled(False)
+        self.message.appendPlainText("Assemble ... %s %s"%(prefix, kind))
+        threading.Thread(target=self.run_assemble, args=(os.getcwd(), prefix, pdf),
+                         daemon=True).start()
+
+    def run_assemble(self, folder, prefix, pdf):
+        # background thread: the pool does the work, the GUI stays live
+        t0 = time.monotonic()
+        try:
+            frames, outputs = assemble.assemble(folder, prefix, pdf, sheets=pdf is None)
+            self.assembled.emit("Assemble ... %d frames in %.1f s: %s"%(
+                                frames, time.monotonic()-t0, ", ".join(outputs)))
+        except Exception as e:
+            self.assembled.emit("Assemble ... %s"%e)
+
+    def assemble_done(self, s):
+        self.message.appendPlainText(s)
+        self.assemble_btn.setEnabled(True)
+
+    def instrument_state_changed(self):
+        instrument.enable(self.instrument.isChecked())
+
+    def export_trace(self):
+        prefix = time.strftime("trace-%Y%m%d-%H%M%S")
+        try:
+            names = instrument.export(prefix)
+        except IOError as e:
+            self.message.appendPlainText(str(e))
+            return
+        lines = instrument.summary() or ["(no stages timed, check Instrument)"]
+        self.message.appendPlainText("Trace ... %s\n%s"%(", ".join(names), "\n".join(lines)))
+
+    def add_window(self):
+        title = self.application.currentText()
+        prefix = self.prefix.text()
+        if not title:
+            return
+        self.more_windows.addItem("%s <- %s"%(prefix, title), (title, prefix))
+        self.more_windows.setCurrentIndex(self.more_windows.count()-1)
+
+    def remove_window(self):
+        self.more_windows.removeItem(self.more_windows.currentIndex())
+
     def refresh_applications(self):
-        self.application.clear()
-        app_list = pygetwindow.getAllTitles()
-        app_list = [a for a in app_list if a != '']
-        self.application.addItems(app_list)
+        # the title watcher re-reads the list on its own thread
+        self.title_watcher.refresh()
+
+    def update_applications(self, added, removed):
+        # keep first-seen order so the combo can be patched in place
+        removed = set(removed)
+        self.app_titles = [t for t in self.app_titles if t not in removed] + added
+        self.sync_application_list()
+
+    def sync_application_list(self):
+        key = self.app_filter.text().lower()
+        wanted = [t for t in self.app_titles if key in t.lower()]
+        keep = set(wanted)
+        for i in reversed(range(self.application.count())):
+            if self.application.itemText(i) not in keep:
+                self.application.removeItem(i)
+        for i, t in enumerate(wanted):
+            if self.application.itemText(i) != t:
+                self.application.insertItem(i, t)
+
+    def closeEvent(self, event):
+        self.title_watcher.stop()
+        self.stop_capture()
+        super().closeEvent(event)
         
     def clear_message(self):
         self.message.clear()
@@ -415,12 +680,100 @@ class ScreenCapture(QWidget):
         self.save_folder.setText(path)
         os.chdir(path)
 
+    def create_encoder(self):
+        setting = self.encoder_setting.text().strip()
+        return encoders.create(self.encoder.currentText(),
+                               int(setting) if setting else None)
+
+    def measure_encoders(self):
+        try:
+            tracker = wintrack.WindowTracker(self.application.currentText())
+            left, top, right, bottom = tracker.geometry()
+            im = grab.grab_region(left, top, right, bottom)
+        except Exception as e:
+            self.message.appendPlainText(str(e))
+            return
+        self.message.appendPlainText("Encoder ... %dx%d frame"%im.size)
+        for name, ms, nbytes in encoders.measure(im):
+            self.message.appendPlainText("  %-14s %6.0f ms/frame %10s/frame"%(
+                                         name, ms, grab.format_bytes(nbytes)))
+
     def start_capture(self):
-        self.npage_auto_saved = 0
         self.image_number = int(self.start_number.text())
         _interval = int(self.interval.text()) if self.auto_save.isChecked() else 0
+        _opts = dict(verbose  = False,
+                     workers  = int(self.workers.text()),
+                     processes = self.worker_kind.currentText() != 'threads',
+                     shard    = self.worker_kind.currentText() == 'shards',
+                     output   = self.output.currentText(),
+                     key_policy  = self.key_policy.currentText(),
+                     debounce_ms = float(self.debounce.text()),
+                     compare     = self.compare.isChecked(),
+                     queue_mb = float(self.queue_mb.text()),
+                     policy   = self.queue_policy.currentText(),
+                     backend  = self.backend.currentText(),
+                     encoder  = self.create_encoder(),
+                     tick_policy = self.tick_policy.currentText())
+        if self.on_change.isChecked():
+            _opts['pages'] = int(self.npage_to_save.text())
+        elif self.auto_save.isChecked() and not self.replay.isChecked():
+            # Num Pages 0 saved one page before, it still does
+            _opts['pages'] = max(1, int(self.npage_to_save.text()))
+        if self.skip_dups.isChecked():
+            _opts['comparator'] = dedupe.FrameComparator(
+                                    self.dup_method.currentText(),
+                                    float(self.dup_threshold.text()))
+            _opts['max_dups'] = int(self.max_dups.text())
+        if self.auto_trim.isChecked():
+            _opts['trimmer'] = trim.AutoTrim(int(self.trim_frames.text()))
+        if self.region.currentData() is not None:
+            _opts['roi'] = self.region.currentData()
+        targets = [self.more_windows.itemData(i) for i in range(self.more_windows.count())]
+        if targets and not (self.record.isChecked() or self.replay.isChecked()):
+            prefixes = [self.prefix.text()]+[p for t, p in targets]
+            if len(set(prefixes)) != len(prefixes):
+                self.message.appendPlainText("Each window needs its own prefix.")
+                return
+            _opts['targets'] = targets
+        if self.settle.isChecked():
+            _opts['settler'] = settle.SettleDetector(
+                                    int(self.settle_polls.text()),
+                                    float(self.settle_timeout.text())/1000)
             
-        if self.mouse_capture.isChecked():
+        if self.record.isChecked():
+            self.callback = RecordCallback(
+                                self.application.currentText(),
+                                self.hot_key.currentText(),
+                                self.image_number,
+                                self.prefix.text(),
+                                int(float(self.interval.text())),
+                                self.container.currentText(),
+                                **_opts
+                            )
+        elif self.replay.isChecked():
+            self.callback = ReplayCallback(
+                                self.application.currentText(),
+                                self.hot_key.currentText(),
+                                self.image_number,
+                                self.prefix.text(),
+                                int(float(self.interval.text())),
+                                float(self.replay_seconds.text()),
+                                self.replay_mode.currentText(),
+                                self.container.currentText(),
+                                self.replay_backing.currentText(),
+                                **_opts
+                            )
+        elif self.on_change.isChecked():
+            self.callback = ChangeCaptureCallback(
+                                self.application.currentText(),
+                                self.hot_key.currentText(),
+                                self.image_number,
+                                self.prefix.text(),
+                                int(float(self.interval.text())),
+                                motion.MotionDetector(float(self.change_area.text())),
+                                **_opts
+                            )
+        elif self.mouse_capture.isChecked():
             if not hasattr(self, 'mouse_pos'):
                 self.message.appendPlainText("Mouse position not set.")
                 return
@@ -431,7 +784,8 @@ class ScreenCapture(QWidget):
                                 self.hot_key.currentText(),
                                 self.image_number,
                                 self.prefix.text(),
-                                _interval
+                                _interval,
+                                **_opts
                             )            
         else:
             self.callback = KeyboardCaptureCallback(
@@ -439,34 +793,68 @@ class ScreenCapture(QWidget):
                                 self.hot_key.currentText(),
                                 self.image_number,
                                 self.prefix.text(),
-                                _interval
+                                _interval,
+                                **_opts
                             )
     
-        self.callback.print_message.connect(self.print_concurrent_message)
-        self.callback.number_changed.connect(self.set_image_number)
+        self.callback.print_message.connect(self.pending_messages.append)
+        self.callback.number_changed.connect(self.note_image_number)
+        self.callback.stop_requested.connect(self.capture_stop.emit)
+        self.callback.rate_changed.connect(self.capture_rate.emit)
         self.start_capture_btn.setEnabled(False)
+        self.fps_window.clear()
+        self.refresh_timer.start(refresh_ms)
         self.callback.start()           
  
     def stop_capture(self):
         if self.callback is not None:
             self.callback.stop()
+            self.refresh_timer.stop()
+            self.refresh_ui()
             self.callback = None
             self.start_capture_btn.setEnabled(True)
             self.message.appendPlainText("Done ...")
+
+    def note_image_number(self, img_num):
+        # engine thread: only the latest number is shown
+        self.pending_number = img_num
         
     def set_image_number(self, img_num):
         self.start_number.setText("%d"%img_num)
-        
-        if self.auto_save.isChecked():
-            npage = int(self.npage_to_save.text())
-            self.npage_auto_saved += 1    
-            if npage <= 0 or (npage > 0 and self.npage_auto_saved == npage):
-                self.stop_capture()
+
+    def refresh_ui(self):
+        # one log append, one number and one stats update per tick,
+        # however many frames went by
+        lines = []
+        while self.pending_messages:
+            lines.append(self.pending_messages.popleft())
+        if lines:
+            self.print_concurrent_message("\n".join(lines))
+        if self.pending_number is not None:
+            self.set_image_number(self.pending_number)
+            self.pending_number = None
+        if self.callback is not None:
+            self.show_stats(self.callback.stats())
+
+    def show_stats(self, s):
+        now = time.monotonic()
+        self.fps_window.append((now, s.frames))
+        while now-self.fps_window[0][0] > 2.0:
+            self.fps_window.popleft()
+        t, n = self.fps_window[0]
+        fps = (s.frames-n)/(now-t) if now > t else 0.0
+        self.stats.setText("Frames %d | %.1f fps | queue %d | enc %.0f ms | %.1f MB"%(
+                           s.frames, fps, s.depth, s.encode_ms, s.nbytes/1024.0/1024.0))
             
     def print_concurrent_message(self, con_msg):
         self.message.appendPlainText(con_msg)
         
 def run_screencapture():
+    profile = None
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+        profile = StartupProfile(_t0)
+        profile.mark('imports')
     
     app = QApplication(sys.argv)
     #app.setQuitOnLastWindowClosed(False)
@@ -478,7 +866,12 @@ def run_screencapture():
     # --- PyQt4 Only
     
     app.setStyle(QStyleFactory.create("Fusion"))
+    if profile:
+        profile.mark('QApplication')
     ydl= ScreenCapture()
+    if profile:
+        profile.mark('window')
+        ydl.installEventFilter(profile)
     sys.exit(app.exec_())
     
 if __name__ == '__main__':
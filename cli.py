@@ -0,0 +1,322 @@
+'''
+    cli.py
+
+    10/18/2026  Headless capture
+
+    Runs the capture engine (engine.py) without the GUI; PyQt5 is
+    never imported. The options are the fields of the window:
+
+        python cli.py --title "Book - Reader" --interval 1500 --pages 120
+        python cli.py --title Slides --window "Notes=notes" --hot-key right
+        python cli.py --title "Book - Reader" --region 120,90,1320,990
+        python cli.py --title Dashboard --on-change --interval 250
+        python cli.py --title Slides --output zip
+        python cli.py --config book.json --start 40
+        python cli.py --config book.json --resume
+        python cli.py --title Slides --duration 30 --trace slides
+
+    A JSON --config holds the same options by their long names with
+    '_' (queue_mb, hot_key, ...); command line options override it.
+    A run ends after --pages pages, --duration seconds, the duplicate
+    stop, ESC (mouse mode) or Ctrl+C, and prints one summary line.
+    --trace PREFIX times every stage of a frame and writes PREFIX.csv,
+    PREFIX.json and PREFIX.trace.json (instrument.py) at the end.
+    --resume starts after the last frame of --prefix in the folder's
+    index (manifest.py); a number that is taken is never overwritten.
+    --on-change samples the window every --interval ms and saves a
+    frame when --change-area of it changed and settled (motion.py).
+    --output zip|tar appends the frames to one archive per session
+    instead of a file each (archive.py list/extract/repair read it).
+    Hot key presses and clicks are queued off the input hook (hotkey.py):
+    --key-policy says what presses during a capture do, --debounce (ms)
+    drops bounces. --compare also measures the old temp-PNG save once
+    per window size and reports what each frame saves.
+
+    From Python:
+
+        import cli
+        summary = cli.run(title='Slides', interval=1000, pages=10)
+'''
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+
+import grab
+import dedupe
+import settle
+import engine
+import encoders
+import pipeline
+import recorder
+import trim
+import region
+import motion
+import archive
+import hotkey
+import replay
+import scheduler
+import manifest
+import instrument
+
+defaults = dict(title          = None,
+                prefix         = 'cap',
+                start          = 0,
+                resume         = False,
+                folder         = None,
+                hot_key        = 'right',
+                key_policy     = 'coalesce',
+                debounce       = 50,
+                compare        = False,
+                interval       = 0,
+                pages          = 0,
+                duration       = 0,
+                click          = None,
+                windows        = [],
+                workers        = 2,
+                processes      = False,
+                shard          = False,
+                output         = 'files',
+                queue_mb       = 256,
+                policy         = 'block',
+                backend        = 'auto',
+                encoder        = 'png',
+                level          = None,
+                tick_policy    = 'skip',
+                skip_dups      = None,
+                dup_threshold  = 0.002,
+                max_dups       = 3,
+                settle         = False,
+                settle_polls   = 2,
+                settle_timeout = 2000,
+                on_change      = False,
+                change_area    = 0.005,
+                change_threshold = 0.02,
+                trim           = 0,
+                region         = None,
+                absolute       = False,
+                record         = False,
+                container      = 'apng',
+                replay         = 0,
+                replay_mode    = 'clip',
+                replay_backing = 'memory',
+                trace          = None,
+                quiet          = False)
+
+class Summary:
+    def __init__(self, frames, seconds, nbytes, dropped=0, encode_ms=0.0, files=0):
+        self.frames = frames
+        self.seconds = seconds
+        self.nbytes = nbytes
+        self.dropped = dropped
+        self.encode_ms = encode_ms
+        self.files = files
+
+    @property
+    def fps(self):
+        return self.frames/self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return "%d frames in %.1f s (%.2f fps), %d files, %s written, %d dropped, enc %.0f ms/frame"%(
+               self.frames, self.seconds, self.fps, self.files,
+               grab.format_bytes(self.nbytes), self.dropped, self.encode_ms)
+
+def parse_window(w):
+    # "title=prefix"; the title itself may hold '='
+    if isinstance(w, (list, tuple)):
+        return tuple(w)
+    title, prefix = w.rsplit('=', 1)
+    return title, prefix
+
+def create_callback(o):
+    '''The engine callback start_capture() would build for these options.'''
+    opts = dict(workers     = o['workers'],
+                queue_mb    = o['queue_mb'],
+                policy      = o['policy'],
+                backend     = o['backend'],
+                encoder     = encoders.create(o['encoder'], o['level']),
+                tick_policy = o['tick_policy'],
+                processes   = o['processes'],
+                shard       = o['shard'],
+                output      = o['output'],
+                key_policy  = o['key_policy'],
+                debounce_ms = o['debounce'],
+                compare     = o['compare'],
+                verbose     = not o['quiet'])
+    if o['skip_dups']:
+        opts['comparator'] = dedupe.FrameComparator(o['skip_dups'], o['dup_threshold'])
+        opts['max_dups'] = o['max_dups']
+    if o['settle']:
+        opts['settler'] = settle.SettleDetector(o['settle_polls'], o['settle_timeout']/1000.0)
+    if o['trim']:
+        opts['trimmer'] = trim.AutoTrim(o['trim'])
+    if o['region']:
+        box = o['region']
+        opts['roi'] = region.Region(region.parse_box(box) if isinstance(box, str) else box,
+                                    not o['absolute'])
+    args = (o['title'], o['hot_key'], o['start'], o['prefix'])
+
+    if o['record']:
+        return engine.RecordCallback(*args, interval=o['interval'], container=o['container'], **opts)
+    if o['replay']:
+        return engine.ReplayCallback(*args, interval=o['interval'], seconds=o['replay'],
+                                     mode=o['replay_mode'], container=o['container'],
+                                     backing=o['replay_backing'], **opts)
+    if o['pages'] > 0:
+        opts['pages'] = o['pages']
+    if o['windows']:
+        opts['targets'] = [parse_window(w) for w in o['windows']]
+    if o['on_change']:
+        detector = motion.MotionDetector(o['change_area'], o['change_threshold'])
+        return engine.ChangeCaptureCallback(*args, interval=o['interval'], detector=detector, **opts)
+    if o['click']:
+        x, y = [int(v) for v in str(o['click']).split(',')]
+        return engine.MouseCaptureCallback((x, y), *args, interval=o['interval'], **opts)
+    return engine.KeyboardCaptureCallback(*args, interval=o['interval'], **opts)
+
+def run(config=None, **options):
+    '''
+        Capture until a stop condition, returns a Summary. config is a
+        dict (or JSON file name) of options, options override it.
+    '''
+    o = dict(defaults)
+    if isinstance(config, str):
+        with open(config) as f:
+            config = json.load(f)
+    for src in (config or {}), options:
+        for k, v in src.items():
+            if k not in o:
+                raise ValueError("Unknown option: %s"%k)
+            o[k] = v
+    if not o['title']:
+        raise ValueError("No window title")
+    if o['folder']:
+        os.chdir(o['folder'])
+    if o['resume']:
+        o['start'] = manifest.index().next_number(o['prefix'])
+
+    done = threading.Event()
+    rate = ['']
+    def log(s):
+        if not o['quiet']:
+            print(s, flush=True)
+    def rate_changed(s):
+        rate[0] = s
+
+    cb = create_callback(o)
+    cb.print_message.connect(log)
+    cb.stop_requested.connect(done.set)
+    cb.rate_changed.connect(rate_changed)
+    pool = cb.writer
+    if o['trace']:
+        instrument.reset()
+        instrument.enable()
+
+    t0 = time.monotonic()
+    cb.start()
+    try:
+        while not done.wait(0.2):
+            if o['duration'] and time.monotonic()-t0 >= o['duration']:
+                break
+    except KeyboardInterrupt:
+        log("Stopped by Ctrl+C.")
+    finally:
+        cb.stop()
+    seconds = time.monotonic()-t0
+    if rate[0]:
+        log("Rate ... %s"%rate[0])
+    if o['trace']:
+        instrument.enable(False)
+        log("Trace ... %s"%", ".join(instrument.export(o['trace'])))
+        for line in instrument.summary():
+            log("  %s"%line)
+
+    if isinstance(cb, engine.RecordCallback):
+        r = cb.recorder
+        return Summary(r.frames, seconds, r.nbytes, r.dropped, 0.0, 1 if r.frames else 0)
+    if isinstance(cb, engine.ReplayCallback):
+        ring = cb.replay.ring
+        return Summary(ring.count if ring else 0, seconds, 0,
+                       ring.blocked if ring else 0, 0.0, cb.replay.dumps)
+    return Summary(pool.written, seconds, pool.bytes_written, pool.dropped,
+                   pool.mean_encode_ms, pool.written)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Capture a window without the GUI")
+    ap.add_argument('--config', help="JSON file with any of the options below")
+    ap.add_argument('--title', help="window title (Application)")
+    ap.add_argument('--prefix')
+    ap.add_argument('--start', type=int, help="Start#")
+    ap.add_argument('--resume', action='store_true', default=None,
+                    help="start after the last indexed frame of --prefix")
+    ap.add_argument('--folder', help="save folder (current folder)")
+    ap.add_argument('--hot-key', choices=engine.hot_key_list)
+    ap.add_argument('--key-policy', choices=hotkey.policy_list,
+                    help="presses during a capture: one more (coalesce), each (queue) or none (drop)")
+    ap.add_argument('--debounce', type=float, help="ms, a press this soon after the last one is ignored")
+    ap.add_argument('--compare', action='store_true', default=None,
+                    help="measure the old temp-PNG save too")
+    ap.add_argument('--interval', type=int, help="auto save every ms (0: on the hot key)")
+    ap.add_argument('--pages', type=int, help="stop after this many pages, duplicates included (0: no limit)")
+    ap.add_argument('--duration', type=float, help="stop after seconds (0: no limit)")
+    ap.add_argument('--click', metavar='X,Y', help="mouse capture: click here to turn the page")
+    ap.add_argument('--window', dest='windows', action='append', metavar='TITLE=PREFIX',
+                    help="one more window cut from the same grab (repeatable)")
+    ap.add_argument('--workers', type=int)
+    ap.add_argument('--processes', action='store_true', default=None,
+                    help="encode on worker processes through shared memory")
+    ap.add_argument('--shard', action='store_true', default=None,
+                    help="with --processes: compress strips of one png frame in parallel")
+    ap.add_argument('--output', choices=archive.output_list,
+                    help="a file per frame, or one zip/tar archive per session")
+    ap.add_argument('--queue-mb', type=float)
+    ap.add_argument('--policy', choices=pipeline.policy_list)
+    ap.add_argument('--backend')
+    ap.add_argument('--encoder', choices=encoders.encoder_list)
+    ap.add_argument('--level', type=int, help="encoder level/quality")
+    ap.add_argument('--tick-policy', choices=scheduler.policy_list)
+    ap.add_argument('--skip-dups', choices=dedupe.method_list)
+    ap.add_argument('--dup-threshold', type=float,
+                    help="0..1, at most this far from the last frame is a duplicate (0.002)")
+    ap.add_argument('--max-dups', type=int)
+    ap.add_argument('--settle', action='store_true', default=None)
+    ap.add_argument('--settle-polls', type=int)
+    ap.add_argument('--settle-timeout', type=float, help="ms")
+    ap.add_argument('--on-change', action='store_true', default=None,
+                    help="save a frame when the window changed, polled every --interval ms")
+    ap.add_argument('--change-area', type=float,
+                    help="fraction of the tiles that must change (0.005)")
+    ap.add_argument('--change-threshold', type=float,
+                    help="mean difference of a changed tile, fraction of full scale (0.02)")
+    ap.add_argument('--trim', type=int, metavar='FRAMES',
+                    help="cut title bar, toolbars and borders, learnt from FRAMES frames (0: off)")
+    ap.add_argument('--region', metavar='L,T,R,B',
+                    help="grab only this part of the window (from its top-left corner)")
+    ap.add_argument('--absolute', action='store_true', default=None,
+                    help="--region is in screen coordinates")
+    ap.add_argument('--record', action='store_true', default=None,
+                    help="record every --interval ms into one --container file")
+    ap.add_argument('--container', choices=recorder.container_list)
+    ap.add_argument('--replay', type=float, metavar='SECONDS',
+                    help="keep the last seconds, the hot key saves them")
+    ap.add_argument('--replay-mode', choices=replay.mode_list)
+    ap.add_argument('--replay-backing', choices=replay.backing_list)
+    ap.add_argument('--trace', metavar='PREFIX',
+                    help="time every stage, write PREFIX.csv/.json/.trace.json")
+    ap.add_argument('--quiet', action='store_true', default=None)
+    args = vars(ap.parse_args(argv))
+
+    config = args.pop('config')
+    options = dict((k, v) for k, v in args.items() if v is not None)
+    try:
+        summary = run(config, **options)
+    except (ValueError, LookupError, IOError) as e:
+        print("Error ... %s"%e, file=sys.stderr)
+        return 1
+    print("Summary ... %s"%summary)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
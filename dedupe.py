@@ -0,0 +1,82 @@
+'''
+    dedupe.py
+
+    10/18/2026  Duplicate-frame suppression
+
+    Compare each grabbed frame with the last kept one before it is
+    encoded. Two methods, both on a small downsampled copy:
+
+        diff  : mean absolute difference of a size x size gray
+                thumbnail, as a fraction of full scale (0..1)
+        dhash : difference hash (size x size bits), fraction of
+                differing bits (0..1)
+
+    A frame is a duplicate when the measure is <= threshold. Two
+    different pages of plain text can be as close as ~0.008 (diff), so
+    the default 0.002 only takes near-identical frames; raise it for
+    noisy sources (video, dithering), lower it for sparse pages.
+'''
+import lazy
+
+np  = lazy.module('numpy')
+PIL = lazy.module('PIL', 'PIL.Image')
+
+method_list = ['diff', 'dhash']
+
+def thumbnail(im, width, height):
+    # reduce at full color first, the gray convert then works on a few pixels
+    small = im.resize((width, height), PIL.Image.BOX, reducing_gap=2.0)
+    return np.asarray(small.convert('L'), dtype=np.int16)
+
+def mean_abs_diff(a, b):
+    return float(np.abs(a-b).mean())/255.0
+
+def dhash(im, size=16):
+    px = thumbnail(im, size+1, size)
+    return px[:, 1:] > px[:, :-1]
+
+def hash_distance(a, b):
+    return float(np.count_nonzero(a != b))/a.size
+
+class FrameComparator:
+    def __init__(self, method='diff', threshold=0.002, size=64):
+        if method not in method_list:
+            raise ValueError("Unknown compare method: %s"%method)
+        self.method = method
+        self.threshold = threshold
+        self.size = size
+        self.previous = None
+        self.consecutive = 0
+        self.skipped = 0
+
+    def signature(self, im):
+        if self.method == 'dhash':
+            return dhash(im, min(self.size, 16))
+        return thumbnail(im, self.size, self.size)
+
+    def distance(self, a, b):
+        if a.shape != b.shape:
+            return 1.0
+        if self.method == 'dhash':
+            return hash_distance(a, b)
+        return mean_abs_diff(a, b)
+
+    def is_duplicate(self, im):
+        '''
+            True if im is a near-duplicate of the last kept frame.
+            Duplicates are not remembered, so a slow drift can not
+            creep past the threshold one small step at a time.
+        '''
+        sig = self.signature(im)
+        if self.previous is not None and \
+           self.distance(sig, self.previous) <= self.threshold:
+            self.consecutive += 1
+            self.skipped += 1
+            return True
+        self.previous = sig
+        self.consecutive = 0
+        return False
+
+    def reset(self):
+        self.previous = None
+        self.consecutive = 0
@@ -0,0 +1,175 @@
+'''
+    encoders.py
+
+    10/18/2026  Selectable output encoders
+
+    One Encoder per session turns a frame into file bytes:
+
+        png           : lossless, setting = zlib level 0..9 (6)
+        webp-lossless : lossless, setting = method 0..6 (1), lower is faster
+        qoi           : lossless "Quite OK Image" format, no setting;
+                        numpy encoder, no zlib: faster than png,
+                        bigger files
+        jpeg          : lossy, setting = quality 1..95 (85)
+        webp          : lossy, setting = quality 0..100 (80)
+
+    measure() runs a frame through each encoder so the GUI can show
+    ms/frame and bytes/frame side by side.
+'''
+import io
+import time
+import struct
+
+import lazy
+
+np = lazy.module('numpy')
+
+class Encoder:
+    name = ''
+    ext  = ''
+    default = None
+
+    def __init__(self, setting=None):
+        self.setting = self.default if setting is None else setting
+
+    def encode(self, im):
+        buf = io.BytesIO()
+        self.save(im, buf)
+        return buf.getvalue()
+
+    def save(self, im, buf):
+        raise NotImplementedError
+
+    def __str__(self):
+        if self.setting is None:
+            return self.name
+        return "%s(%s)"%(self.name, self.setting)
+
+class PngEncoder(Encoder):
+    name, ext, default = 'png', 'png', 6
+
+    def save(self, im, buf):
+        im.save(buf, format='PNG', compress_level=int(self.setting))
+
+class WebpLosslessEncoder(Encoder):
+    name, ext, default = 'webp-lossless', 'webp', 1
+
+    def save(self, im, buf):
+        im.save(buf, format='WEBP', lossless=True, method=int(self.setting))
+
+class JpegEncoder(Encoder):
+    name, ext, default = 'jpeg', 'jpg', 85
+
+    def save(self, im, buf):
+        if im.mode not in ('RGB', 'L'):
+            im = im.convert('RGB')
+        im.save(buf, format='JPEG', quality=int(self.setting))
+
+class WebpEncoder(Encoder):
+    name, ext, default = 'webp', 'webp', 80
+
+    def save(self, im, buf):
+        im.save(buf, format='WEBP', quality=int(self.setting))
+
+class QoiEncoder(Encoder):
+    name, ext = 'qoi', 'qoi'
+
+    def encode(self, im):
+        if im.mode != 'RGB':
+            im = im.convert('RGB')
+        return qoi_encode(np.asarray(im))
+
+def qoi_encode(px):
+    '''
+        QOI (qoiformat.org) encoder for an (h, w, 3) uint8 array,
+        vectorized. It emits RUN, DIFF, LUMA and RGB chunks and never
+        INDEX (the spec allows that; INDEX needs a serial hash table),
+        so files are a bit larger than the reference encoder makes
+        but any QOI decoder reads them.
+    '''
+    height, width = px.shape[:2]
+    n = width*height
+    cur = px.reshape(n, 3)
+    r, g, b = [np.ascontiguousarray(cur[:, i]) for i in range(3)]
+
+    def delta(c):
+        # wrapped difference to the previous pixel, prev starts at 0
+        d = np.empty(n, dtype=np.uint8)
+        d[0] = c[0]
+        np.subtract(c[1:], c[:-1], out=d[1:])
+        return d.view(np.int8)
+    dr, dg, db = delta(r), delta(g), delta(b)
+
+    same = (dr == 0) & (dg == 0) & (db == 0)
+
+    # runs of repeated pixels: one RUN chunk per 62 pixels of a run,
+    # placed on the last pixel it covers
+    edge = np.diff(same.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edge == 1)
+    length = np.flatnonzero(edge == -1) - starts
+    count = (length+61)//62
+    rid = np.repeat(np.arange(len(starts)), count)
+    k = np.arange(len(rid)) - np.repeat(np.cumsum(count)-count, count)
+    run_pos = starts[rid] + np.minimum(62*(k+1), length[rid]) - 1
+    run_byte = np.empty(n, dtype=np.uint8)
+    run_byte[run_pos] = 0xc0 | (np.minimum(62, length[rid]-62*k)-1)
+
+    # from here on only pixels that write a chunk
+    emit = ~same
+    emit[run_pos] = True
+    at = np.flatnonzero(emit)
+    is_run = same[at]
+    dr, dg, db = dr[at], dg[at], db[at]
+
+    u = lambda x, bias: (x+bias).view(np.uint8)
+    is_diff = np.maximum(np.maximum(u(dr, 2), u(dg, 2)), u(db, 2)) < 4
+    dr_dg = dr.astype(np.int16)-dg
+    db_dg = db.astype(np.int16)-dg
+    is_luma = (u(dg, 32) < 64) & ((dr_dg+8).view(np.uint16) < 16) & \
+              ((db_dg+8).view(np.uint16) < 16)
+
+    # every chunk gets a 4 byte slot, only the first size bytes are kept
+    m = len(at)
+    chunk = np.empty((m, 4), dtype=np.uint8)
+    chunk[:, 0] = 0xfe
+    chunk[:, 1] = r[at]
+    chunk[:, 2] = g[at]
+    chunk[:, 3] = b[at]
+    size = np.full(m, 4, dtype=np.uint8)
+
+    luma = is_luma & ~is_diff
+    chunk[luma, 0] = 0x80 | u(dg[luma], 32)
+    chunk[luma, 1] = ((dr_dg[luma]+8) << 4) | (db_dg[luma]+8)
+    size[luma] = 2
+
+    diff = is_diff & ~is_run
+    chunk[diff, 0] = 0x40 | (u(dr[diff], 2) << 4) | (u(dg[diff], 2) << 2) | u(db[diff], 2)
+    size[diff] = 1
+
+    chunk[is_run, 0] = run_byte[at[is_run]]
+    size[is_run] = 1
+
+    out = chunk[np.arange(4) < size[:, None]]
+
+    header = b'qoif' + struct.pack('>IIBB', width, height, 3, 0)
+    return header + out.tobytes() + b'\x00'*7 + b'\x01'
+
+encoder_class = [PngEncoder, WebpLosslessEncoder, QoiEncoder, JpegEncoder, WebpEncoder]
+encoder_list = [e.name for e in encoder_class]
+
+def create(name, setting=None):
+    for e in encoder_class:
+        if e.name == name:
+            return e(setting)
+    raise ValueError("Unknown encoder: %s"%name)
+
+def measure(im, names=None, rounds=1):
+    '''[(encoder name, ms/frame, bytes/frame)] for im'''
+    result = []
+    for name in names or encoder_list:
+        enc = create(name)
+        t0 = time.perf_counter()
+        for i in range(rounds):
+            data = enc.encode(im)
+        result.append((name, (time.perf_counter()-t0)*1000/rounds, len(data)))
+    return result
@@ -0,0 +1,664 @@
+'''
+    engine.py
+
+    10/18/2026  Capture engine without Qt
+
+    The capture callbacks (keyboard, mouse, auto, change, record,
+    replay) used to be QObjects in capture.py. They only need a way to
+    report back, so Signal stands in for pyqtSignal: slots run on the
+    emitting thread (a keyboard hook, a scheduler or a writer thread).
+    The GUI forwards them to its own pyqtSignals, which queue them to
+    the Qt thread; cli.py uses the engine with no PyQt5 import at all.
+'''
+import os
+import time
+import threading
+from pathlib import Path
+
+import lazy
+import grab
+import frame
+import pipeline
+import procpool
+import settle
+import wintrack
+import backends
+import encoders
+import scheduler
+import recorder
+import replay
+import region
+import motion
+import archive
+import hotkey
+import manifest
+import instrument
+
+# input hooks load when a capture mode first uses them
+keyboard    = lazy.module('keyboard')
+pyautogui   = lazy.module('pyautogui')
+mouse       = lazy.module('pynput.mouse')
+
+hot_key_list = ['f2' , 'f3' , 'f3', 'f4', 
+                'left', 'up', 'right', 'down']
+file_template = "%s-%03d.%s"              
+# a number is taken by a file of any of these, whatever this session saves
+known_exts = sorted(set([e.ext for e in encoders.encoder_class]+list(recorder.container_ext.values())))
+
+class Signal:
+    '''pyqtSignal stand-in: slots run on the thread that emits.'''
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+class SessionStats:
+    '''What a stats panel shows; nbytes is written so far.'''
+    def __init__(self, frames, depth, encode_ms, nbytes):
+        self.frames = frames
+        self.depth = depth
+        self.encode_ms = encode_ms
+        self.nbytes = nbytes
+
+class Callback:
+    pooled = True   # frames are saved one file each by a WriterPool
+    
+    def __init__(self, title, hot_key, img_num, prefix, interval=0,
+                 workers=2, queue_mb=256, policy='block',
+                 comparator=None, max_dups=0, settler=None, backend='auto',
+                 encoder=None, tick_policy='skip', targets=(), pages=0, verbose=True,
+                 trimmer=None, roi=None, processes=False, shard=False, output='files',
+                 key_policy='coalesce', debounce_ms=50, compare=False):
+        self.print_message  = Signal()   # (str)
+        self.number_changed = Signal()   # (int) next image number
+        self.stop_requested = Signal()   # ()
+        self.rate_changed   = Signal()   # (str) scheduler stats
+        self.title = title
+        self.hot_key = hot_key
+        self.image_number = img_num
+        self.prefix  = prefix
+        self.interval = interval
+        self.pages = pages          # stop after this many pages (frames and duplicates), 0: never
+        self.verbose = verbose      # a "Save ..." message per frame
+        self.frames = 0
+        self.duplicates = 0
+        self.duplicate = False      # the last grab was skipped as a duplicate
+        self.holding = False        # the last grab is held by auto trim
+        self.timer = None
+        self.tracker = wintrack.WindowTracker(title)
+        # more windows cut from the same grab: (title, prefix) each
+        self.targets = [wintrack.Target(t, p, img_num) for t, p in targets]
+        self.crops = []
+        self.writer = self.pool = self.sink = None
+        # every saved file is indexed in the save folder, no file overwrites
+        # one of this or an earlier session
+        self.index = manifest.index()
+        if self.pooled:
+            # zip/tar: the frames go into one archive for the session
+            if output != 'files':
+                self.sink = archive.create(output, prefix)
+            opts = dict(on_saved=self.frame_saved, on_error=self.print_message.emit,
+                        encoder=encoder, index=self.index, sink=self.sink)
+            # workers are processes (shared memory slots) or threads
+            if processes:
+                self.writer = procpool.ProcessWriterPool(workers, queue_mb, policy,
+                                                         shard=shard, **opts)
+            else:
+                self.writer = pipeline.WriterPool(workers, queue_mb, policy, **opts)
+            self.pool = self.writer
+        self.queue_mb = queue_mb
+        self.policy = policy
+        self.encoder = encoder
+        self.comparator = comparator
+        self.max_dups = max_dups
+        self.settler = settler
+        self.trimmer = trimmer      # trim.AutoTrim, grabs only the content box
+        if trimmer is not None and trimmer.on_box is None:
+            trimmer.on_box = self.trim_learnt
+        # a picked region (region.Region) is grabbed instead of the window,
+        # auto trim works inside it
+        self.roi = roi
+        if roi is not None and roi.relative:
+            self.tracker = region.WindowRegionTracker(self.tracker, roi)
+        elif roi is not None:
+            self.tracker = region.ScreenTracker(self.tracker, roi)
+        # a recording takes its frames as they come, screenshots taken
+        # while the trim box is learnt are saved once it is known
+        if trimmer is not None and not self.pooled:
+            trimmer.hold = False
+        self.autotrim = trimmer if self.pooled else None
+        self.backend_name = backend
+        self.tick_policy = tick_policy
+        self.grabber = None
+        self.last_frame = None      # frame.Frame
+        self.key_policy = key_policy
+        self.debounce_ms = debounce_ms
+        self.compare = compare      # measure the old temp-PNG path too (grab.legacy_save)
+        self.keys = None            # hotkey.HotKeyQueue of the hot key or click
+        self.rect = None
+        frame.stats.reset()
+
+    def grab_frame(self):
+        # (im, grab_ms, legacy), None on a failed grab, a duplicate or a
+        # frame held by auto trim
+        self.duplicate = self.holding = False
+        try:
+            if self.grabber is None:
+                self.select_backend(self.tracker.geometry())
+            generation = self.tracker.generation
+            if self.targets:
+                crops, grab_ms, rects = grab.grab_windows(
+                    [self.tracker]+[t.tracker for t in self.targets])
+                im, self.crops, self.rect, legacy = crops[0], crops[1:], rects[0], None
+            else:
+                im, grab_ms, legacy, self.rect = grab.grab_window(self.tracker, self.trimmer,
+                                                                    self.compare)
+        except Exception as e:
+            self.tracker.invalidate()
+            self.print_message.emit(str(e))
+            return None
+        if generation and generation != self.tracker.generation:
+            self.print_message.emit("Window moved ... (%d, %d, %d, %d)"%self.rect)
+        self.last_frame = im
+        if self.autotrim is not None and not self.autotrim.learnt:
+            self.holding = True
+            if self.pages and self.pages_taken() >= self.pages:
+                self.stop_requested.emit()
+            return None
+
+        if self.comparator is not None:
+            with instrument.span('dedupe'):
+                duplicate = self.comparator.is_duplicate(im.image())
+        else:
+            duplicate = False
+        if duplicate:
+            # still a page: auto mode turns it like a saved one, so two
+            # equal pages in a row (a blank separator) do not stall the book
+            self.duplicate = True
+            self.duplicates += 1
+            ndup = self.comparator.consecutive
+            self.print_message.emit("Skip ... duplicate frame (%d in a row)"%ndup)
+            # the viewer stopped advancing: last page reached
+            if self.timer is not None and self.max_dups > 0 and ndup >= self.max_dups:
+                self.print_message.emit("Stopped after %d duplicate frames."%ndup)
+                self.stop_requested.emit()
+            elif self.pages and self.pages_taken() >= self.pages:
+                self.stop_requested.emit()
+            return None
+        return im, grab_ms, legacy
+
+    def pages_taken(self):
+        # saved, skipped as duplicates and held by auto trim
+        held = len(self.autotrim.held) if self.autotrim is not None else 0
+        return self.frames+self.duplicates+held
+
+    def capture(self):
+        # grab on this thread, encode and write on the writer pool
+        if self.pages and self.pages_taken() >= self.pages:
+            return False
+        grabbed = self.grab_frame()
+        if grabbed is None:
+            # a held frame is saved later, the page was taken
+            return self.holding
+        im, grab_ms, legacy = grabbed
+        t = time.time()
+        try:
+            self.save_held()
+            self.submit(im, grab_ms, legacy, t, self.rect)
+            # the other windows are encoded on the pool next to it
+            for target, crop in zip(self.targets, self.crops):
+                target.number = self.free_number(target.prefix, target.number)
+                file = file_template%(target.prefix, target.number, self.writer.encoder.ext)
+                if not self.writer.submit(crop, str(Path.joinpath(Path.cwd(), file)), grab_ms, None,
+                                          (target.prefix, target.number, t, target.tracker.rect)):
+                    self.print_message.emit("Drop ... %s (queue full)"%file)
+                target.number += 1
+        except RuntimeError as e:
+            # the pool is closed or an encoder process died
+            self.print_message.emit(str(e))
+            self.stop_requested.emit()
+            return False
+        self.crops = []
+        if self.pages and self.pages_taken() >= self.pages:
+            self.stop_requested.emit()
+        return True
+
+    def submit(self, im, grab_ms, legacy, t, rect):
+        self.image_number = self.free_number(self.prefix, self.image_number)
+        file = file_template%(self.prefix, self.image_number, self.writer.encoder.ext)
+        path = Path.joinpath(Path.cwd(), file)
+        if not self.writer.submit(im, str(path), grab_ms, legacy,
+                                  (self.prefix, self.image_number, t, rect)):
+            self.print_message.emit("Drop ... %s (queue full)"%file)
+        self.frames += 1
+        self.image_number += 1
+        self.number_changed.emit(self.image_number)
+
+    def save_held(self):
+        # the frames auto trim learnt the box from, cut to it, oldest first
+        if self.autotrim is not None:
+            for im in self.autotrim.release():
+                self.submit(im, 0.0, None, im.t, im.rect)
+
+    def free_number(self, prefix, number, ext=None):
+        # never overwrite a frame of this or an earlier session
+        ext = ext or self.writer.encoder.ext
+        files_of = lambda n: [file_template%(prefix, n, e) for e in known_exts]
+        taken = self.index.taken(prefix, number, files_of(number))
+        if not taken:
+            return number
+        free = self.index.free_number(prefix, number, files_of)
+        self.print_message.emit("Skip ... %s exists, saving as %s"%(
+                                taken, file_template%(prefix, free, ext)))
+        return free
+
+    def stats(self):
+        w = self.pool
+        if w is None:
+            return SessionStats(self.frames, 0, 0.0, 0)
+        return SessionStats(self.frames, w.depth, w.mean_encode_ms, w.bytes_written)
+
+    def create_timer(self, slot):
+        # auto mode: the settle loop re-arms a single shot timer, a fixed
+        # interval runs on the drift-free scheduler thread
+        if self.settler is not None:
+            return scheduler.SingleShot(slot)
+        return scheduler.Scheduler(slot, self.tick_policy,
+                                   on_stats=lambda s: self.rate_changed.emit(str(s)))
+
+    def wait_settle(self):
+        # wait for the page turned by the key or click to finish drawing
+        if self.settler is None:
+            # on a fixed schedule the rest of the period is the wait
+            if not isinstance(self.timer, scheduler.Scheduler):
+                with instrument.span('sleep'):
+                    time.sleep(0.4)
+            return
+        with instrument.span('settle'):
+            settled, sec = self.settler.wait(settle.region_sampler(self.rect),
+                                             settle.reference_sample(self.last_frame.image()))
+        self.print_message.emit("Settle ... %.2f s%s (mean %.2f s)"%(
+                                sec, "" if settled else " timeout", self.settler.mean))
+
+    def next_tick(self, captured):
+        # with a settle detector the auto timer is single shot: capture
+        # right after the page settled, retry after interval otherwise
+        if self.settler is not None and isinstance(self.timer, scheduler.SingleShot):
+            self.timer.start(0 if captured else self.interval)
+
+    def create_keys(self, handler):
+        # presses are handled on the queue's thread, never the hook's
+        return hotkey.HotKeyQueue(handler, self.key_policy, self.debounce_ms,
+                                  on_error=self.print_message.emit)
+
+    def close_keys(self):
+        if self.keys is not None:
+            self.keys.stop()
+            if self.keys.received:
+                self.print_message.emit("Hot key ... %s"%self.keys)
+            self.keys = None
+
+    def trim_learnt(self, box, size):
+        self.print_message.emit("Trim ... (%d, %d, %d, %d) of %dx%d, %.0f%% fewer pixels"%(
+                                box+size+(self.trimmer.saved*100,)))
+
+    def frame_saved(self, report):
+        # called on a writer thread
+        if self.verbose:
+            self.print_message.emit("Save ... %s"%report)
+
+    def select_backend(self, rect):
+        b, timing = backends.select(rect, self.backend_name)
+        for name, ms in sorted(timing.items(), key=lambda t: t[1]):
+            self.print_message.emit("Probe ... %s %.1f ms/grab"%(name, ms))
+        self.print_message.emit("Backend ... %s"%b.name)
+        grab.use_backend(b)
+        self.grabber = b
+
+    def close_session(self):
+        if self.autotrim is not None and self.writer is not None:
+            # stopped while learning: the held frames get the box so far
+            self.autotrim.flush()
+            try:
+                self.save_held()
+            except RuntimeError as e:
+                self.print_message.emit(str(e))
+        if self.writer is not None:
+            self.writer.close()
+            if self.writer.written:
+                self.print_message.emit("Encoder ... %s: %.0f ms/frame, %s/frame (%d frames)"%(
+                                        self.writer.encoder, self.writer.mean_encode_ms,
+                                        grab.format_bytes(self.writer.mean_bytes),
+                                        self.writer.written))
+            self.writer = None
+        # the index opens its file again on the next session's first frame
+        self.index.close()
+        if self.sink is not None:
+            try:
+                self.sink.close()
+            except IOError as e:
+                self.print_message.emit(str(e))
+            self.print_message.emit("Archive ... %s"%self.sink)
+            self.sink = None
+        if frame.stats.frames:
+            # counted once the pool has encoded the last frame
+            allocations, copied = frame.stats.per_frame()
+            self.print_message.emit("Copy ... %.1f pixel buffers, %s copied per frame after the grab"%(
+                                    allocations, grab.format_bytes(copied)))
+        if self.grabber is not None:
+            grab.use_backend(backends.PyAutoGuiBackend())
+            self.grabber = None
+
+class KeyboardCaptureCallback(Callback):
+    def __init__(self, title, hot_key, img_num, prefix, interval=0, **kwargs):
+        super(KeyboardCaptureCallback, self).__init__(title, hot_key, img_num, prefix, interval, **kwargs)
+
+        if self.interval > 0:
+            self.timer = self.create_timer(self.save)
+            self.ipage = 0
+             
+    def save(self):
+        captured = self.capture() or self.duplicate
+        if captured:
+            if self.timer is not None:
+                with instrument.span('key send'):
+                    keyboard.send(self.hot_key)
+            self.wait_settle()
+        self.next_tick(captured)
+            
+    def keyboardEventReceived(self, event):
+        # keyboard hook thread: queue it, the capture runs on self.keys
+        keys = self.keys        # None once stop() has begun
+        if keys is not None and event.name == self.hot_key:
+            keys.post(event.event_type == 'down')
+                
+    def start(self):
+        # hook returns a handle that can be used to "disconnect" the callback
+        # function later, if required; it sees the up events too, which
+        # tell a press from auto repeat
+        if self.timer is not None:
+            self.timer.start(self.interval)
+        else:
+            self.keys = self.create_keys(self.save)
+            self.keys.start()
+            self.hook = keyboard.hook(self.keyboardEventReceived)
+        
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer = None
+        else:
+            keyboard.unhook(self.hook)
+            self.close_keys()
+        self.close_session()
+        
+class MouseCaptureCallback(Callback):
+    def __init__(self, mouse_pos, title, hot_key, img_num, prefix, interval=0, **kwargs):
+        super(MouseCaptureCallback, self).__init__(title, hot_key, img_num, prefix, interval, **kwargs)
+        self._stopped = False
+        self.mouse_pos = mouse_pos
+        self.listener = None
+        self.esc_thread = None
+        
+        if self.interval > 0:
+            self.timer = self.create_timer(self.mouse_click_capture)
+        else:
+            self.listener = mouse.Listener(on_click=self.save)
+ 
+    def save(self, x, y, button, pressed):
+        # listener thread: queue the click, the capture runs on self.keys
+        if self._stopped:
+            return False
+        keys = self.keys
+        if keys is not None:
+            keys.post(pressed)
+        return True
+        
+    def start(self):
+        self._stopped = False
+        # on_press returns a hook that can be used to "disconnect" the callback
+        # function later, if required
+        if self.timer is not None:
+            self.timer.start(self.interval)
+            # Start ESC key monitor thread
+            self.esc_thread = threading.Thread(target=self.esc_watcher, daemon=True)
+            self.esc_thread.start() 
+        else:
+            self.keys = self.create_keys(self.capture)
+            self.keys.start()
+            self.listener.start()
+            
+    def stop(self):
+        self._stopped = True
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer = None
+            self.esc_thread = None
+        else:
+            self.listener.stop()
+            self.listener = None
+            self.close_keys()
+        self.close_session()
+            
+    def mouse_click_capture(self):
+        if self._stopped:
+            return
+            
+        if not (self.capture() or self.duplicate):
+            self.next_tick(False)
+            return
+        
+        if self.settler is None and not isinstance(self.timer, scheduler.Scheduler):
+            with instrument.span('sleep'):
+                time.sleep(0.4)  # slight pause before screenshot
+        x, y = self.mouse_pos
+        with instrument.span('click'):
+            pyautogui.moveTo(x,y)
+            pyautogui.click(x, y)
+        if self.settler is not None:
+            self.wait_settle()
+        self.next_tick(True)
+
+    def esc_watcher(self):
+        try:
+            while not self._stopped:
+                if keyboard.is_pressed('esc'):
+                    self.print_message.emit("Stopped by ESC key.")
+                    # whoever runs the session stops it on its own thread
+                    self.stop_requested.emit()
+                    break
+                time.sleep(0.1)
+        except Exception as e:
+            self.print_message.emit(f"ESC watcher error: {e}")
+
+class ChangeCaptureCallback(Callback):
+    '''
+        Capture on change: the scheduler samples the window every
+        interval ms at a low resolution (motion.MotionDetector) and a
+        full frame is saved only when enough of it changed and the
+        change settled. A moved or resized window is saved at once.
+    '''
+    def __init__(self, title, hot_key, img_num, prefix, interval=0, detector=None, **kwargs):
+        super(ChangeCaptureCallback, self).__init__(title, hot_key, img_num, prefix, interval or 200, **kwargs)
+        self.detector = detector or motion.MotionDetector()
+        self.generation = None
+        self.poll_ms = 0.0
+        self.timer = scheduler.Scheduler(self.poll, self.tick_policy,
+                                         on_stats=lambda s: self.rate_changed.emit(str(s)))
+
+    def poll(self):
+        t0 = time.perf_counter()
+        try:
+            self.tracker.geometry()
+            # the first frame and a moved window are saved as they are
+            moved = self.rect is None or self.tracker.generation != self.generation
+            if moved:
+                due = True
+            else:
+                with instrument.span('motion'):
+                    sample = self.detector.sample(grab.grab_region(*self.rect))
+                    due = self.detector.update(sample, time.monotonic())
+        except Exception as e:
+            self.tracker.invalidate()
+            self.print_message.emit(str(e))
+            return False
+        self.poll_ms += (time.perf_counter()-t0)*1000
+        if not due:
+            return False
+        if not moved:
+            self.print_message.emit("Change ... %.1f%% of the tiles"%(self.detector.changed*100))
+        captured = self.capture()
+        self.generation = self.tracker.generation
+        if self.last_frame is not None:
+            self.detector.reset(self.detector.sample(self.last_frame.image()))
+        return captured
+
+    def start(self):
+        self.timer.start(self.interval)
+
+    def stop(self):
+        self.timer.stop()
+        d = self.detector
+        if d.polls:
+            self.print_message.emit("Change ... %d polls, %.1f ms/poll, %d frames saved"%(
+                                    d.polls, self.poll_ms/d.polls, self.frames))
+        self.close_session()
+
+class RecordCallback(Callback):
+    '''
+        Continuous recording: the scheduler grabs every interval ms and
+        the frames are appended to one container file, named like a
+        screenshot with the start number.
+    '''
+    pooled = False
+
+    def __init__(self, title, hot_key, img_num, prefix, interval=0, container='apng', **kwargs):
+        super(RecordCallback, self).__init__(title, hot_key, img_num, prefix, interval or 100, **kwargs)
+        self.container = container
+        self.file = None
+        self.recorder = None
+        self.timer = scheduler.Scheduler(self.capture, self.tick_policy,
+                                         on_stats=lambda s: self.rate_changed.emit(str(s)))
+
+    def capture(self):
+        grabbed = self.grab_frame()
+        if grabbed is None:
+            return False
+        if not self.recorder.submit(grabbed[0].image(), time.monotonic()-self.t0):
+            self.print_message.emit("Drop ... frame at %.2f s (queue full)"%(time.monotonic()-self.t0))
+        self.frames += 1
+        return True
+
+    def stats(self):
+        r = self.recorder
+        if r is None:
+            return SessionStats(self.frames, 0, 0.0, 0)
+        return SessionStats(self.frames, len(r.queue), r.mean_write_ms, r.nbytes)
+
+    def start(self):
+        ext = recorder.container_ext[self.container]
+        self.image_number = self.free_number(self.prefix, self.image_number, ext)
+        self.file = file_template%(self.prefix, self.image_number, ext)
+        # one file for the whole recording
+        self.number_changed.emit(self.image_number+1)
+        path = str(Path.joinpath(Path.cwd(), self.file))
+        self.recorder = recorder.Recorder(path, self.container, 1000.0/self.interval,
+                                          self.queue_mb, self.policy, self.encoder,
+                                          on_error=self.print_message.emit)
+        self.print_message.emit("Record ... %s"%self.file)
+        self.t0 = time.monotonic()
+        self.timer.start(self.interval)
+
+    def stop(self):
+        self.timer.stop()
+        try:
+            self.recorder.close()
+        except Exception as e:
+            self.print_message.emit(str(e))
+        r = self.recorder
+        self.print_message.emit("Record ... %s: %d frames, %.1f s, %s (%d dropped)"%(
+                                self.file, r.frames, r.duration,
+                                grab.format_bytes(r.nbytes), r.dropped))
+        self.close_session()
+
+class ReplayCallback(Callback):
+    '''
+        Replay: the scheduler grabs every interval ms into a fixed ring,
+        the hot key writes the last seconds (clip) or the sharpest frame
+        of them (best) in the background.
+    '''
+    pooled = False
+
+    def __init__(self, title, hot_key, img_num, prefix, interval=0, seconds=10,
+                 mode='clip', container='apng', backing='memory', **kwargs):
+        super(ReplayCallback, self).__init__(title, hot_key, img_num, prefix, interval or 100, **kwargs)
+        self.mode = mode
+        self.container = container
+        self.replay = replay.Replay(seconds, 1000.0/self.interval, backing,
+                                    on_ring=self.ring_ready,
+                                    on_dumped=self.dumped,
+                                    on_error=self.print_message.emit)
+        self.timer = scheduler.Scheduler(self.capture, self.tick_policy,
+                                         on_stats=lambda s: self.rate_changed.emit(str(s)))
+        self.hook = None
+
+    def capture(self):
+        grabbed = self.grab_frame()
+        if grabbed is None:
+            return False
+        self.replay.push(grabbed[0], time.monotonic())
+        self.frames += 1
+        return True
+
+    def stats(self):
+        return SessionStats(self.frames, 0, 0.0, self.replay.nbytes)
+
+    def ring_ready(self, ring):
+        self.print_message.emit("Replay ... %d frames of %dx%d, %s in %s"%(
+                                ring.slots, ring.size[0], ring.size[1],
+                                grab.format_bytes(ring.nbytes), ring.backing))
+
+    def save(self):
+        encoder = self.encoder or encoders.PngEncoder()
+        ext = encoder.ext if self.mode == 'best' else recorder.container_ext[self.container]
+        self.image_number = self.free_number(self.prefix, self.image_number, ext)
+        file = file_template%(self.prefix, self.image_number, ext)
+        path = str(Path.joinpath(Path.cwd(), file))
+        if not self.replay.dump(path, self.mode, self.container, encoder):
+            self.print_message.emit("Replay ... busy or empty, key ignored")
+
+    def dumped(self, path, frames, ms):
+        # dump thread; the next dump waits for it, so the number is ours
+        self.image_number += 1
+        self.number_changed.emit(self.image_number)
+        self.print_message.emit("Replay ... %s: %d frames in %.0f ms"%(
+                                os.path.basename(path), frames, ms))
+
+    def keyboardEventReceived(self, event):
+        # keyboard hook thread: queue it, the capture runs on self.keys
+        keys = self.keys        # None once stop() has begun
+        if keys is not None and event.name == self.hot_key:
+            keys.post(event.event_type == 'down')
+
+    def start(self):
+        self.timer.start(self.interval)
+        self.keys = self.create_keys(self.save)
+        self.keys.start()
+        self.hook = keyboard.hook(self.keyboardEventReceived)
+
+    def stop(self):
+        if self.hook is not None:
+            keyboard.unhook(self.hook)
+            self.hook = None
+        self.close_keys()
+        self.timer.stop()
+        self.replay.close()
+        ring = self.replay.ring
+        if ring is not None and ring.blocked:
+            self.print_message.emit("Replay ... %d frames skipped while dumping"%ring.blocked)
+        self.close_session()
@@ -0,0 +1,138 @@
+'''
+    frame.py
+
+    10/18/2026  Zero-copy frames
+
+    A Frame is one grab on its way from the backend to the file: the
+    pixels as a numpy array over the backend's own buffer (mss, MIT-SHM,
+    the synthetic page), the screen rectangle, the grab time and a
+    sequence number. It is passed by reference from the grab through
+    crop, dedupe and encode to the write:
+
+      - crop() is a numpy view, no pixel moves: a window cut from one
+        grab of several windows and the auto-trim box are views too
+      - image() makes the PIL image an encoder needs, once; dedupe and
+        the encoder share it
+      - copy_to() puts the pixels straight into an RGBX slot (replay
+        ring, shared memory) with no PIL image in between
+
+    The pixels stay in the backend's channel order (mode is the PIL raw
+    mode: RGB, BGRX), the swap is done by the copy that is made anyway.
+
+    stats counts every pixel buffer allocated after the grab and every
+    byte copied into one; a session reports them per frame.
+'''
+import time
+import itertools
+import threading
+
+import lazy
+
+np  = lazy.module('numpy')
+PIL = lazy.module('PIL', 'PIL.Image')
+
+_seq = itertools.count()
+
+class CopyStats:
+    '''Pixel buffers allocated and bytes copied after the grab.'''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.frames = 0
+            self.allocations = 0
+            self.bytes_copied = 0
+
+    def grabbed(self):
+        with self.lock:
+            self.frames += 1
+
+    def add(self, nbytes, allocations=1):
+        with self.lock:
+            self.allocations += allocations
+            self.bytes_copied += nbytes
+
+    def per_frame(self):
+        '''(allocations, bytes copied) per grabbed frame.'''
+        n = float(max(1, self.frames))
+        return self.allocations/n, self.bytes_copied/n
+
+stats = CopyStats()
+
+class Frame:
+    __slots__ = ('pixels', 'mode', 'rect', 't', 'seq', '_image')
+
+    def __init__(self, pixels, mode='RGB', rect=None, t=None, seq=None):
+        self.pixels = pixels    # (height, width, channels) uint8, may be a view
+        self.mode = mode        # PIL raw mode of the pixels
+        self.rect = rect        # (left, top, right, bottom) on the screen
+        self.t = time.time() if t is None else t
+        self.seq = next(_seq) if seq is None else seq
+        self._image = None
+
+    @classmethod
+    def from_image(cls, im, rect=None):
+        # a backend that only makes PIL images (pyautogui): one copy out,
+        # the image is kept for the encoder
+        if im.mode != 'RGB':
+            im = im.convert('RGB')
+        f = cls(np.asarray(im), 'RGB', rect)
+        f._image = im
+        stats.add(f.nbytes)
+        return f
+
+    @property
+    def size(self):
+        h, w = self.pixels.shape[:2]
+        return w, h
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    @property
+    def nbytes(self):
+        h, w, c = self.pixels.shape
+        return h*w*c
+
+    def crop(self, box):
+        '''A view of box (left, top, right, bottom) of the frame, cut to its size.'''
+        w, h = self.size
+        l, t = min(max(box[0], 0), w), min(max(box[1], 0), h)
+        r, b = max(min(box[2], w), l), max(min(box[3], h), t)
+        rect = self.rect
+        if rect is not None:
+            rect = (rect[0]+l, rect[1]+t, rect[0]+r, rect[1]+b)
+        return Frame(self.pixels[t:b, l:r], self.mode, rect, self.t, self.seq)
+
+    def image(self):
+        '''The frame as an RGB PIL image, made on the first call.'''
+        if self._image is None:
+            px = self.pixels
+            h, w, c = px.shape
+            stride = px.strides[0]
+            # a view's rows are stride bytes apart in the buffer it views
+            flat = np.lib.stride_tricks.as_strided(px, ((h-1)*stride+w*c,), (1,))
+            self._image = PIL.Image.frombuffer('RGB', (w, h), flat, 'raw', self.mode, stride, 1)
+            stats.add(w*h*4)
+        return self._image
+
+    def copy_to(self, out):
+        '''Copies the pixels into out, an (h, w, 4) RGBX array, as much as fits.'''
+        h = min(out.shape[0], self.pixels.shape[0])
+        w = min(out.shape[1], self.pixels.shape[1])
+        src = self.pixels[:h, :w]
+        if self.mode.startswith('BGR'):
+            out[:h, :w, :3] = src[:, :, 2::-1]
+        else:
+            out[:h, :w, :3] = src[:, :, :3]
+        stats.add(h*w*3, 0)
+
+def as_frame(im):
+    return im if isinstance(im, Frame) else Frame.from_image(im)
@@ -0,0 +1,176 @@
+'''
+    grab.py
+
+    10/18/2026  In-memory region grab
+    10/18/2026  Grabs go through the selected backend (backends.py)
+    10/18/2026  One grab for several windows (grab_windows)
+    10/18/2026  Grab cut to the auto-trim box (trim.py)
+    10/18/2026  Windows grab into frame.Frame, crops are views
+
+    Grab only the window rectangle into memory, encode it once and
+    write it with a single call. The old round trip (full desktop ->
+    N-tmp.png -> reopen -> crop -> save -> unlink) is kept in
+    legacy_save() so a session can measure what each frame saves. It
+    only runs when asked for (compare), once per size, on a thread of
+    its own: it never fails or delays a real grab.
+'''
+import os
+import time
+import tempfile
+import threading
+
+import lazy
+import frame
+import backends
+import instrument
+
+PIL = lazy.module('PIL', 'PIL.Image')
+
+backend = backends.PyAutoGuiBackend()
+
+def use_backend(b):
+    global backend
+    if b is not backend:
+        backend.close()
+    backend = b
+
+def grab_region(left, top, right, bottom):
+    return backend.grab(left, top, right, bottom)
+
+def grab_frame(left, top, right, bottom):
+    return backend.grab_frame(left, top, right, bottom)
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+def grab_window(tracker, trimmer=None, compare=False):
+    '''
+        Grab the tracked window. Returns (frame.Frame, grab ms, legacy
+        cost, rect). tracker is a wintrack.WindowTracker or anything
+        with geometry() and activate(). With a trim.AutoTrim only its
+        box of the window is grabbed (and rect is that box on screen).
+        legacy is None unless compare and the old path was measured.
+    '''
+    left, top, right, bottom = tracker.geometry()
+    tracker.activate()
+    legacy = legacy_cost(left, top, right, bottom) if compare else None
+    box = trimmer.box_for((right-left, bottom-top)) if trimmer is not None else None
+    if box is not None:
+        left, top, right, bottom = left+box[0], top+box[1], left+box[2], top+box[3]
+
+    t0 = time.perf_counter()
+    im = grab_frame(left, top, right, bottom)
+    t1 = time.perf_counter()
+    instrument.record('grab', t0, t1)
+    frame.stats.grabbed()
+    if trimmer is not None and box is None:
+        with instrument.span('trim'):
+            im, box = trimmer.learn(im)
+        left, top, right, bottom = left+box[0], top+box[1], left+box[2], top+box[3]
+    return im, (t1-t0)*1000, legacy, (left, top, right, bottom)
+
+def union_rect(rects):
+    return (min(r[0] for r in rects), min(r[1] for r in rects),
+            max(r[2] for r in rects), max(r[3] for r in rects))
+
+def grab_windows(trackers):
+    '''
+        One grab of the rectangle around all tracked windows, cut into
+        one crop per tracker; the crops are views of the grab, no copy.
+        Only the first tracker is activated (it gets the hot key); the
+        others have to be visible. Returns (crops, grab ms, rects).
+    '''
+    rects = [t.geometry() for t in trackers]
+    trackers[0].activate()
+    left, top, right, bottom = union_rect(rects)
+
+    t0 = time.perf_counter()
+    im = grab_frame(left, top, right, bottom)
+    t1 = time.perf_counter()
+    frame.stats.grabbed()
+    crops = [im.crop((l-left, t-top, r-left, b-top)) for l, t, r, b in rects]
+    t2 = time.perf_counter()
+    instrument.record('grab', t0, t1)
+    instrument.record('crop', t1, t2)
+    return crops, (t2-t0)*1000, rects
+
+def legacy_save(left, top, right, bottom, folder=None):
+    '''
+        The temp-PNG path save_screenshot used before. Returns
+        (ms, disk bytes touched): temp write + temp read + crop write.
+    '''
+    import pyautogui
+    folder = folder or tempfile.gettempdir()
+    temp_path = os.path.join(folder, "%d-tmp.png"%os.getpid())
+    crop_path = os.path.join(folder, "%d-crop.png"%os.getpid())
+
+    t0 = time.perf_counter()
+    pyautogui.screenshot(temp_path)
+    im = PIL.Image.open(temp_path)
+    im = im.crop((left, top, right, bottom))
+    im.save(crop_path)
+    ms = (time.perf_counter()-t0)*1000
+
+    nbytes = 2*os.path.getsize(temp_path) + os.path.getsize(crop_path)
+    os.unlink(temp_path)
+    os.unlink(crop_path)
+    return ms, nbytes
+
+# legacy cost per rectangle size, measured once per process; None
+# while it is measured or when it failed (no pyautogui, no display)
+_legacy_cost = {}
+_legacy_lock = threading.Lock()
+
+def _measure_legacy(key, rect):
+    try:
+        _legacy_cost[key] = legacy_save(*rect)
+    except Exception:
+        pass
+
+def legacy_cost(left, top, right, bottom):
+    # nothing to compare with when the frames do not come from the screen
+    if not backend.screen:
+        return None
+    key = (right-left, bottom-top)
+    with _legacy_lock:
+        if key in _legacy_cost:
+            return _legacy_cost[key]
+        _legacy_cost[key] = None
+    threading.Thread(target=_measure_legacy, args=(key, (left, top, right, bottom)),
+                     daemon=True).start()
+    return None
+
+def format_bytes(n):
+    for unit in ('B', 'KB', 'MB'):
+        if abs(n) < 1024:
+            return "%.0f %s"%(n, unit) if unit == 'B' else "%.1f %s"%(n, unit)
+        n /= 1024.0
+    return "%.1f GB"%n
+
+class FrameReport:
+    '''Cost of one saved frame and what it saved against legacy_save().'''
+    def __init__(self, file, nbytes, ms, legacy=None, encode_ms=None):
+        self.file = file
+        self.nbytes = nbytes
+        self.ms = ms
+        self.legacy = legacy
+        self.encode_ms = encode_ms
+
+    @property
+    def saved_ms(self):
+        return self.legacy[0] - self.ms if self.legacy else 0.0
+
+    @property
+    def saved_bytes(self):
+        return self.legacy[1] - self.nbytes if self.legacy else 0
+
+    def __str__(self):
+        s = "%s (%s, %.0f ms"%(self.file, format_bytes(self.nbytes), self.ms)
+        if self.encode_ms is not None:
+            s += ", enc %.0f ms"%self.encode_ms
+        if self.legacy:
+            s += "; saved %s, %.0f ms vs temp-PNG"%(
+                    format_bytes(self.saved_bytes), self.saved_ms)
+        return s + ")"
@@ -0,0 +1,138 @@
+'''
+    hotkey.py
+
+    10/18/2026  Hot key event queue
+
+    The keyboard (or mouse) hook used to run the whole capture: grab,
+    submit, key send, settle wait. Meanwhile the OS hook was blocked,
+    key repeat piled up and typing in other programs lagged. Now the
+    hook only appends (time, down) to a deque (no lock, one bound
+    check) and sets an event; the HotKeyQueue thread turns what it
+    finds into triggers and runs them one at a time:
+
+      - auto repeat: a down while the key is still down is no press
+      - debounce: a press within debounce_ms of the last one is no press
+      - presses that come while a trigger runs follow policy:
+
+            coalesce : together they make one more trigger
+            queue    : each is a trigger, max_pending waiting at most
+            drop     : ignored
+
+    Counters: received (downs from the hook), handled (triggers run),
+    coalesced (repeats, bounces, merged presses) and dropped (over
+    max_pending, ignored while busy, or the deque was full).
+'''
+import time
+import threading
+from collections import deque
+
+import instrument
+
+policy_list = ['coalesce', 'queue', 'drop']
+max_events = 256    # hook events the queue thread has not seen yet
+stale_s = 1.0       # no repeat for this long: the key's up event got lost
+
+class HotKeyQueue:
+    def __init__(self, handler, policy='coalesce', debounce_ms=50, max_pending=8, on_error=None):
+        if policy not in policy_list:
+            raise ValueError("Unknown hot key policy: %s"%policy)
+        self.handler = handler
+        self.policy = policy
+        self.debounce = debounce_ms/1000.0
+        self.max_pending = max(1, max_pending)
+        self.on_error = on_error
+        self.events = deque()
+        self.wake = threading.Event()
+        self.pending = deque()      # times of the presses still to handle
+        self.received = 0
+        self.handled = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.overflow = 0           # written by the hook thread only
+        self.hook_max = 0.0         # slowest post(), seconds
+        self.down = False
+        self.last_down = 0.0
+        self.last_press = None
+        self._stop = False
+        self._thread = None
+
+    def post(self, down=True):
+        '''The hook callback's only work: record the event and return.'''
+        t = time.perf_counter()
+        if len(self.events) >= max_events:
+            self.overflow += 1
+        else:
+            self.events.append((t, down))
+            self.wake.set()
+        dt = time.perf_counter()-t
+        if dt > self.hook_max:
+            self.hook_max = dt
+
+    def start(self):
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        '''Presses not handled yet are dropped; waits for a running trigger.'''
+        self._stop = True
+        self.wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            if self._stop:
+                break
+            self._take(False)
+            while self.pending and not self._stop:
+                t = self.pending.popleft()
+                instrument.record('key wait', t)
+                try:
+                    self.handler()
+                except Exception as e:
+                    if self.on_error:
+                        self.on_error(str(e))
+                self.handled += 1
+                # what came in meanwhile
+                self._take(True)
+        self.dropped += len(self.pending)
+        self.pending.clear()
+
+    def _take(self, busy):
+        # hook events -> presses -> pending triggers
+        while self.events:
+            t, down = self.events.popleft()
+            if not down:
+                self.down = False
+                continue
+            self.received += 1
+            if self.down and t-self.last_down < stale_s:
+                self.last_down = t
+                self.coalesced += 1     # auto repeat
+                continue
+            self.down = True
+            self.last_down = t
+            if self.last_press is not None and t-self.last_press < self.debounce:
+                self.coalesced += 1
+                continue
+            self.last_press = t
+            self._press(t, busy)
+
+    def _press(self, t, busy):
+        if self.policy == 'drop' and (busy or self.pending):
+            self.dropped += 1
+        elif self.policy == 'coalesce' and self.pending:
+            self.coalesced += 1
+        elif self.policy == 'queue' and len(self.pending) >= self.max_pending:
+            self.dropped += 1
+        else:
+            self.pending.append(t)
+
+    def __str__(self):
+        return "%d received, %d handled, %d coalesced, %d dropped, hook %.0f us max"%(
+               self.received, self.handled, self.coalesced, self.dropped+self.overflow,
+               self.hook_max*1e6)
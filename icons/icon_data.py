@@ -0,0 +1,620 @@
+'''
+    icon_data.py
+
+    Premultiplied ARGB32 pixels of the icon_*.py tables,
+    made by make_icons.py
+'''
+capture = (48, 48,
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x1c\xb2\xff4\x1f\xb2\xff4\x1f\xb2\xff4\x1f\xb3\xff4 \xb6\xff'
+    b'4 \xb6\xff3\x1e\xb7\xff4\x1f\xb2\xff4\x1f\xb2\xff0\x1c\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'4 \xb3\xff4 \xb6\xff6 \xba\xff6 \xba\xff6 \xba\xff8!\xbb\xff8!\xbb\xff8!\xbb\xff'
+    b'6 \xba\xff6 \xba\xff6 \xba\xff6 \xba\xff6 \xba\xff6 \xba\xff4 \xb6\xff4 \xb3\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x1c\xb2\xff4 \xb6\xff6 \xba\xff'
+    b'6 \xba\xff8!\xbb\xff8!\xbb\xff8!\xbc\xff<$\xbf\xff<$\xbf\xff<$\xbf\xff<$\xbf\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbb\xff8!\xbb\xff6 \xba\xff'
+    b'6 \xba\xff4 \xb6\xff0\x1c\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x004 \xb6\xff6 \xba\xff6 \xba\xff8!\xbb\xff'
+    b'8!\xbc\xff;$\xbf\xff;$\xbf\xff<$\xbf\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xbf\xff<$\xbf\xff;$\xbf\xff8!\xbc\xff'
+    b'8!\xbb\xff6 \xba\xff6 \xba\xff4 \xb6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x004\x1f\xb2\xff5\x1f\xbb\xff6 \xba\xff8!\xbb\xff8!\xbc\xff8!\xbc\xff'
+    b';$\xbf\xff<$\xbf\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xbf\xff;$\xbf\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbb\xff6 \xba\xff6 \xba\xff4\x1f\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x004 \xb6\xff6 \xba\xff8!\xbb\xff8!\xbc\xff8!\xbc\xff<$\xbf\xff<$\xbf\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xbf\xff<$\xbf\xff8!\xbc\xff8!\xbc\xff8!\xbb\xff6 \xba\xff4 \xb6\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'4 \xb6\xff6 \xba\xff8!\xbb\xff8!\xbc\xff;$\xbf\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xbf\xff;$\xbf\xff8!\xbc\xff8!\xbb\xff6 \xba\xff4 \xb6\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x003\x1e\xb7\xff'
+    b'6 \xba\xff8!\xbc\xff8!\xbc\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff8!\xbc\xff8!\xbc\xff6 \xba\xff'
+    b'3\x1e\xb7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x004 \xb6\xff5\x1f\xbb\xff'
+    b'8!\xbc\xff8!\xbc\xff;$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff;$\xbf\xff8!\xbc\xff8!\xbc\xff'
+    b'5\x1f\xbb\xff4 \xb6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x003\x1e\xb7\xff5\x1f\xbb\xff8!\xbb\xff'
+    b'8!\xbc\xff8!\xbc\xff<$\xbf\xff<$\xbf\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xbf\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbb\xff5\x1f\xbb\xff3\x1e\xb7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x1c\xb2\xff3\x1e\xb7\xff6 \xba\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff'
+    b'<$\xc0\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff6 \xba\xff3\x1e\xb7\xff0\x1c\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x003\x1e\xb7\xff5\x1f\xbb\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff'
+    b'8!\xbc\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'<$\xbf\xff<$\xbf\xff<$\xbf\xff<$\xbf\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'<$\xc0\xff8!\xbc\xff8!\xbc\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff5\x1f\xbb\xff3\x1e\xb7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x1c\xb2\xff3\x1e\xb9\xff5\x1f\xbb\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff<$\xbf\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xffXD\xc8\xff\xc5\xbf\xec\xff\xe7\xe5\xf7\xff\xe9\xe7\xf8\xff\xe9\xe7\xf8\xff\xe9\xe7\xf8\xff'
+    b'\xe9\xe7\xf8\xff\xe9\xe7\xf8\xff\xe9\xe7\xf8\xff\xe9\xe7\xf8\xff\xd6\xd1\xf1\xffsc\xd2\xff8!\xbc\xff8!\xbc\xff'
+    b'<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff5\x1f\xbb\xff3\x1e\xb9\xff0\x1c\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00.\x1b\xad\xff3\x1e\xb7\xff5\x1f\xbb\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff\xdc\xd8\xf3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xf8\xfd\xffO9\xc5\xff8!\xbc\xff'
+    b'<$\xc0\xff8!\xbc\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff5\x1f\xbb\xff3\x1e\xb7\xff.\x1b\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x000\x1c\xb2\xff3\x1e\xb9\xff5\x1f\xbb\xff7 \xbd\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xffve\xd2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa4\x9a\xe1\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff7 \xbd\xff5\x1f\xbb\xff3\x1e\xb9\xff0\x1c\xb2\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x003\x1e\xb7\xff3\x1e\xb9\xff6\x1f\xbc\xff8!\xbc\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff<$\xc0\xff<$\xc0\xffm\\\xcf\xff\x95\x88\xdc\xff\x9a\x8e\xde\xff\x9a\x8e\xde\xff'
+    b'\x9a\x8e\xde\xff\xdc\xd8\xf3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf4\xf3\xfb\xff\x9a\x8e\xde\xff'
+    b'\x9a\x8e\xde\xff\x9a\x8e\xde\xff\x95\x88\xdc\xffve\xd2\xff<$\xc0\xff<$\xc0\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff8!\xbc\xff6\x1f\xbc\xff3\x1e\xb9\xff3\x1e\xb7\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00.\x1b\xad\xff3\x1e\xb7\xff3\x1e\xb9\xff6\x1f\xbc\xff7 \xbd\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff<$\xc0\xff\xc3\xbc\xeb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd6\xd1\xf1\xffF/\xc2\xff8!\xbc\xff8!\xbc\xff'
+    b'8!\xbc\xff8!\xbc\xff7 \xbd\xff6\x1f\xbc\xff3\x1e\xb9\xff3\x1e\xb7\xff.\x1b\xad\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00.\x1b\xb2\xff3\x1e\xb9\xff5\x1f\xbb\xff6\x1f\xbc\xff7 \xbd\xff8!\xbc\xff8!\xbc\xff'
+    b'7 \xbd\xff8!\xbc\xff\x90\x85\xd9\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa6\x9c\xe2\xff8!\xbc\xff7 \xbd\xff'
+    b'8!\xbc\xff8!\xbc\xff7 \xbd\xff6\x1f\xbc\xff5\x1f\xbb\xff3\x1e\xb9\xff.\x1b\xb2\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00/\x1a\xb7\xff3\x1e\xb9\xff6\x1f\xbc\xff6\x1f\xbc\xff7 \xbd\xff7 \xbd\xff7 \xbd\xff'
+    b'7 \xbd\xff7 \xbd\xff\xac\xa3\xe4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf4\xf3\xfb\xff'
+    b'\xf3\xf2\xfb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbf\xb8\xea\xff7 \xbd\xff7 \xbd\xff'
+    b'7 \xbd\xff7 \xbd\xff7 \xbd\xff6\x1f\xbc\xff6\x1f\xbc\xff3\x1e\xb9\xff/\x1a\xb7\xff\x00\x00\x00\x00'
+    b'*\x18\xab\xff/\x1a\xb7\xff3\x1e\xb9\xff5\x1f\xbb\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe7\xe5\xf7\xff\x8a}\xd8\xffO9\xc5\xff7 \xbd\xff'
+    b'6\x1f\xbc\xffG3\xc3\xff\x81s\xd5\xff\xdf\xdc\xf4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbf\xb8\xea\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff5\x1f\xbb\xff3\x1e\xb9\xff/\x1a\xb7\xff*\x18\xab\xff'
+    b'*\x18\xac\xff/\x1a\xb7\xff3\x1e\xb9\xff3\x1e\xb9\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbb\xb3\xe8\xff>)\xc0\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff;$\xbf\xff\xac\xa3\xe4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff3\x1e\xb9\xff3\x1e\xb9\xff/\x1a\xb7\xff*\x18\xac\xff'
+    b'*\x17\xad\xff/\x1a\xb7\xff3\x1e\xb9\xff3\x1e\xb9\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xc3\xbc\xeb\xff7 \xbd\xff6\x1f\xbc\xffG3\xc3\xff\x9d\x93\xdf\xff\xcd\xc8\xee\xff'
+    b'\xcd\xc8\xee\xff\xa4\x9a\xe1\xffO9\xc5\xff6\x1f\xbc\xff6\x1f\xbc\xff\xb3\xaa\xe6\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff3\x1e\xb9\xff3\x1e\xb9\xff/\x1a\xb7\xff*\x17\xad\xff'
+    b'*\x17\xad\xff/\x1a\xb7\xff3\x1e\xb9\xff3\x1e\xb9\xff6\x1f\xbc\xff3\x1d\xbc\xff6\x1f\xbc\xff6\x1f\xbc\xff'
+    b'3\x1d\xbc\xff6\x1f\xbc\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xf7\xf6\xfc\xffG3\xc3\xff6\x1f\xbc\xff[I\xc9\xff\xed\xeb\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xf2\xfb\xffiY\xcd\xff6\x1f\xbc\xff>)\xbe\xff\xed\xeb\xf9\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff6\x1f\xbc\xff3\x1d\xbc\xff'
+    b'6\x1f\xbc\xff6\x1f\xbc\xff3\x1d\xbc\xff6\x1f\xbc\xff3\x1e\xb9\xff3\x1e\xb9\xff/\x1a\xb7\xff*\x17\xad\xff'
+    b'*\x17\xad\xff/\x1a\xb7\xff1\x1b\xb9\xff3\x1e\xb9\xff3\x1d\xbc\xff3\x1e\xb9\xff3\x1d\xbc\xff3\x1d\xbc\xff'
+    b'3\x1e\xb9\xff3\x1d\xbc\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xb0\xa7\xe4\xff3\x1d\xbc\xff8!\xbc\xff\xe3\xe0\xf5\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xee\xec\xf9\xff@,\xc0\xff3\x1e\xb9\xff\x9d\x93\xdf\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff3\x1d\xbc\xff3\x1e\xb9\xff'
+    b'3\x1d\xbc\xff3\x1d\xbc\xff3\x1e\xb9\xff3\x1d\xbc\xff3\x1e\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff*\x17\xad\xff'
+    b'*\x17\xad\xff/\x1a\xb7\xff1\x1b\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff'
+    b'3\x1e\xb9\xff3\x1e\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xffyk\xd3\xff3\x1e\xb9\xffsc\xd2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x86y\xd7\xff3\x1e\xb9\xffeU\xcb\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff3\x1e\xb9\xff3\x1e\xb9\xff'
+    b'3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff*\x17\xad\xff'
+    b'(\x16\xab\xff/\x1a\xb7\xff/\x1a\xb7\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff'
+    b'3\x1e\xb9\xff3\x1e\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xffaQ\xca\xff3\x1e\xb9\xff\x95\x88\xdc\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa9\xa0\xe2\xff3\x1e\xb9\xffO=\xc4\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff3\x1e\xb9\xff3\x1e\xb9\xff'
+    b'3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff/\x1a\xb7\xff/\x1a\xb7\xff(\x16\xab\xff'
+    b"'\x15\xaa\xff/\x1a\xb7\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff3\x1e\xb9\xff3\x1e\xb9\xff"
+    b'1\x1b\xb9\xff3\x1e\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xffiY\xcd\xff3\x1e\xb9\xff\x8a}\xd8\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9d\x93\xdf\xff1\x1b\xb9\xffXD\xc8\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff3\x1e\xb9\xff1\x1b\xb9\xff'
+    b"3\x1e\xb9\xff3\x1e\xb9\xff1\x1b\xb9\xff3\x1e\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff/\x1a\xb7\xff'\x15\xaa\xff"
+    b"'\x15\xaa\xff.\x1b\xb2\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff"
+    b'1\x1b\xb9\xff1\x1b\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\x90\x85\xd9\xff1\x1b\xb9\xffO=\xc4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffaQ\xca\xff1\x1b\xb9\xff|o\xd3\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b"1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff.\x1b\xb2\xff'\x15\xaa\xff"
+    b'%\x14\xa6\xff+\x18\xb2\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xd8\xd4\xf2\xff3\x1e\xb9\xff1\x1b\xb9\xff\xa2\x99\xdf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\xae\xe6\xff1\x1b\xb9\xff1\x1b\xb9\xff\xc5\xbf\xec\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff+\x18\xb2\xff%\x14\xa6\xff'
+    b'\x00\x00\x00\x00*\x17\xb1\xff/\x1a\xb7\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff|o\xd3\xff1\x1b\xb9\xff3\x1e\xb9\xff\x95\x88\xdc\xff\xf7\xf6\xfc\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xf9\xf8\xfd\xff\xa2\x99\xdf\xff6 \xba\xff1\x1b\xb9\xffiY\xcd\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff/\x1a\xb7\xff*\x17\xb1\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00*\x17\xad\xff.\x1b\xb2\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xf4\xf3\xfb\xff^N\xc8\xff1\x1b\xb9\xff1\x1b\xb9\xff8!\xbc\xffeU\xcb\xff'
+    b'eU\xcb\xff>)\xbe\xff1\x1b\xb9\xff1\x1b\xb9\xffRA\xc4\xff\xed\xeb\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff.\x1b\xb2\xff*\x17\xad\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00%\x14\xa6\xff*\x17\xb1\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff1\x1b\xb9\xff1\x1b\xb9\xff'
+    b'/\x1a\xb7\xff1\x1b\xb9\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf7\xf6\xfc\xff\x8b\x7f\xd7\xff6 \xba\xff1\x1b\xb9\xff/\x1a\xb7\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff5\x1f\xbb\xff\x81s\xd5\xff\xf3\xf2\xfb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff1\x1b\xb9\xff/\x1a\xb7\xff'
+    b'1\x1b\xb9\xff1\x1b\xb9\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff*\x17\xb1\xff%\x14\xa6\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00*\x17\xad\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff\xa9\xa0\xe2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xed\xeb\xf9\xff\xb0\xa7\xe4\xff\x8f\x83\xd8\xff'
+    b'\x8f\x83\xd8\xff\xa9\xa0\xe2\xff\xe7\xe5\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\xb6\xe9\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff*\x17\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00'\x15\xaa\xff*\x17\xb1\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff"
+    b'/\x1a\xb7\xff/\x1a\xb7\xff\xa2\x99\xdf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\xae\xe6\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b"/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff*\x17\xb1\xff'\x15\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00#\x13\xa1\xff*\x17\xad\xff+\x18\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff=)\xbb\xff\xd6\xd1\xf1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe3\xe0\xf5\xffH5\xbf\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff+\x18\xb2\xff*\x17\xad\xff#\x13\xa1\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\x15\xaa\xff*\x17\xb1\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff"
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff8$\xb9\xff\xa4\x9a\xe1\xff\xf0\xef\xf9\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff'
+    b'\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff'
+    b'\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff'
+    b'\xf9\xf8\xfd\xff\xf9\xf8\xfd\xff\xf3\xf2\xfb\xff\xb3\xac\xe4\xffA.\xbc\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b"/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff*\x17\xb1\xff'\x15\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\x16\xad\xff*\x17\xb1\xff.\x1b\xb2\xff/\x1a\xb7\xff"
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b"/\x1a\xb7\xff.\x1b\xb2\xff*\x17\xb1\xff'\x16\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00#\x13\xa1\xff*\x17\xad\xff*\x17\xb1\xff.\x1b\xb2\xff'
+    b'.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff'
+    b'.\x1b\xb2\xff*\x17\xb1\xff*\x17\xad\xff#\x13\xa1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00%\x14\xa6\xff*\x17\xad\xff*\x17\xb1\xff'
+    b'+\x18\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff.\x1b\xb2\xff+\x18\xb2\xff'
+    b'*\x17\xb1\xff*\x17\xad\xff%\x14\xa6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\x15\xaa\xff*\x17\xad\xff"
+    b'*\x17\xb1\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff.\x1b\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff/\x1a\xb7\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff'
+    b"*\x17\xad\xff'\x15\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\x15\xaa\xff"
+    b'*\x17\xad\xff*\x17\xad\xff+\x18\xb2\xff.\x1b\xb2\xff.\x1b\xb2\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff'
+    b'/\x1a\xb7\xff/\x1a\xb7\xff*\x17\xb1\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b'/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff.\x1b\xb2\xff.\x1b\xb2\xff+\x18\xb2\xff*\x17\xb1\xff*\x17\xad\xff'
+    b"'\x15\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"'\x15\xaa\xff'\x16\xad\xff*\x17\xb1\xff+\x18\xb2\xff+\x18\xb2\xff.\x1b\xb2\xff.\x1b\xb2\xff/\x1a\xb7\xff"
+    b'/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff*\x17\xb1\xff+\x18\xb2\xff'
+    b'/\x1a\xb7\xff,\x18\xb4\xff*\x17\xb1\xff*\x17\xb1\xff/\x1a\xb7\xff.\x1b\xb2\xff/\x1a\xb7\xff/\x1a\xb7\xff'
+    b"/\x1a\xb7\xff.\x1b\xb2\xff.\x1b\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff'\x16\xad\xff'\x15\xaa\xff"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00$\x14\xa7\xff'\x16\xad\xff*\x17\xad\xff*\x17\xb1\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff"
+    b'+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff'
+    b'+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff'
+    b"+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff*\x17\xad\xff'\x16\xad\xff%\x14\xa6\xff\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00#\x13\xa1\xff'\x15\xaa\xff'\x16\xad\xff*\x17\xad\xff*\x17\xb1\xff*\x17\xb1\xff"
+    b'+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff.\x1b\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff'
+    b'.\x1b\xb2\xff.\x1b\xb2\xff+\x18\xb2\xff.\x1b\xb2\xff.\x1b\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff'
+    b"*\x17\xb1\xff*\x17\xb1\xff*\x17\xad\xff'\x16\xad\xff'\x15\xaa\xff#\x13\xa1\xff\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00$\x13\xa5\xff'\x15\xaa\xff'\x16\xad\xff*\x17\xad\xff"
+    b'*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff'
+    b'+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff+\x18\xb2\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff'
+    b"*\x17\xad\xff'\x16\xad\xff'\x15\xaa\xff#\x13\xa4\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x11\x9c\xff$\x13\xa5\xff'\x16\xad\xff"
+    b"'\x16\xad\xff*\x17\xad\xff*\x17\xad\xff*\x17\xad\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff"
+    b"*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xb1\xff*\x17\xad\xff*\x17\xad\xff*\x17\xad\xff'\x16\xad\xff"
+    b"'\x16\xad\xff$\x13\xa5\xff!\x11\x9c\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b"!\x11\x9c\xff$\x13\xa5\xff'\x15\xaa\xff'\x15\xaa\xff'\x16\xad\xff'\x16\xad\xff'\x16\xad\xff'\x16\xad\xff"
+    b"'\x16\xad\xff'\x16\xad\xff'\x16\xad\xff'\x16\xad\xff'\x15\xaa\xff'\x15\xaa\xff$\x13\xa5\xff!\x11\x9c\xff"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x11\x9c\xff#\x13\xa1\xff#\x13\xa1\xff#\x13\xa1\xff#\x13\xa4\xff'
+    b'#\x13\xa4\xff#\x13\xa1\xff#\x13\xa1\xff#\x13\xa1\xff!\x11\x9c\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
+folder_open = (16, 16,
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x001\x83\xa4\xff\x9c\xe9\xf4\xff\x9a\xe9\xf4\xff\x95\xe6\xf4\xff\x8e\xe3\xf3\xff\x86\xdf\xf2\xff~\xdb\xf0\xff'
+    b'O\xb0\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'E\xa2\xc6\xffx\xcc\xe1\xff\x9a\xe9\xf4\xff\x94\xe6\xf4\xff\x8d\xe2\xf3\xff\x86\xde\xf2\xff~\xda\xf0\xffu\xd6\xef\xff'
+    b'b\xc7\xe6\xffF\xac\xd2\xffA\xaa\xd1\xff=\xa7\xd1\xff8\xa4\xd0\xff3\xa0\xcd\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'X\xb2\xd0\xff\x9a\xe8\xf4\xff\x94\xe5\xf4\xff\x8d\xe2\xf3\xff\x85\xde\xf1\xff}\xda\xf0\xfft\xd6\xef\xffk\xd1\xee\xff'
+    b'b\xcc\xec\xffX\xc7\xeb\xffN\xc0\xe8\xffQ\xb1\xd3\xffo\xc5\xdc\xffo\xc5\xdc\xff/\x82\xa4\xff\x00\x00\x00\x00'
+    b'R\xae\xce\xff\x86\xda\xec\xff]\xb8\xd6\xffc\xbe\xda\xffa\xbd\xda\xff`\xbc\xd9\xff^\xbc\xd9\xff\\\xbb\xd9\xff'
+    b'[\xba\xd9\xffY\xb9\xd8\xffW\xb7\xd7\xff\x8a\xde\xef\xff\x93\xe5\xf3\xff\x93\xe5\xf3\xffi\xc2\xdc\xffA\xa1\xc6\xff'
+    b'J\xa6\xc8\xffl\xc6\xdf\xffx\xd4\xec\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff'
+    b'\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xff\x7f\xdb\xf1\xffN\xad\xcf\xff'
+    b'C\x9c\xbe\xff\\\xba\xd9\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xff'
+    b'h\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xffh\xcf\xed\xff7\x94\xb9\xff'
+    b';\x92\xb3\xffL\xb2\xd6\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xff'
+    b'O\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffO\xc2\xea\xffN\xc1\xe9\xff\x00\x00\x00\x00'
+    b'5\x89\xaa\xff7\xa7\xd4\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff'
+    b'6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff6\xb5\xe6\xff5\xae\xdd\xff\x00\x00\x00\x00'
+    b')z\x9b\xff$\xa1\xd6\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff'
+    b'\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff\x1f\xa9\xe3\xff%\xa0\xd3\xff\x00\x00\x00\x00'
+    b'$q\x92\xff\x11\x9e\xdb\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff'
+    b'\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff\r\xa0\xe0\xff!\x97\xca\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x1d\x95\xc9\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff'
+    b"\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff\x1c\x95\xca\xff'\x8a\xb4\xff\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
+refresh = (48, 48,
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff'
+    b'///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff'
+    b'///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff'
+    b'\x00\x00\x00\x00000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff\x00\x00\x00\x00'
+    b'000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'///\xff000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00000\xff000\xff000\xff///\xff000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff'
+    b'000\xff///\xff000\xff000\xff///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff///\xff000\xff000\xff///\xff000\xff000\xff'
+    b'000\xff///\xff\x00\x00\x00\x00\x00\x00\x00\x00///\xff000\xff000\xff///\xff'
+    b'000\xff000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff///\xff///\xff///\xff'
+    b'///\xff///\xff///\xff///\xff///\xff///\xff///\xff\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00///\xff///\xff///\xff'
+    b'///\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff000\xff///\xff'
+    b'000\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00000\xff///\xff'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
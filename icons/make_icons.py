@@ -0,0 +1,43 @@
+'''
+    make_icons.py
+
+    10/18/2026  Precompiled icons
+
+    Renders the XPM tables of icon_*.py once and writes their pixels
+    to icon_data.py as (width, height, bytes) in QImage's premultiplied
+    ARGB32 layout (little endian). The GUI wraps those bytes in a
+    QImage directly instead of parsing the XPM text on every start.
+    Run it again after editing an icon:
+
+        python icons/make_icons.py
+'''
+import os
+import sys
+
+from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtWidgets import QApplication
+
+names = ['capture', 'folder_open', 'refresh']
+
+def pixels(table):
+    im = QPixmap(table).toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return im.width(), im.height(), bytes(im.constBits().asstring(im.sizeInBytes()))
+
+def main():
+    app = QApplication(sys.argv)
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, here)
+    lines = ["'''", "    icon_data.py", "",
+             "    Premultiplied ARGB32 pixels of the icon_*.py tables,",
+             "    made by make_icons.py", "'''"]
+    for name in names:
+        width, height, data = pixels(__import__('icon_'+name).table)
+        lines.append("%s = (%d, %d,"%(name, width, height))
+        for i in range(0, len(data), 32):
+            lines.append("    %r"%data[i:i+32])
+        lines.append(")")
+    with open(os.path.join(here, 'icon_data.py'), 'w') as f:
+        f.write("\n".join(lines)+"\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+'''
+    instrument.py
+
+    10/18/2026  Per-stage timing of the capture hot path
+
+    Each stage of a frame (window lookup, geometry, activate, grab,
+    crop, dedupe, encode, write, key send, click, sleep/settle) is
+    timed into a histogram per stage and, for a Chrome trace, into a
+    bounded list of events (open the .trace.json in chrome://tracing
+    or ui.perfetto.dev: one lane per thread).
+
+        with instrument.span('grab'):
+            ...
+        instrument.record('encode', t0, t1)   # already timed
+
+    It is off until enable(); while off span() hands back one shared
+    no-op object and record() returns at its first line, so the hot
+    path pays a function call per stage. Switching it on or off is
+    safe at any time, also in the middle of a session.
+'''
+import os
+import csv
+import json
+import time
+import threading
+from collections import deque
+
+enabled = False
+
+# histogram bucket upper bounds in ms; the last bucket is open
+bounds = [0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+max_events = 200000
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0]*(len(bounds)+1)
+
+    def add(self, ms):
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = max(self.max, ms)
+        i = 0
+        while i < len(bounds) and ms > bounds[i]:
+            i += 1
+        self.buckets[i] += 1
+
+    @property
+    def mean(self):
+        return self.total/self.count if self.count else 0.0
+
+    def percentile(self, p):
+        '''Upper bound of the bucket holding the p-th percentile (ms).'''
+        if not self.count:
+            return 0.0
+        rank = p/100.0*self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bounds[i], round(self.max, 3)) if i < len(bounds) else round(self.max, 3)
+        return self.max
+
+    def row(self):
+        return dict(stage=self.name, count=self.count, total_ms=round(self.total, 3),
+                    mean_ms=round(self.mean, 3), min_ms=round(self.min or 0.0, 3),
+                    p50_ms=self.percentile(50), p95_ms=self.percentile(95),
+                    max_ms=round(self.max, 3))
+
+    def __str__(self):
+        return "%-10s %6d x %8.2f ms  p50 <= %g  p95 <= %g  max %.1f"%(
+               self.name, self.count, self.mean, self.percentile(50),
+               self.percentile(95), self.max)
+
+_lock = threading.Lock()
+_stages = {}
+_events = deque(maxlen=max_events)
+_epoch = time.perf_counter()
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+def reset():
+    global _epoch
+    with _lock:
+        _stages.clear()
+        _events.clear()
+        _epoch = time.perf_counter()
+
+def record(stage, t0, t1=None, args=None):
+    '''Add one timing; t0/t1 are time.perf_counter() values.'''
+    if not enabled:
+        return
+    if t1 is None:
+        t1 = time.perf_counter()
+    ms = (t1-t0)*1000
+    with _lock:
+        s = _stages.get(stage)
+        if s is None:
+            s = _stages[stage] = StageStats(stage)
+        s.add(ms)
+        _events.append((stage, threading.get_ident(), t0, t1, args))
+
+class _Span:
+    __slots__ = ('stage', 't0')
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, self.t0)
+        return False
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_no_span = _NoSpan()
+
+def span(stage):
+    return _Span(stage) if enabled else _no_span
+
+def stages():
+    with _lock:
+        return sorted(_stages.values(), key=lambda s: -s.total)
+
+def summary():
+    return [str(s) for s in stages()]
+
+def export_csv(path):
+    columns = ['stage', 'count', 'total_ms', 'mean_ms', 'min_ms', 'p50_ms', 'p95_ms', 'max_ms']
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(columns + ['le_%g'%b for b in bounds] + ['gt_%g'%bounds[-1]])
+        for s in stages():
+            r = s.row()
+            w.writerow([r[c] for c in columns] + s.buckets)
+
+def export_json(path):
+    data = dict(bounds_ms=bounds,
+                stages=[dict(s.row(), buckets=s.buckets) for s in stages()])
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def export_trace(path):
+    '''Chrome trace event format, complete ("X") events in us.'''
+    with _lock:
+        events = list(_events)
+        epoch = _epoch
+    pid = os.getpid()
+    trace = []
+    for stage, tid, t0, t1, args in events:
+        e = dict(name=stage, cat='capture', ph='X', pid=pid, tid=tid,
+                 ts=round((t0-epoch)*1e6, 1), dur=round((t1-t0)*1e6, 1))
+        if args:
+            e['args'] = args
+        trace.append(e)
+    with open(path, 'w') as f:
+        json.dump(dict(traceEvents=trace, displayTimeUnit='ms'), f)
+
+def export(prefix):
+    '''prefix.csv, prefix.json and prefix.trace.json; returns the names.'''
+    names = [prefix+'.csv', prefix+'.json', prefix+'.trace.json']
+    export_csv(names[0])
+    export_json(names[1])
+    export_trace(names[2])
+    return names
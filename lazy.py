@@ -0,0 +1,45 @@
+'''
+    lazy.py
+
+    10/18/2026  Deferred imports
+
+    module('numpy') stands in for "import numpy" and does the import on
+    first attribute access, so a module can keep its module-level
+    names (np.asarray, keyboard.send, ...) while the GUI starts without
+    loading numpy, PIL or the input hook packages.
+
+        np  = lazy.module('numpy')
+        PIL = lazy.module('PIL', 'PIL.Image')   # also load submodules
+
+    imported() tells which of them have been loaded so far.
+'''
+import importlib
+
+_modules = []
+
+class LazyModule:
+    def __init__(self, name, *submodules):
+        self._name = name
+        self._submodules = submodules
+        self._module = None
+        _modules.append(self)
+
+    def _load(self):
+        if self._module is None:
+            module = importlib.import_module(self._name)
+            for sub in self._submodules:
+                importlib.import_module(sub)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return "<lazy module %s%s>"%(self._name, "" if self._module is None else " (loaded)")
+
+def module(name, *submodules):
+    return LazyModule(name, *submodules)
+
+def imported():
+    return [m._name for m in _modules if m._module is not None]
@@ -0,0 +1,240 @@
+'''
+    manifest.py
+
+    10/18/2026  Session index of captured frames
+
+    Every saved frame appends one JSON line to capture-index.jsonl in
+    the save folder:
+
+        {"prefix": "cap", "number": 12, "file": "cap-012.png",
+         "time": 1792300000.125, "rect": [0, 0, 800, 600],
+         "hash": "9f2c...", "encoder": "png(6)", "bytes": 55402, "ms": 41.7}
+
+    hash is a BLAKE2b-128 of the file bytes, ms the grab + encode +
+    write latency. A frame saved into a session archive (archive.py)
+    has "archive": "cap-20261018-140500.zip" too, file is its name
+    in there. The file is only ever appended to and flushed per
+    line; a line cut short by a crash is skipped when it is read, and
+    the next line starts on a line of its own.
+
+    The index is read once per folder and process and kept in dicts,
+    so resume (next free number), collision checks and the frame at a
+    given time never list or glob the folder (which is slow with 50k+
+    files): a dict lookup and a stat or two (a frame deleted since is
+    forgotten, a file saved before there was an index still counts),
+    and a bisect of the prefix's time line.
+
+        python manifest.py                       prefixes and next numbers
+        python manifest.py --prefix cap --at "2026-10-18 14:05:00"
+'''
+import os
+import sys
+import json
+import time
+import bisect
+import hashlib
+import argparse
+import threading
+
+index_name = 'capture-index.jsonl'
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class Manifest:
+    def __init__(self, folder=None):
+        self.folder = folder or os.getcwd()
+        self.path = os.path.join(self.folder, index_name)
+        self.entries = {}       # (prefix, number) -> entry
+        self.last = {}          # prefix -> highest number
+        self.timeline = {}      # prefix -> ([time], [number]), sorted by time
+        self.bad_lines = 0
+        self.lock = threading.Lock()
+        self.f = None           # opened by the first add()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    self._add(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    self.bad_lines += 1
+
+    def _add(self, e):
+        prefix, number = e['prefix'], e['number']
+        # saved again (overwritten): the new entry replaces the old one
+        self._drop(prefix, number)
+        self.entries[(prefix, number)] = e
+        if number > self.last.get(prefix, -1):
+            self.last[prefix] = number
+        times, numbers = self.timeline.setdefault(prefix, ([], []))
+        # writer threads finish out of order, but only by a frame or two
+        i = bisect.bisect_right(times, e['time'])
+        times.insert(i, e['time'])
+        numbers.insert(i, number)
+
+    def _drop(self, prefix, number):
+        e = self.entries.pop((prefix, number), None)
+        if e is None:
+            return
+        times, numbers = self.timeline[prefix]
+        i = bisect.bisect_left(times, e['time'])
+        while numbers[i] != number:
+            i += 1
+        del times[i], numbers[i]
+        if not numbers:
+            del self.last[prefix], self.timeline[prefix]
+        elif number == self.last[prefix]:
+            self.last[prefix] = max(numbers)
+
+    def _forget(self, prefix, number):
+        # the frame's file is gone: its number is free again
+        with self.lock:
+            self._drop(prefix, number)
+
+    def saved_as(self, e):
+        '''The file (or archive) holding entry e, None if it was deleted.'''
+        name = e.get('archive') or e['file']
+        return name if os.path.exists(os.path.join(self.folder, name)) else None
+
+    def _open(self):
+        f = open(self.path, 'a')
+        if f.tell():
+            # a crash may have cut the last line short
+            with open(self.path, 'rb') as r:
+                r.seek(-1, os.SEEK_END)
+                if r.read(1) != b'\n':
+                    f.write('\n')
+        return f
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, prefix, number, file, t, rect, nbytes, digest, encoder, ms, archive=None):
+        '''digest is content_hash() of the file bytes.'''
+        e = dict(prefix=prefix, number=number, file=file, time=round(t, 3),
+                 rect=list(rect) if rect else None, hash=digest,
+                 encoder=str(encoder), bytes=nbytes, ms=round(ms, 1))
+        if archive:
+            e['archive'] = archive
+        line = json.dumps(e)+'\n'
+        with self.lock:
+            self._add(e)
+            if self.f is None:
+                self.f = self._open()
+            self.f.write(line)
+            self.f.flush()
+        return e
+
+    def get(self, prefix, number):
+        return self.entries.get((prefix, number))
+
+    def prefixes(self):
+        return sorted(self.last)
+
+    def next_number(self, prefix):
+        # after the last frame still on disk
+        while prefix in self.last:
+            number = self.last[prefix]
+            if self.saved_as(self.entries[(prefix, number)]):
+                break
+            self._forget(prefix, number)
+        return self.last.get(prefix, -1)+1
+
+    def taken(self, prefix, number, files):
+        '''
+            The name of what number is taken by: an indexed frame (any
+            extension) or one of files (names) on disk. None if it is free.
+        '''
+        e = self.entries.get((prefix, number))
+        if e is not None:
+            name = self.saved_as(e)
+            if name is not None:
+                return name
+            self._forget(prefix, number)
+        for file in files:
+            if os.path.exists(os.path.join(self.folder, file)):
+                return file
+        return None
+
+    def free_number(self, prefix, number, file_of):
+        '''
+            number if nothing was saved under it, otherwise the first
+            free number after the index; file_of(number) is the file
+            names that would take it (recordings are not indexed).
+        '''
+        if not self.taken(prefix, number, file_of(number)):
+            return number
+        number = max(number+1, self.next_number(prefix))
+        # files of a session from before the index
+        while self.taken(prefix, number, file_of(number)):
+            number += 1
+        return number
+
+    def find(self, prefix, t):
+        '''The last frame saved at or before t (None if there is none).'''
+        if prefix not in self.timeline:
+            return None
+        times, numbers = self.timeline[prefix]
+        i = bisect.bisect_right(times, t)
+        if i == 0:
+            return None
+        return self.entries[(prefix, numbers[i-1])]
+
+    def close(self):
+        with self.lock:
+            if self.f is not None:
+                self.f.close()
+                self.f = None
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def index(folder=None):
+    '''The Manifest of folder (current folder), read once per process.'''
+    path = os.path.abspath(folder or os.getcwd())
+    with _indexes_lock:
+        m = _indexes.get(path)
+        if m is None:
+            m = _indexes[path] = Manifest(path)
+        return m
+
+def parse_time(s):
+    try:
+        return float(s)
+    except ValueError:
+        return time.mktime(time.strptime(s, "%Y-%m-%d %H:%M:%S"))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Look up frames in a capture folder's index")
+    ap.add_argument('folder', nargs='?', help="save folder (current folder)")
+    ap.add_argument('--prefix', help="frames of this prefix")
+    ap.add_argument('--at', metavar='TIME',
+                    help="frame shown at TIME (\"YYYY-mm-dd HH:MM:SS\" or epoch seconds)")
+    args = ap.parse_args(argv)
+
+    m = Manifest(args.folder)
+    if args.at:
+        if not args.prefix:
+            ap.error("--at needs --prefix")
+        e = m.find(args.prefix, parse_time(args.at))
+        if e is None:
+            print("No %s frame at or before %s"%(args.prefix, args.at))
+            return 1
+        print(json.dumps(e))
+        return 0
+    for p in [args.prefix] if args.prefix else m.prefixes():
+        times, numbers = m.timeline.get(p, ([], []))
+        span = "%s - %s"%(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(times[0])),
+                          time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(times[-1]))) \
+               if times else "-"
+        print("%-12s %6d frames  next %-6d %s"%(p, len(numbers), m.next_number(p), span))
+    if m.bad_lines:
+        print("%d unreadable lines skipped"%m.bad_lines)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
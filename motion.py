@@ -0,0 +1,82 @@
+'''
+    motion.py
+
+    10/18/2026  Tiled motion detection for capture on change
+
+    The region is sampled often at a low resolution (a gray thumbnail
+    of tiles x cell pixels) and compared tile by tile, all numpy:
+    a tile has changed when its mean absolute difference is above
+    threshold (fraction of full scale). A capture is due when
+
+      - the changed tiles against the last captured sample cover at
+        least area (fraction of the tiles), and
+      - the change has settled: settle_polls samples in a row with no
+        changed tile against the one before (or max_wait seconds went
+        by, for content that never stops moving)
+
+    A change that undoes itself before it settles (a blinking cursor,
+    a tooltip) is not captured.
+'''
+import lazy
+import dedupe
+
+np = lazy.module('numpy')
+
+class MotionDetector:
+    def __init__(self, area=0.005, threshold=0.02, tiles=(16, 12), cell=16,
+                 settle_polls=2, max_wait=3.0):
+        self.area = area
+        self.threshold = threshold
+        self.tiles = tiles
+        self.cell = cell
+        self.settle_polls = settle_polls
+        self.max_wait = max_wait
+        self.reference = None   # sample of the last captured frame
+        self.last = None        # previous sample while a change settles
+        self.since = None       # when the change was first seen
+        self.quiet = 0
+        self.polls = 0
+        self.changed = 0.0      # changed fraction at the last capture
+
+    def sample(self, im):
+        tx, ty = self.tiles
+        return dedupe.thumbnail(im, tx*self.cell, ty*self.cell)
+
+    def changed_tiles(self, a, b):
+        '''(ty, tx) bool array of the tiles that differ between samples a and b.'''
+        tx, ty = self.tiles
+        c = self.cell
+        diff = np.abs(a-b).reshape(ty, c, tx, c).mean(axis=(1, 3))
+        return diff > self.threshold*255
+
+    def reset(self, sample):
+        # a frame was captured: compare with it from now on
+        self.reference = sample
+        self.last = None
+        self.since = None
+        self.quiet = 0
+
+    def update(self, sample, now):
+        '''Takes a sample taken at now (seconds); True when a capture is due.'''
+        self.polls += 1
+        if self.reference is None or self.reference.shape != sample.shape:
+            self.changed = 1.0
+            return True
+        if self.since is None:
+            if self.changed_tiles(sample, self.reference).mean() >= self.area:
+                self.since = now
+                self.last = sample
+                self.quiet = 0
+            return False
+
+        moving = self.changed_tiles(sample, self.last).any()
+        self.last = sample
+        self.quiet = 0 if moving else self.quiet+1
+        if self.quiet < self.settle_polls and now-self.since < self.max_wait:
+            return False
+        self.changed = self.changed_tiles(sample, self.reference).mean()
+        if self.changed >= self.area:
+            return True
+        # it went back to what was captured
+        self.since = None
+        return False
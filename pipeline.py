@@ -0,0 +1,188 @@
+'''
+    pipeline.py
+
+    10/18/2026  Background encode/write pipeline
+    10/18/2026  Encoder is chosen per pool (encoders.py)
+    10/18/2026  Saved frames go into the folder's index (manifest.py)
+    10/18/2026  Frames are frame.Frame views, the PIL image is made by the worker
+    10/18/2026  Optional archive sink instead of a file per frame (archive.py)
+
+    Raw frames go from the trigger thread into a bounded queue and are
+    PNG-encoded and written by a pool of worker threads, so the
+    trigger -> next page loop only pays for the grab. The queue is
+    bounded by raw frame memory (not frame count) and when it is full
+    submit() either blocks until a worker frees room or drops the frame.
+
+    No Qt here: progress comes back through the on_saved/on_error
+    callables, which the Qt callbacks turn into signals.
+'''
+import os
+import time
+import threading
+from collections import deque
+
+import grab
+import frame
+import encoders
+import manifest
+import instrument
+
+policy_list = ['block', 'drop']
+
+def write_frame(sink, path, data):
+    # into the session archive under the file name, or a file of its own
+    if sink is not None:
+        return sink.write(os.path.basename(path), data)
+    return grab.write_file(path, data)
+
+def sink_name(sink):
+    return os.path.basename(sink.path) if sink is not None else None
+
+def frame_nbytes(im):
+    return im.width*im.height*len(im.getbands())
+
+class FrameQueue:
+    '''
+        FIFO bounded by the bytes it holds. put() blocks or drops when
+        full (policy); get() returns None once closed and drained.
+        The consumer calls done(size) when it no longer holds the frame.
+    '''
+    def __init__(self, max_mb=256, policy='block'):
+        if policy not in policy_list:
+            raise ValueError("Unknown queue policy: %s"%policy)
+        self.max_bytes = int(max_mb*1024*1024)
+        self.policy = policy
+        self.items = deque()
+        self.pending_bytes = 0
+        self.submitted = 0
+        self.dropped = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+    def __len__(self):
+        return len(self.items)
+
+    def put(self, item, size):
+        with self.cond:
+            if self.closed:
+                raise RuntimeError("Frame queue is closed")
+            # one oversized frame is always let through an empty queue
+            while self.pending_bytes and self.pending_bytes+size > self.max_bytes:
+                if self.policy == 'drop':
+                    self.dropped += 1
+                    return False
+                self.cond.wait()
+            self.items.append((item, size))
+            self.pending_bytes += size
+            self.submitted += 1
+            self.cond.notify_all()
+        return True
+
+    def get(self):
+        with self.cond:
+            while not self.items and not self.closed:
+                self.cond.wait()
+            if not self.items:
+                return None
+            return self.items.popleft()
+
+    def done(self, size):
+        with self.cond:
+            self.pending_bytes -= size
+            self.cond.notify_all()
+
+    def close(self, discard=False):
+        with self.cond:
+            self.closed = True
+            if discard:
+                self.pending_bytes -= sum(size for item, size in self.items)
+                self.items.clear()
+            self.cond.notify_all()
+
+class WriterPool:
+    def __init__(self, workers=2, max_mb=256, policy='block',
+                 on_saved=None, on_error=None, encoder=None, index=None, sink=None):
+        self.queue = FrameQueue(max_mb, policy)
+        self.encoder = encoder or encoders.PngEncoder()
+        self.index = index      # manifest.Manifest, frames submitted with meta
+        self.sink = sink        # archive.ArchiveSink, None: a file per frame
+        self.on_saved = on_saved
+        self.on_error = on_error
+
+        self.written = 0
+        self.bytes_written = 0
+        self.encode_ms = 0.0
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._run, daemon=True)
+                         for i in range(max(1, workers))]
+        for t in self._threads:
+            t.start()
+
+    @property
+    def depth(self):
+        return len(self.queue)
+
+    @property
+    def dropped(self):
+        return self.queue.dropped
+
+    def submit(self, im, path, grab_ms=0.0, legacy=None, meta=None):
+        '''
+            Queue one frame (a frame.Frame, passed on as it is). Returns
+            False if it was dropped. meta is (prefix, number, time, rect)
+            for the index.
+        '''
+        im = frame.as_frame(im)
+        return self.queue.put((im, path, grab_ms, legacy, meta), im.nbytes)
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            (im, path, grab_ms, legacy, meta), size = job
+
+            try:
+                t0 = time.perf_counter()
+                data = self.encoder.encode(im.image())
+                t1 = time.perf_counter()
+                nbytes = write_frame(self.sink, path, data)
+                t2 = time.perf_counter()
+                instrument.record('encode', t0, t1)
+                instrument.record('write', t1, t2)
+                ms = grab_ms + (t2-t0)*1000
+                if self.index is not None and meta is not None:
+                    prefix, number, t, rect = meta
+                    self.index.add(prefix, number, os.path.basename(path), t, rect,
+                                   len(data), manifest.content_hash(data), self.encoder, ms,
+                                   sink_name(self.sink))
+                report = grab.FrameReport(os.path.basename(path), nbytes, ms,
+                                          legacy, (t1-t0)*1000)
+            except Exception as e:
+                report = None
+                if self.on_error:
+                    self.on_error("%s: %s"%(path, e))
+
+            self.queue.done(size)
+            if report:
+                with self._lock:
+                    self.written += 1
+                    self.bytes_written += report.nbytes
+                    self.encode_ms += report.encode_ms
+                if self.on_saved:
+                    self.on_saved(report)
+
+    @property
+    def mean_encode_ms(self):
+        return self.encode_ms/self.written if self.written else 0.0
+
+    @property
+    def mean_bytes(self):
+        return self.bytes_written/self.written if self.written else 0
+
+    def close(self, wait=True):
+        '''Stop accepting frames; with wait, drain the queue first.'''
+        self.queue.close(discard=not wait)
+        if wait:
+            for t in self._threads:
+                t.join()
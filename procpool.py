@@ -0,0 +1,366 @@
+'''
+    procpool.py
+
+    10/18/2026  Encoding on worker processes through shared memory
+
+    ProcessWriterPool is a drop-in for pipeline.WriterPool when the
+    encoder is CPU bound: frames are encoded and written by worker
+    processes, one per core, so a 4K/8K capture is not held to one
+    core's PNG speed.
+
+    Pixels never go through a pipe. The pool preallocates a ring of
+    multiprocessing.shared_memory slots (sized on the first frame,
+    again if the window grows); submit() copies the frame.Frame into a
+    free slot (one copy straight from the grab buffer, RGBX) and
+    queues only its name and shape. The worker maps the slot, encodes and writes the
+    file, and hands back the size and hash. A slot is free again when
+    its frame is written; with none free submit() blocks or drops
+    (policy), so memory is the slots and nothing else.
+
+    shard=True splits a large PNG frame into strips that different
+    workers compress at the same time: each strip is filtered (Up) and
+    deflated on its own, ending on a sync flush, and the pool joins the
+    pieces into one zlib stream (adler32 combined) and one PNG file.
+
+    With an archive sink (archive.py) the worker sends the encoded bytes
+    back and the pool appends them to the session archive.
+
+    A worker that dies (killed, out of memory) never hands back its
+    job: waits are timed and check the workers, submit() raises and
+    close() reports the frames that were lost instead of hanging.
+'''
+import os
+import time
+import zlib
+import struct
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+
+import lazy
+import grab
+import frame
+import encoders
+import manifest
+import pipeline
+import instrument
+from recorder import png_chunk
+
+np  = lazy.module('numpy')
+PIL = lazy.module('PIL', 'PIL.Image')
+
+min_shard_rows = 64     # a strip is at least this many rows
+poll_s = 0.5            # waits check the worker processes this often
+
+# --- worker process ----------------------------------------------------------
+
+def slot_image(buf, size):
+    return PIL.Image.frombuffer('RGBX', size, buf, 'raw', 'RGBX', 0, 1)
+
+def png_strip(buf, size, rows, level, last):
+    '''Up-filtered, raw deflated rows [a, b) of the slot: (piece, adler32, length).'''
+    w, h = size
+    a, b = rows
+    px = np.ndarray((h, w, 4), np.uint8, buffer=buf)
+    cur = px[a:b, :, :3]
+    prev = np.zeros_like(cur)
+    prev[1:] = cur[:-1]
+    if a > 0:
+        prev[0] = px[a-1, :, :3]
+    filtered = np.empty((b-a, 1+w*3), np.uint8)
+    filtered[:, 0] = 2      # PNG filter type Up
+    filtered[:, 1:] = (cur-prev).reshape(b-a, w*3)
+    data = filtered.tobytes()
+    c = zlib.compressobj(level, zlib.DEFLATED, -15)
+    piece = c.compress(data) + c.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+    return piece, zlib.adler32(data), len(data)
+
+def worker(jobs, results, encoder):
+    slots = {}
+    generation = 0
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        key, name, gen, size, path, rows, last = job
+        try:
+            if gen != generation:
+                # the pool allocated new slots, the old ones are gone
+                for shm in slots.values():
+                    shm.close()
+                slots = {}
+                generation = gen
+            shm = slots.get(name)
+            if shm is None:
+                shm = slots[name] = shared_memory.SharedMemory(name=name)
+            t0 = time.perf_counter()
+            if rows is None:
+                im = slot_image(shm.buf, size)
+                data = encoder.encode(im.convert('RGB'))
+                del im
+                t1 = time.perf_counter()
+                digest = manifest.content_hash(data)
+                if path is None:
+                    # the pool writes it into its archive
+                    results.put((key, None, (len(data), digest, data), t0, t1, t1, None))
+                else:
+                    grab.write_file(path, data)
+                    results.put((key, None, (len(data), digest, None),
+                                 t0, t1, time.perf_counter(), None))
+            else:
+                strip = png_strip(shm.buf, size, rows, int(encoder.setting), last)
+                t1 = time.perf_counter()
+                results.put((key, rows, strip, t0, t1, t1, None))
+        except Exception as e:
+            results.put((key, rows, None, 0.0, 0.0, 0.0, str(e)))
+    for shm in slots.values():
+        shm.close()
+
+# --- pool --------------------------------------------------------------------
+
+def adler32_combine(a1, a2, len2):
+    # zlib's adler32_combine(): the checksum of data1+data2 from both
+    base = 65521
+    rem = len2 % base
+    s1 = a1 & 0xffff
+    s2 = rem*s1 % base
+    s1 += (a2 & 0xffff) + base - 1
+    s2 += ((a1 >> 16) & 0xffff) + ((a2 >> 16) & 0xffff) + base - rem
+    s1 %= base
+    s2 %= base
+    return s1 | (s2 << 16)
+
+def png_from_strips(size, strips):
+    '''One PNG file from png_strip() results in row order.'''
+    w, h = size
+    adler = 1
+    for piece, a, n in strips:
+        adler = adler32_combine(adler, a, n)
+    out = [b'\x89PNG\r\n\x1a\n',
+           png_chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0))]
+    out.append(png_chunk(b'IDAT', b'\x78\x9c' + strips[0][0]))
+    for piece, a, n in strips[1:]:
+        out.append(png_chunk(b'IDAT', piece))
+    out.append(png_chunk(b'IDAT', struct.pack('>I', adler)))
+    out.append(png_chunk(b'IEND', b''))
+    return b''.join(out)
+
+class Pending:
+    '''A frame in a slot until all its jobs are back.'''
+    def __init__(self, slot, path, size, grab_ms, legacy, meta, parts):
+        self.slot = slot
+        self.path = path
+        self.size = size
+        self.grab_ms = grab_ms
+        self.legacy = legacy
+        self.meta = meta
+        self.parts = parts
+        self.strips = {}
+        self.t0 = None
+        self.t1 = 0.0
+        self.error = None
+
+class ProcessWriterPool:
+    def __init__(self, workers=2, max_mb=256, policy='block',
+                 on_saved=None, on_error=None, encoder=None, index=None, shard=False,
+                 sink=None):
+        if policy not in pipeline.policy_list:
+            raise ValueError("Unknown queue policy: %s"%policy)
+        self.encoder = encoder or encoders.PngEncoder()
+        self.max_bytes = int(max_mb*1024*1024)
+        self.policy = policy
+        self.on_saved = on_saved
+        self.on_error = on_error
+        self.index = index
+        self.sink = sink
+        self.workers = max(1, workers)
+        self.shard = shard and isinstance(self.encoder, encoders.PngEncoder)
+
+        self.written = 0
+        self.bytes_written = 0
+        self.encode_ms = 0.0
+        self.dropped = 0
+        self.slots = []         # SharedMemory
+        self.slot_bytes = 0
+        self.generation = 0
+        self.free = []
+        self.frames = {}        # key -> Pending
+        self.next_key = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+        ctx = multiprocessing.get_context('spawn')   # no fork of a Qt process
+        self.jobs = ctx.Queue()
+        self.results = ctx.Queue()
+        self._procs = [ctx.Process(target=worker, args=(self.jobs, self.results, self.encoder),
+                                   daemon=True) for i in range(self.workers)]
+        for p in self._procs:
+            p.start()
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    @property
+    def depth(self):
+        return len(self.frames)
+
+    def _allocate(self, nbytes):
+        # called with no frame in flight
+        for shm in self.slots:
+            shm.close()
+            shm.unlink()
+        self.slot_bytes = nbytes
+        self.generation += 1
+        count = max(2, min(2*self.workers, self.max_bytes//nbytes))
+        self.slots = [shared_memory.SharedMemory(create=True, size=nbytes) for i in range(count)]
+        self.free = list(range(count))
+
+    def _dead(self):
+        # a killed worker's job never comes back: nothing to wait for
+        for p in self._procs:
+            if not p.is_alive():
+                return "Encoder process %d died (exit code %s)"%(p.pid, p.exitcode)
+        return None
+
+    def _take_slot(self, nbytes):
+        with self.cond:
+            if self.closed:
+                raise RuntimeError("Writer pool is closed")
+            while True:
+                if nbytes > self.slot_bytes and not self.frames:
+                    self._allocate(nbytes)
+                if nbytes <= self.slot_bytes and self.free:
+                    return self.free.pop()
+                # a grown window waits for the frames in flight even when
+                # dropping: the slots can only grow with none in use
+                if self.policy == 'drop' and nbytes <= self.slot_bytes:
+                    self.dropped += 1
+                    return None
+                if not self.cond.wait(poll_s):
+                    error = self._dead()
+                    if error:
+                        raise RuntimeError(error)
+
+    def submit(self, im, path, grab_ms=0.0, legacy=None, meta=None):
+        '''Queue one frame (frame.Frame). Returns False if it was dropped.'''
+        im = frame.as_frame(im)
+        size = im.size
+        slot = self._take_slot(size[0]*size[1]*4)
+        if slot is None:
+            return False
+        shm = self.slots[slot]
+        w, h = size
+        im.copy_to(np.ndarray((h, w, 4), np.uint8, buffer=shm.buf))
+
+        if self.shard and h >= 2*min_shard_rows:
+            n = min(self.workers, h//min_shard_rows)
+            bounds = [h*i//n for i in range(n+1)]
+            parts = [(bounds[i], bounds[i+1]) for i in range(n)]
+        else:
+            parts = [None]
+        with self.cond:
+            key = self.next_key
+            self.next_key += 1
+            gen = self.generation
+            self.frames[key] = Pending(slot, path, size, grab_ms, legacy, meta, len(parts))
+        for i, rows in enumerate(parts):
+            self.jobs.put((key, shm.name, gen, size, path if self.sink is None else None,
+                           rows, i == len(parts)-1))
+        return True
+
+    def _collect(self):
+        while True:
+            r = self.results.get()
+            if r is None:
+                return
+            key, rows, value, t0, t1, t2, error = r
+            data = None         # bytes the pool still has to write
+            f = self.frames[key]
+            f.t0 = t0 if f.t0 is None else min(f.t0, t0)
+            f.t1 = max(f.t1, t1)
+            if error:
+                f.error = error
+            elif rows is None:
+                nbytes, digest, data = value
+                instrument.record('encode', t0, t1)
+                if data is None:
+                    instrument.record('write', t1, t2)
+            else:
+                f.strips[rows] = value
+            f.parts -= 1
+            if f.parts:
+                continue
+
+            report = None
+            if f.error is None:
+                try:
+                    if f.strips:
+                        instrument.record('encode', f.t0, f.t1)
+                        data = png_from_strips(f.size, [f.strips[k] for k in sorted(f.strips)])
+                        digest = manifest.content_hash(data)
+                    if data is not None:
+                        t1 = time.perf_counter()
+                        nbytes = pipeline.write_frame(self.sink, f.path, data)
+                        instrument.record('write', t1)
+                        t2 = time.perf_counter()
+                    ms = f.grab_ms + (t2-f.t0)*1000
+                    report = grab.FrameReport(os.path.basename(f.path), nbytes, ms,
+                                              f.legacy, (f.t1-f.t0)*1000)
+                    if self.index is not None and f.meta is not None:
+                        prefix, number, t, rect = f.meta
+                        self.index.add(prefix, number, report.file, t, rect,
+                                       nbytes, digest, self.encoder, ms,
+                                       pipeline.sink_name(self.sink))
+                except Exception as e:
+                    f.error = str(e)
+            if f.error is not None and self.on_error:
+                self.on_error("%s: %s"%(f.path, f.error))
+
+            with self.cond:
+                del self.frames[key]
+                self.free.append(f.slot)
+                if report:
+                    self.written += 1
+                    self.bytes_written += report.nbytes
+                    self.encode_ms += report.encode_ms
+                self.cond.notify_all()
+            if report and self.on_saved:
+                self.on_saved(report)
+
+    @property
+    def mean_encode_ms(self):
+        return self.encode_ms/self.written if self.written else 0.0
+
+    @property
+    def mean_bytes(self):
+        return self.bytes_written/self.written if self.written else 0
+
+    def close(self, wait=True):
+        '''Stop accepting frames; with wait, write the ones in the slots first.'''
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            error = None
+            if wait:
+                while self.frames:
+                    if self.cond.wait(poll_s):
+                        continue
+                    error = self._dead()
+                    if error:
+                        if self.on_error:
+                            self.on_error("%s, %d frames lost"%(error, len(self.frames)))
+                        break
+        for p in self._procs:
+            self.jobs.put(None)
+        # a worker killed inside the job queue may leave it locked
+        timeout = 1.0 if not wait else 10*poll_s if error else None
+        for p in self._procs:
+            p.join(timeout)
+            if p.is_alive():
+                p.terminate()
+        self.results.put(None)
+        self._collector.join()
+        for shm in self.slots:
+            shm.close()
+            shm.unlink()
+        self.slots = []
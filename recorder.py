@@ -0,0 +1,302 @@
+'''
+    recorder.py
+
+    10/18/2026  Continuous recording into a single container
+
+    Frames go through a pipeline.FrameQueue (bounded by memory) to one
+    writer thread that appends them to a single output stream:
+
+        apng : animated PNG, lossless; each frame's delay is the real
+               time to the next frame, so timestamps survive as is
+        avi  : Motion-JPEG AVI at a fixed rate; late frames are padded
+               with zero-length "repeat previous" chunks
+        pipe : raw RGB piped to a local ffmpeg (H.264 .mp4), padded by
+               repeating the previous frame
+
+    Every recording also gets <output>.timecodes.txt (mkvmerge
+    "timecode format v2": one ms timestamp per captured frame).
+    Writers hold at most one frame besides the queue, and only the
+    headers are rewritten (seek back) when the file is closed.
+'''
+import os
+import time
+import zlib
+import shutil
+import struct
+import threading
+import subprocess
+
+import encoders
+import pipeline
+import instrument
+
+container_list = ['apng', 'avi', 'pipe']
+container_ext = {'apng': 'png', 'avi': 'avi', 'pipe': 'mp4'}
+
+def fit(im, size):
+    # a window resized mid-recording is cropped/padded to the first size
+    if im.mode != 'RGB':
+        im = im.convert('RGB')
+    if im.size != size:
+        im = im.crop((0, 0)+size)
+    return im
+
+# --- APNG --------------------------------------------------------------------
+
+def png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + \
+           struct.pack('>I', zlib.crc32(tag+data) & 0xffffffff)
+
+def png_chunks(data):
+    pos = 8
+    while pos < len(data):
+        n, = struct.unpack('>I', data[pos:pos+4])
+        yield data[pos+4:pos+8], data[pos+8:pos+8+n]
+        pos += n+12
+
+class ApngWriter:
+    def __init__(self, path, size, fps, encoder=None):
+        self.f = open(path, 'wb')
+        self.size = size
+        self.fps = fps
+        self.encoder = encoder if isinstance(encoder, encoders.PngEncoder) \
+                       else encoders.PngEncoder(1)
+        self.frames = 0
+        self.seq = 0
+        self.actl_pos = None
+        self.pending = None
+
+    def write(self, im, t):
+        data = self.encoder.encode(fit(im, self.size))
+        if self.pending is not None:
+            self._flush(t-self.pending[1])
+        self.pending = (data, t)
+
+    def _flush(self, delay):
+        data = self.pending[0]
+        chunks = list(png_chunks(data))
+        if self.actl_pos is None:
+            self.f.write(data[:8])
+            self.f.write(png_chunk(b'IHDR', chunks[0][1]))
+            self.actl_pos = self.f.tell()
+            self.f.write(png_chunk(b'acTL', struct.pack('>II', 0, 0)))
+
+        ms = min(65535, max(1, int(round(delay*1000))))
+        self.f.write(png_chunk(b'fcTL', struct.pack('>IIIIIHHBB', self.seq,
+                               self.size[0], self.size[1], 0, 0, ms, 1000, 0, 0)))
+        self.seq += 1
+        for tag, body in chunks:
+            if tag != b'IDAT':
+                continue
+            if self.frames == 0:
+                self.f.write(png_chunk(b'IDAT', body))
+            else:
+                self.f.write(png_chunk(b'fdAT', struct.pack('>I', self.seq)+body))
+                self.seq += 1
+        self.frames += 1
+        self.pending = None
+
+    def close(self):
+        if self.pending is not None:
+            self._flush(1.0/self.fps)
+        if self.actl_pos is not None:
+            self.f.write(png_chunk(b'IEND', b''))
+            self.f.seek(self.actl_pos)
+            self.f.write(png_chunk(b'acTL', struct.pack('>II', self.frames, 0)))
+        self.f.close()
+
+# --- MJPEG AVI ---------------------------------------------------------------
+
+AVIF_HASINDEX  = 0x10
+AVIIF_KEYFRAME = 0x10
+riff_limit     = 0xffffffff - (1 << 20)
+
+class AviWriter:
+    def __init__(self, path, size, fps, encoder=None):
+        self.f = open(path, 'wb')
+        self.size = size
+        self.fps = fps
+        self.encoder = encoder if isinstance(encoder, encoders.JpegEncoder) \
+                       else encoders.JpegEncoder(85)
+        self.index = []     # (offset from movi, size), 16 bytes each in idx1
+        self.slot = -1
+        self.max_chunk = 0
+        self._header()
+
+    def _header(self):
+        w, h = self.size
+        f = self.f
+        f.write(b'RIFF' + b'\0'*4 + b'AVI ')
+        f.write(b'LIST' + struct.pack('<I', 4+8+56+8+4+8+56+8+40) + b'hdrl')
+        f.write(b'avih' + struct.pack('<I', 56))
+        self.avih_pos = f.tell()
+        f.write(b'\0'*56)
+        f.write(b'LIST' + struct.pack('<I', 4+8+56+8+40) + b'strl')
+        f.write(b'strh' + struct.pack('<I', 56))
+        self.strh_pos = f.tell()
+        f.write(b'\0'*56)
+        f.write(b'strf' + struct.pack('<I', 40))
+        f.write(struct.pack('<IiiHH4sIiiII', 40, w, h, 1, 24, b'MJPG', w*h*3, 0, 0, 0, 0))
+        self.movi_pos = f.tell()
+        f.write(b'LIST' + b'\0'*4 + b'movi')
+        self._patch()
+
+    def _patch(self):
+        w, h = self.size
+        n = len(self.index)
+        here = self.f.tell()
+        self.f.seek(self.avih_pos)
+        self.f.write(struct.pack('<10I16x', int(round(1e6/self.fps)), 0, 0, AVIF_HASINDEX,
+                                 n, 0, 1, self.max_chunk, w, h))
+        self.f.seek(self.strh_pos)
+        self.f.write(struct.pack('<4s4sIHHIIIIIIIIhhhh', b'vids', b'MJPG', 0, 0, 0, 0,
+                                 1000, int(round(self.fps*1000)), 0, n,
+                                 self.max_chunk, 0xffffffff, 0, 0, 0, w, h))
+        self.f.seek(here)
+
+    def _chunk(self, data):
+        pos = self.f.tell()
+        if pos+len(data) > riff_limit:
+            raise IOError("AVI is full (4 GB), start a new recording")
+        self.f.write(b'00dc' + struct.pack('<I', len(data)) + data)
+        if len(data)%2:
+            self.f.write(b'\0')
+        self.index.append((pos-self.movi_pos-8, len(data)))
+        self.max_chunk = max(self.max_chunk, len(data))
+
+    def write(self, im, t):
+        data = self.encoder.encode(fit(im, self.size))
+        slot = max(int(round(t*self.fps)), self.slot+1)
+        # empty chunks repeat the previous frame until this one is due
+        for i in range(slot-self.slot-1 if self.slot >= 0 else 0):
+            self._chunk(b'')
+        self._chunk(data)
+        self.slot = slot
+
+    def close(self):
+        f = self.f
+        end = f.tell()
+        f.write(b'idx1' + struct.pack('<I', 16*len(self.index)))
+        f.write(b''.join(struct.pack('<4sIII', b'00dc', AVIIF_KEYFRAME if n else 0, off, n)
+                         for off, n in self.index))
+        total = f.tell()
+        f.seek(self.movi_pos+4)
+        f.write(struct.pack('<I', end-self.movi_pos-8))
+        f.seek(4)
+        f.write(struct.pack('<I', total-8))
+        f.seek(total)
+        self._patch()
+        f.close()
+
+# --- pipe to ffmpeg ----------------------------------------------------------
+
+class PipeWriter:
+    def __init__(self, path, size, fps, encoder=None, program='ffmpeg'):
+        exe = shutil.which(program)
+        if exe is None:
+            raise IOError("%s not found on PATH"%program)
+        self.size = size
+        self.fps = fps
+        self.slot = -1
+        self.last = None
+        cmd = [exe, '-loglevel', 'error', '-y',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+               '-s', '%dx%d'%size, '-framerate', '%g'%fps, '-i', '-',
+               '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+               '-c:v', 'libx264', '-preset', 'veryfast', '-pix_fmt', 'yuv420p',
+               path]
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write(self, im, t):
+        raw = fit(im, self.size).tobytes()
+        slot = max(int(round(t*self.fps)), self.slot+1)
+        if self.last is not None:
+            for i in range(slot-self.slot-1):
+                self.proc.stdin.write(self.last)
+        self.proc.stdin.write(raw)
+        self.last = raw
+        self.slot = slot
+
+    def close(self):
+        self.proc.stdin.close()
+        if self.proc.wait():
+            raise IOError("ffmpeg exited with %d"%self.proc.returncode)
+
+writer_class = {'apng': ApngWriter, 'avi': AviWriter, 'pipe': PipeWriter}
+
+# --- recorder ----------------------------------------------------------------
+
+class Recorder:
+    '''
+        submit(im, t) from the capture thread, t in seconds since the
+        recording started. The container is opened on the first frame
+        (its size is the recording size).
+    '''
+    def __init__(self, path, container='apng', fps=10, max_mb=256, policy='block',
+                 encoder=None, on_error=None):
+        if container not in container_list:
+            raise ValueError("Unknown container: %s"%container)
+        self.path = path
+        self.container = container
+        self.fps = fps
+        self.encoder = encoder
+        self.on_error = on_error
+        self.queue = pipeline.FrameQueue(max_mb, policy)
+        self.writer = None
+        self.frames = 0
+        self.duration = 0.0
+        self.write_ms = 0.0
+        self.error = None
+        self.timecodes = open(path+'.timecodes.txt', 'w')
+        self.timecodes.write("# timecode format v2\n")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self):
+        return self.queue.dropped
+
+    def submit(self, im, t):
+        if self.error is not None:
+            return False
+        return self.queue.put((im, t), pipeline.frame_nbytes(im))
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            (im, t), size = job
+            try:
+                if self.error is None:
+                    if self.writer is None:
+                        self.writer = writer_class[self.container](
+                                        self.path, im.size, self.fps, self.encoder)
+                    t0 = time.perf_counter()
+                    self.writer.write(im, t)
+                    t1 = time.perf_counter()
+                    instrument.record('record', t0, t1)
+                    self.write_ms += (t1-t0)*1000
+                    self.timecodes.write("%.3f\n"%(t*1000))
+                    self.frames += 1
+                    self.duration = t
+            except Exception as e:
+                self.error = e
+                if self.on_error:
+                    self.on_error("%s: %s"%(self.path, e))
+            self.queue.done(size)
+
+    def close(self):
+        self.queue.close()
+        self._thread.join()
+        self.timecodes.close()
+        if self.writer is not None:
+            self.writer.close()
+
+    @property
+    def mean_write_ms(self):
+        return self.write_ms/self.frames if self.frames else 0.0
+
+    @property
+    def nbytes(self):
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
@@ -0,0 +1,128 @@
+'''
+    region.py
+
+    10/18/2026  User picked capture region
+
+    A Region is a rectangle (left, top, right, bottom) to grab instead
+    of the whole window:
+
+        relative : from the window's top-left corner, so it follows
+                   the window when it moves; cut to the window size
+        absolute : screen coordinates, the window is still activated
+                   for the hot key but its position does not matter
+
+    Either way a tracker stands in for the window's: a relative region
+    is cut from the window rectangle (WindowRegionTracker, box_for()),
+    an absolute one replaces it (ScreenTracker). Only the region is
+    grabbed, and auto trim learns its box inside the region.
+
+    Picked regions are kept as presets in ~/.capture-regions.json.
+'''
+import os
+import json
+
+preset_file = os.path.join(os.path.expanduser('~'), '.capture-regions.json')
+
+class Region:
+    def __init__(self, box, relative=True):
+        left, top, right, bottom = [int(v) for v in box]
+        if right <= left or bottom <= top:
+            raise ValueError("Empty region: (%d, %d, %d, %d)"%(left, top, right, bottom))
+        self.box = (left, top, right, bottom)
+        self.relative = relative
+
+    @property
+    def size(self):
+        return self.box[2]-self.box[0], self.box[3]-self.box[1]
+
+    def box_for(self, size):
+        # the part of the region inside a window of size
+        w, h = size
+        l, t, r, b = self.box
+        l, t, r, b = min(max(l, 0), w-1), min(max(t, 0), h-1), min(r, w), min(b, h)
+        return (l, t, max(r, l+1), max(b, t+1))
+
+    @property
+    def name(self):
+        return "%dx%d+%d+%d %s"%(self.size+self.box[:2]+('rel' if self.relative else 'abs',))
+
+    def to_dict(self):
+        return dict(box=list(self.box), relative=self.relative)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['box'], d.get('relative', True))
+
+    def __str__(self):
+        return self.name
+
+def parse_box(s):
+    box = [int(v) for v in s.split(',')]
+    if len(box) != 4:
+        raise ValueError("Region is left,top,right,bottom: %s"%s)
+    return box
+
+class ScreenTracker:
+    '''
+        WindowTracker stand-in for an absolute region: geometry() is the
+        region, activate() still brings the window to the front.
+    '''
+    def __init__(self, tracker, region):
+        self.tracker = tracker
+        self.rect = region.box
+        self.generation = 1
+
+    def geometry(self):
+        return self.rect
+
+    def activate(self):
+        self.tracker.activate()
+
+    def invalidate(self):
+        self.tracker.invalidate()
+
+class WindowRegionTracker:
+    '''
+        WindowTracker stand-in for a relative region: geometry() is the
+        region inside the window, wherever the window is.
+    '''
+    def __init__(self, tracker, region):
+        self.tracker = tracker
+        self.region = region
+
+    @property
+    def generation(self):
+        return self.tracker.generation
+
+    def geometry(self):
+        left, top, right, bottom = self.tracker.geometry()
+        l, t, r, b = self.region.box_for((right-left, bottom-top))
+        return left+l, top+t, left+r, top+b
+
+    def activate(self):
+        self.tracker.activate()
+
+    def invalidate(self):
+        self.tracker.invalidate()
+
+def load_presets(path=None):
+    path = path or preset_file
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path) as f:
+            return [Region.from_dict(d) for d in json.load(f)]
+    except (ValueError, KeyError, TypeError):
+        return []
+
+def save_presets(regions, path=None):
+    with open(path or preset_file, 'w') as f:
+        json.dump([r.to_dict() for r in regions], f, indent=1)
+
+def add_preset(region, path=None):
+    '''Adds region (unless it is there already), returns the presets.'''
+    regions = load_presets(path)
+    if all(r.box != region.box or r.relative != region.relative for r in regions):
+        regions.append(region)
+        save_presets(regions, path)
+    return regions
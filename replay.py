@@ -0,0 +1,216 @@
+'''
+    replay.py
+
+    10/18/2026  Replay ring buffer
+
+    The window is grabbed all the time into a FrameRing: a fixed number
+    of raw frame slots allocated (and touched) once at the start, in
+    memory or in a memory-mapped temp file. A grab (frame.Frame) is
+    copied into its slot straight from the grab buffer, so the steady
+    state is grab + one memcpy, no allocation.
+
+    Slots are RGBX, the 3 color mode PIL can map onto outside memory
+    (image(k) reads a slot without a copy).
+
+    dump() runs in the background on the frames that are in the ring
+    when the hot key is pressed:
+
+        clip : the last N seconds into one recorder container
+        best : the sharpest frame (a page that finished drawing) as
+               one screenshot
+
+    While a dump reads a frame its slot is held; a grab that would
+    overwrite a held slot is skipped (counted in .blocked) instead of
+    blocking the capture or copying the ring. Slots are released
+    oldest first, the ones the capture wants next.
+'''
+import os
+import math
+import time
+import tempfile
+import threading
+
+import lazy
+import recorder
+import instrument
+
+np  = lazy.module('numpy')
+PIL = lazy.module('PIL', 'PIL.Image')
+
+mode_list = ['clip', 'best']
+backing_list = ['memory', 'mmap']
+
+class FrameRing:
+    def __init__(self, size, slots, backing='memory'):
+        if backing not in backing_list:
+            raise ValueError("Unknown ring backing: %s"%backing)
+        width, height = size
+        shape = (slots, height, width, 4)
+        if backing == 'mmap':
+            self._file = tempfile.TemporaryFile(prefix='replay-')
+            self.buf = np.memmap(self._file, dtype=np.uint8, mode='w+', shape=shape)
+        else:
+            self._file = None
+            self.buf = np.empty(shape, dtype=np.uint8)
+        # commit every page now, not on the first lap
+        self.buf.fill(0)
+        self.size = size
+        self.slots = slots
+        self.backing = backing
+        self.views = []
+        for i in range(slots):
+            v = PIL.Image.frombuffer('RGBX', size, self.buf[i], 'raw', 'RGBX', 0, 1)
+            self.views.append(v)
+        self.stamps = np.zeros(slots)
+        self.count = 0          # frames pushed so far; frame k is in slot k%slots
+        self.held = None        # (first, last) frame numbers a dump is reading
+        self.writing = None     # frame number push() is copying in, outside the lock
+        self.blocked = 0
+        self.lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        return self.buf.nbytes
+
+    def push(self, im, t):
+        with self.lock:
+            k = self.count
+            old = k-self.slots
+            if self.held is not None and self.held[0] <= old <= self.held[1]:
+                self.blocked += 1
+                return False
+            self.writing = k
+        with instrument.span('ring copy'):
+            im.copy_to(self.buf[k%self.slots])
+        self.stamps[k%self.slots] = t
+        with self.lock:
+            self.count = k+1
+            self.writing = None
+        return True
+
+    def hold(self, seconds=None):
+        '''Frame numbers [first, last] of the last seconds, held until release().'''
+        with self.lock:
+            last = self.count-1
+            first = max(0, self.count-self.slots)
+            if self.writing is not None:
+                # its slot is half overwritten by the next frame
+                first = max(first, self.writing-self.slots+1)
+            if seconds is not None:
+                while first < last and self.stamps[last%self.slots]-self.stamps[first%self.slots] > seconds:
+                    first += 1
+            if self.held is not None or last < 0:
+                return None
+            self.held = (first, last)
+            return self.held
+
+    def release(self, upto=None):
+        # frames up to and including upto can be overwritten again
+        with self.lock:
+            if upto is None or upto >= self.held[1]:
+                self.held = None
+            else:
+                self.held = (upto+1, self.held[1])
+
+    def image(self, k):
+        return self.views[k%self.slots].convert('RGB')
+
+    def stamp(self, k):
+        return self.stamps[k%self.slots]
+
+    def sharpness(self, k):
+        # mean gradient of a strided green plane: a half drawn or faded
+        # page has less edge energy than the settled one
+        g = self.buf[k%self.slots, ::4, ::4, 1].astype(np.int16)
+        return np.abs(np.diff(g, axis=0)).mean()+np.abs(np.diff(g, axis=1)).mean()
+
+    def close(self):
+        self.views = []
+        self.buf = None
+        if self._file is not None:
+            self._file.close()
+
+class Replay:
+    '''
+        push(im, t) from the capture thread; the ring is allocated on
+        the first frame. dump(path, ...) returns False while an earlier
+        dump is still writing.
+    '''
+    def __init__(self, seconds=10, fps=10, backing='memory', on_ring=None,
+                 on_dumped=None, on_error=None):
+        self.seconds = seconds
+        self.fps = fps
+        self.backing = backing
+        self.on_ring = on_ring
+        self.on_dumped = on_dumped
+        self.on_error = on_error
+        self.ring = None
+        self.dumps = 0
+        self.nbytes = 0
+        self._thread = None
+
+    @property
+    def slots(self):
+        return max(1, int(math.ceil(self.seconds*self.fps)))
+
+    def push(self, im, t):
+        if self.ring is None:
+            self.ring = FrameRing(im.size, self.slots, self.backing)
+            if self.on_ring:
+                self.on_ring(self.ring)
+        return self.ring.push(im, t)
+
+    @property
+    def busy(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def dump(self, path, mode='clip', container='apng', encoder=None):
+        if self.ring is None or self.busy:
+            return False
+        held = self.ring.hold(self.seconds if mode == 'clip' else None)
+        if held is None:
+            return False
+        self._thread = threading.Thread(target=self._dump, daemon=True,
+                                        args=(path, mode, container, encoder, held))
+        self._thread.start()
+        return True
+
+    def _dump(self, path, mode, container, encoder, held):
+        first, last = held
+        ring = self.ring
+        t0 = time.perf_counter()
+        try:
+            if mode == 'best':
+                k = max(range(first, last+1), key=ring.sharpness)
+                im = ring.image(k)
+                ring.release()
+                # encoded before the file is made: a failed encode leaves none
+                data = encoder.encode(im)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                frames = 1
+            else:
+                writer = recorder.writer_class[container](path, ring.size, self.fps, encoder)
+                start = ring.stamp(first)
+                for k in range(first, last+1):
+                    writer.write(ring.image(k), ring.stamp(k)-start)
+                    ring.release(k)
+                writer.close()
+                frames = last-first+1
+        except Exception as e:
+            ring.release()
+            if os.path.exists(path) and mode != 'best':
+                os.remove(path)     # half a clip
+            if self.on_error:
+                self.on_error("%s: %s"%(path, e))
+            return
+        self.dumps += 1
+        self.nbytes += os.path.getsize(path)
+        if self.on_dumped:
+            self.on_dumped(path, frames, (time.perf_counter()-t0)*1000)
+
+    def close(self):
+        if self._thread is not None:
+            self._thread.join()
+        if self.ring is not None:
+            self.ring.close()
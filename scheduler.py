@@ -0,0 +1,202 @@
+'''
+    scheduler.py
+
+    10/18/2026  Drift-free capture scheduler
+
+    Fires timeout() at t0 + k*interval on the monotonic clock, on its
+    own thread, so the period does not stretch by the work done in the
+    slot and the GUI event loop is never blocked by it. When a call
+    overruns its slot the policy decides what happens to the ticks it
+    missed:
+
+        skip     : drop them and wait for the next slot in the future
+        catch-up : fire them back to back until the schedule is met
+
+    Once a second on_stats(stats) gets the achieved rate, the jitter
+    (standard deviation of tick lateness) and the overrun/skip counts.
+
+    SingleShot is the Qt-free single shot timer the settle loop re-arms
+    after every capture.
+'''
+import sys
+import time
+import threading
+from collections import deque
+
+policy_list = ['skip', 'catch-up']
+
+# the last bit of every wait is spun: OS sleeps overshoot by up to a
+# timer quantum (15.6 ms on Windows unless timeBeginPeriod is raised)
+spin_seconds = 0.002
+
+class SchedulerStats:
+    def __init__(self, rate, target, jitter_ms, late_ms, overruns, skipped, ticks):
+        self.rate = rate
+        self.target = target
+        self.jitter_ms = jitter_ms
+        self.late_ms = late_ms
+        self.overruns = overruns
+        self.skipped = skipped
+        self.ticks = ticks
+
+    def __str__(self):
+        return "%.1f/%.1f fps, jitter %.1f ms, late %.1f ms, overruns %d, skipped %d"%(
+               self.rate, self.target, self.jitter_ms, self.late_ms,
+               self.overruns, self.skipped)
+
+class Scheduler:
+    '''Same start(interval_ms)/stop() shape as the QTimer it replaces.'''
+    def __init__(self, timeout, policy='skip', on_stats=None, stats_window=2.0):
+        if policy not in policy_list:
+            raise ValueError("Unknown scheduler policy: %s"%policy)
+        self.timeout = timeout
+        self.policy = policy
+        self.on_stats = on_stats
+        self.stats_window = stats_window
+        self.interval = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self._recent = deque()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, interval):
+        self.interval = interval
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join()
+        self._thread = None
+
+    def isActive(self):
+        return self._thread is not None and not self._stop.is_set()
+
+    def _sleep_until(self, target):
+        while True:
+            left = target-time.monotonic()
+            if left <= 0 or self._stop.is_set():
+                return
+            if left > spin_seconds:
+                self._stop.wait(left-spin_seconds)
+            else:
+                time.sleep(0)
+
+    def _run(self):
+        period = self.interval/1000.0
+        timer_period(1)
+        try:
+            t0 = time.monotonic()
+            k = 1
+            last_stats = t0
+            while not self._stop.is_set():
+                target = t0+k*period
+                self._sleep_until(target)
+                if self._stop.is_set():
+                    break
+
+                fired = time.monotonic()
+                self.timeout()
+                done = time.monotonic()
+                self.ticks += 1
+                self._recent.append((fired, fired-target))
+                k += 1
+
+                if done > t0+k*period:
+                    self.overruns += 1
+                    if self.policy == 'skip':
+                        missed = int((done-t0)/period)+1-k
+                        self.skipped += missed
+                        k += missed
+
+                if done-last_stats >= 1.0:
+                    last_stats = done
+                    self.publish(done)
+        finally:
+            timer_period(0)
+            if self.ticks:
+                self.publish()
+
+    def stats(self, now=None):
+        now = time.monotonic() if now is None else now
+        while self._recent and now-self._recent[0][0] > self.stats_window:
+            self._recent.popleft()
+        late = [l*1000 for t, l in self._recent]
+        target = 1000.0/self.interval if self.interval else 0.0
+        if len(late) < 2:
+            return SchedulerStats(0.0, target, 0.0, 0.0, self.overruns, self.skipped, self.ticks)
+        span = self._recent[-1][0]-self._recent[0][0]
+        mean = sum(late)/len(late)
+        jitter = (sum((l-mean)**2 for l in late)/len(late))**0.5
+        rate = (len(late)-1)/span if span > 0 else 0.0
+        return SchedulerStats(rate, target, jitter, mean, self.overruns, self.skipped, self.ticks)
+
+    def publish(self, now=None):
+        if self.on_stats:
+            self.on_stats(self.stats(now))
+
+class SingleShot:
+    '''QTimer.setSingleShot(True) stand-in: start(ms) calls timeout once.'''
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._due = None
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def start(self, interval):
+        with self._cond:
+            # a stop() from another thread wins over the re-arm done by
+            # the timeout that was running when it came
+            if self._stopped and self._thread is threading.current_thread():
+                return
+            self._due = time.monotonic()+interval/1000.0
+            self._stopped = False
+            self._cond.notify_all()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._due = None
+            self._cond.notify_all()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join()
+        self._thread = None
+
+    def isActive(self):
+        return not self._stopped and self._due is not None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and (self._due is None or self._due > time.monotonic()):
+                    self._cond.wait(None if self._due is None else self._due-time.monotonic())
+                if self._stopped:
+                    return
+                self._due = None
+            self.timeout()
+
+def timer_period(ms):
+    '''1 ms OS timer resolution while a schedule runs (Windows only).'''
+    if sys.platform != 'win32':
+        return
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if ms:
+            winmm.timeBeginPeriod(ms)
+            timer_period.active = ms
+        elif getattr(timer_period, 'active', 0):
+            winmm.timeEndPeriod(timer_period.active)
+            timer_period.active = 0
+    except Exception:
+        pass
@@ -0,0 +1,71 @@
+'''
+    settle.py
+
+    10/18/2026  Adaptive settle detection
+
+    After a page key or a click, poll a small gray thumbnail of the
+    target region until the content has changed from the frame just
+    captured and then stayed the same for N polls. This replaces the
+    fixed time.sleep(0.4): fast viewers are captured as soon as they
+    are done, slow ones get as long as they need (up to the timeout).
+'''
+import time
+
+import grab
+import dedupe
+
+sample_size = 32
+
+def region_sampler(rect, size=sample_size):
+    left, top, right, bottom = rect
+    def sample():
+        return dedupe.thumbnail(grab.grab_region(left, top, right, bottom), size, size)
+    return sample
+
+def reference_sample(im, size=sample_size):
+    return dedupe.thumbnail(im, size, size)
+
+class SettleDetector:
+    def __init__(self, polls=2, timeout=2.0, poll_interval=0.03, threshold=0.002):
+        self.polls = polls
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.threshold = threshold
+        self.times = []
+
+    def wait(self, sampler, reference):
+        '''
+            Block until the region settles. Returns (settled, seconds).
+            settled is False on timeout, whether or not it changed.
+        '''
+        t0 = time.monotonic()
+        changed = False
+        previous = reference
+        stable = 0
+        settled = False
+
+        while time.monotonic()-t0 < self.timeout:
+            time.sleep(self.poll_interval)
+            current = sampler()
+            moved = dedupe.mean_abs_diff(current, previous) > self.threshold
+            if not changed:
+                if moved:
+                    changed = True
+                    previous = current
+                continue
+            if moved:
+                stable = 0
+                previous = current
+                continue
+            stable += 1
+            if stable >= self.polls:
+                settled = True
+                break
+
+        seconds = time.monotonic()-t0
+        self.times.append(seconds)
+        return settled, seconds
+
+    @property
+    def mean(self):
+        return sum(self.times)/len(self.times) if self.times else 0.0
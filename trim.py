@@ -0,0 +1,156 @@
+'''
+    trim.py
+
+    10/18/2026  Auto-trim of window chrome
+
+    The grabbed window rectangle includes the title bar, toolbars,
+    scrollbars and the viewer background around the page. content_box()
+    finds the page inside it from a few frames, all numpy:
+
+      - chrome ends at a long straight edge: a row (column) where the
+        brightness steps across most of the width (height) in every
+        sample, searched in the outer quarter (sixth) of each side
+      - what changes from one sample to the next is content, so the
+        edge has to lie outside it
+      - flat bands left after that (the gray background around a
+        page) are trimmed while a row or column has no detail, but
+        not into what moved
+
+    AutoTrim learns the box on the first frames of a window size and
+    from then on the grab itself is cut to the box (grab.grab_window),
+    so the pixels never get grabbed, compared or encoded. A later
+    sample can only widen the box; a resize starts over. The frames it
+    learns from are held back and saved cut to the final box, so the
+    first pages of a session are the size of the rest.
+'''
+import lazy
+import frame
+
+np = lazy.module('numpy')
+
+def gray(im):
+    return np.asarray(im.convert('L'), dtype=np.int16)
+
+def _edge(score, lo, hi, line, last):
+    # the last (or first) index in [lo, hi) whose score reaches line
+    idx = np.nonzero(score[lo:hi] >= line)[0]
+    if not len(idx):
+        return None
+    return lo+int(idx[-1] if last else idx[0])
+
+def content_box(samples, line=0.8, step=24, flat=2.0, side=(0.25, 1.0/6), min_size=32):
+    '''
+        (left, top, right, bottom) of the content in samples, a list of
+        same size gray arrays (gray()).
+    '''
+    stack = np.stack(samples)
+    n, h, w = stack.shape
+    # fraction of the width/height with a brightness step, in every sample
+    rows = (np.abs(np.diff(stack, axis=1)) > step).mean(axis=2).min(axis=0)
+    cols = (np.abs(np.diff(stack, axis=2)) > step).mean(axis=1).min(axis=0)
+
+    # content that moved between samples bounds the search
+    mtop, mbottom, mleft, mright = h, 0, w, 0
+    if n > 1:
+        moving = (np.abs(np.diff(stack, axis=0)) > step).any(axis=0)
+        ys = np.nonzero(moving.any(axis=1))[0]
+        xs = np.nonzero(moving.any(axis=0))[0]
+        if len(ys):
+            mtop, mbottom, mleft, mright = ys[0], ys[-1]+1, xs[0], xs[-1]+1
+
+    dy, dx = int(h*side[0]), int(w*side[1])
+    # diff index i is the step between i and i+1
+    e = _edge(rows, 0, min(dy, mtop), line, True)
+    top = 0 if e is None else e+1
+    e = _edge(rows, max(h-dy, mbottom), h-1, line, False)
+    bottom = h if e is None else e+1
+    e = _edge(cols, 0, min(dx, mleft), line, True)
+    left = 0 if e is None else e+1
+    e = _edge(cols, max(w-dx, mright), w-1, line, False)
+    right = w if e is None else e+1
+
+    # flat bands: no detail along the row/column in any sample
+    if bottom-top > 2 and right-left > 2:
+        region = stack[:, top:bottom, left:right]
+        busy_rows = np.nonzero(region.std(axis=2).max(axis=0) > flat)[0]
+        busy_cols = np.nonzero(region.std(axis=1).max(axis=0) > flat)[0]
+        if len(busy_rows) and len(busy_cols):
+            top, bottom = top+int(busy_rows[0]), top+int(busy_rows[-1])+1
+            left, right = left+int(busy_cols[0]), left+int(busy_cols[-1])+1
+        # a flat page margin may hold text on a later page: never cut
+        # into what moved
+        top, bottom = min(top, mtop), max(bottom, mbottom)
+        left, right = min(left, mleft), max(right, mright)
+
+    if right-left < min(min_size, w) or bottom-top < min(min_size, h):
+        return (0, 0, w, h)
+    return (left, top, right, bottom)
+
+def union_box(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+class AutoTrim:
+    '''
+        box_for(size) is the cached box (relative to the window) or None
+        while it is still learning; learn(im) takes one full window
+        frame.Frame and returns a view of it cut to the box so far.
+        With hold, learn() keeps a copy of each frame before the last
+        one and release() hands them back cut to the learnt box.
+    '''
+    def __init__(self, frames=3, on_box=None, hold=True, **options):
+        self.frames = max(1, frames)
+        self.on_box = on_box        # (box, window size) once it is learnt
+        self.hold = hold
+        self.options = options
+        self.size = None
+        self.samples = []
+        self.box = None
+        self.learnt = False
+        self.boxes = 0
+        self.held = []              # full frames taken while learning
+        self.ready = []             # held frames cut to the box
+
+    def box_for(self, size):
+        if size != self.size:
+            # resized while learning: the held frames get the box so far
+            self.flush()
+            self.size = size
+            self.samples = []
+            self.box = None
+            self.learnt = False
+        return self.box if self.learnt else None
+
+    def learn(self, im):
+        self.samples.append(gray(im.image()))
+        box = content_box(self.samples, **self.options)
+        self.box = box if self.box is None else union_box(self.box, box)
+        if len(self.samples) >= self.frames:
+            self.learnt = True
+            self.samples = []
+            self.boxes += 1
+            self.flush()
+            if self.on_box:
+                self.on_box(self.box, self.size)
+        elif self.hold:
+            # the backend reuses its buffer for the next grab
+            self.held.append(frame.Frame(im.pixels.copy(), im.mode, im.rect, im.t, im.seq))
+            frame.stats.add(im.nbytes)
+        return im.crop(self.box), self.box
+
+    def flush(self):
+        '''Cuts the held frames to the box so far (learnt, resized, stopped).'''
+        self.ready.extend(f.crop(self.box) for f in self.held)
+        self.held = []
+
+    def release(self):
+        '''The held frames cut to their box, oldest first; each only once.'''
+        ready, self.ready = self.ready, []
+        return ready
+
+    @property
+    def saved(self):
+        '''Fraction of the window pixels the box leaves out.'''
+        if self.box is None or not self.size:
+            return 0.0
+        l, t, r, b = self.box
+        return 1.0 - (r-l)*(b-t)/float(self.size[0]*self.size[1])
@@ -0,0 +1,122 @@
+'''
+    wintrack.py
+
+    10/18/2026  Window tracker with cached geometry
+
+    WindowTracker resolves the target window by title once and keeps
+    its handle. Each frame costs one rectangle query (win.box) instead
+    of a getWindowsWithTitle() enumeration, an activate() and two more
+    rectangle reads. The handle is looked up again only when it goes
+    stale (the window was closed or recreated), and activate() is
+    skipped while the window is already in the foreground.
+
+    Target is one window of a multi-window session: its tracker plus
+    its own file prefix and counter.
+
+    TitleWatcher enumerates window titles on a background thread and
+    reports only what was added or removed, so the GUI never blocks on
+    a window manager walk.
+'''
+import threading
+
+import lazy
+import instrument
+
+pygetwindow = lazy.module('pygetwindow')
+
+class WindowTracker:
+    def __init__(self, title):
+        self.title = title
+        self.win = None
+        self.rect = None
+        self.generation = 0   # bumped whenever rect moves or resizes
+        self.lookups = 0
+        self.activations = 0
+
+    def resolve(self):
+        with instrument.span('lookup'):
+            wins = pygetwindow.getWindowsWithTitle(self.title)
+        self.lookups += 1
+        if not wins:
+            raise LookupError("Window not found: %s"%self.title)
+        self.win = wins[0]
+
+    def invalidate(self):
+        self.win = None
+        self.rect = None
+
+    def _box(self):
+        if self.win is None:
+            self.resolve()
+        try:
+            return self.win.box
+        except Exception:
+            # stale handle: the window is gone or was recreated
+            self.invalidate()
+            self.resolve()
+            return self.win.box
+
+    def geometry(self):
+        '''(left, top, right, bottom), one rectangle query per call'''
+        with instrument.span('geometry'):
+            box = self._box()
+        rect = (box.left, box.top, box.left+box.width, box.top+box.height)
+        if rect != self.rect:
+            self.rect = rect
+            self.generation += 1
+        return rect
+
+    def activate(self):
+        if self.win is None:
+            self.resolve()
+        with instrument.span('activate'):
+            if not self.win.isActive:
+                self.win.activate()
+                self.activations += 1
+
+class Target:
+    def __init__(self, title, prefix, number=0):
+        self.tracker = WindowTracker(title)
+        self.prefix = prefix
+        self.number = number
+
+    @property
+    def title(self):
+        return self.tracker.title
+
+class TitleWatcher:
+    '''
+        Re-reads the window titles every interval seconds (or on
+        refresh()) and calls on_change(added, removed) when they differ.
+    '''
+    def __init__(self, on_change, interval=2.0):
+        self.on_change = on_change
+        self.interval = interval
+        self.titles = set()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def refresh(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopped:
+            try:
+                titles = set(t for t in pygetwindow.getAllTitles() if t != '')
+            except Exception:
+                titles = self.titles
+            added = titles-self.titles
+            removed = self.titles-titles
+            self.titles = titles
+            if added or removed:
+                self.on_change(sorted(added), sorted(removed))
+            self._wake.wait(self.interval)
+            self._wake.clear()